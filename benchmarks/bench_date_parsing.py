@@ -0,0 +1,45 @@
+"""
+Benchmark date parsing while calculating build metrics.
+
+Compares parsing evergreen timestamps with dateutil and with `parse_evergreen_datetime`, and
+reports the CPU time of `BuildMetrics.calculate` for a build with many tasks.
+
+Usage: python benchmarks/bench_date_parsing.py [number of tasks]
+"""
+
+import json
+import sys
+
+from common import canned_api, cpu_time, load_sample, scaled_page
+from dateutil.parser import parse
+
+from evergreen.build import Build
+from evergreen.metrics.buildmetrics import BuildMetrics
+from evergreen.util import parse_evergreen_datetime
+
+DATE_FIELDS = ["create_time", "scheduled_time", "start_time", "finish_time", "ingest_time"]
+
+
+def main() -> None:
+    """Run the benchmark."""
+    n_tasks = int(sys.argv[1]) if len(sys.argv) > 1 else 5_000
+    tasks = scaled_page("task.json", n_tasks, "task_id")
+    dates = [task[field] for task in tasks for field in DATE_FIELDS if task.get(field)]
+
+    dateutil_time, _ = cpu_time(lambda: [parse(date) for date in dates])
+    fast_path_time, _ = cpu_time(lambda: [parse_evergreen_datetime(date) for date in dates])
+
+    api = canned_api(json.dumps(tasks).encode())
+    build = Build(load_sample("build.json"), api)
+    metrics_time, metrics = cpu_time(lambda: BuildMetrics(build).calculate())
+
+    print(f"timestamps:               {len(dates)} ({n_tasks} tasks)")
+    print(f"dateutil parse:           {dateutil_time * 1000:.1f} ms CPU")
+    print(f"parse_evergreen_datetime: {fast_path_time * 1000:.1f} ms CPU")
+    print(
+        f"BuildMetrics.calculate:   {metrics_time * 1000:.1f} ms CPU ({metrics.total_tasks} tasks)"
+    )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,58 @@
+"""
+Benchmark the available json codecs on scaled up sample responses.
+
+For each codec, measures the CPU time to decode a large page of each sample document through
+`EvergreenApi` and to encode it again the way `evg-api --json` does.
+
+Usage: python benchmarks/bench_json_codecs.py [number of documents per page]
+"""
+
+import json
+import sys
+
+from common import canned_api, cpu_time, scaled_page
+
+from evergreen.json_codec import JSON_CODEC_NAMES, STDLIB_CODEC, get_json_codec
+
+PAGES = [
+    ("task.json", "task_id"),
+    ("test.json", "test_file"),
+    ("build.json", "_id"),
+    ("version.json", "version_id"),
+]
+
+
+def main() -> None:
+    """Run the benchmark."""
+    n_docs = int(sys.argv[1]) if len(sys.argv) > 1 else 2_000
+    codecs = []
+    for name in JSON_CODEC_NAMES:
+        try:
+            codecs.append(get_json_codec(name))
+        except ImportError:
+            print(f"{name}: not installed, skipping")
+    codecs = list({codec.name: codec for codec in codecs}.values())
+
+    print(f"{'document':<14}{'size':>10}  {'codec':<8}{'decode':>12}{'encode':>12}")
+    for filename, id_field in PAGES:
+        page = scaled_page(filename, n_docs, id_field)
+        body = json.dumps(page).encode()
+        baseline = None
+        for codec in codecs:
+            api = canned_api(body, json_codec=codec)
+            url = api._create_url("/bench")
+            decode, _ = cpu_time(lambda api=api, url=url: api._decode_json(api._call_api(url)))
+            encode, _ = cpu_time(lambda codec=codec, page=page: codec.dumps(page, indent=4))
+            if codec.name == STDLIB_CODEC:
+                baseline = decode
+            speedup = (
+                f" ({baseline / decode:.1f}x)" if baseline and codec.name != STDLIB_CODEC else ""
+            )
+            print(
+                f"{filename:<14}{len(body) / 2**20:>6.1f} MiB  {codec.name:<8}"
+                f"{decode * 1000:>9.1f} ms{encode * 1000:>9.1f} ms{speedup}"
+            )
+
+
+if __name__ == "__main__":
+    main()
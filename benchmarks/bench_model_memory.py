@@ -0,0 +1,66 @@
+"""
+Benchmark the memory held by full and compact model objects.
+
+Decodes a page of scaled up sample documents for each model, creates the model objects and
+reports the memory still allocated once the decoded page is released.
+
+Usage: python benchmarks/bench_model_memory.py [number of objects]
+"""
+
+import gc
+import json
+import sys
+import tracemalloc
+
+from common import scaled_page
+
+from evergreen.base import compact_class
+from evergreen.build import Build
+from evergreen.stats import TaskStats, TestStats
+from evergreen.task import Task
+from evergreen.tst import Tst
+
+# Sample builds embed the ids of all their tasks, so fewer of them are created.
+MODELS = [
+    (Task, "task.json", "task_id", 1),
+    (Build, "build.json", "_id", 50),
+    (Tst, "test.json", "test_file", 1),
+    (TestStats, "test_stats.json", "test_file", 1),
+    (TaskStats, "task_stats.json", "task_name", 1),
+]
+
+
+def retained_memory(model_cls: type, body: str) -> int:
+    """Return the bytes held by the objects created from a page of json."""
+    gc.collect()
+    tracemalloc.start()
+    page = json.loads(body)
+    objects = [model_cls(item, None) for item in page]
+    for obj in objects:
+        # Touch a field so lazily built state is included.
+        getattr(obj, "status", None)
+    del page
+    gc.collect()
+    retained, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    del objects
+    return retained
+
+
+def main() -> None:
+    """Run the benchmark."""
+    n_objects = int(sys.argv[1]) if len(sys.argv) > 1 else 20_000
+    print(f"{'model':<10}{'objects':>9}{'full':>12}{'compact':>12}{'saved':>8}")
+    for model_cls, filename, id_field, divisor in MODELS:
+        count = n_objects // divisor
+        body = json.dumps(scaled_page(filename, count, id_field))
+        full = retained_memory(model_cls, body)
+        compact = retained_memory(compact_class(model_cls), body)
+        print(
+            f"{model_cls.__name__:<10}{count:>9}{full / 2**20:>8.1f} MiB"
+            f"{compact / 2**20:>8.1f} MiB{1 - compact / full:>8.0%}"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,45 @@
+"""
+Benchmark JSON decoding of a large tests_by_task page.
+
+Counts how many times each response body is decoded and compares the CPU time of
+`tests_by_task` with the time needed to decode the page exactly once.
+
+Usage: python benchmarks/bench_response_decoding.py [number of tests]
+"""
+
+import json
+import sys
+from unittest.mock import patch
+
+import requests
+from common import canned_api, cpu_time, scaled_page
+
+
+def main() -> None:
+    """Run the benchmark."""
+    n_tests = int(sys.argv[1]) if len(sys.argv) > 1 else 50_000
+    body = json.dumps(scaled_page("test.json", n_tests, "test_file")).encode()
+    api = canned_api(body)
+
+    decode_calls = []
+    original_loads = requests.models.complexjson.loads
+
+    def counting_loads(*args, **kwargs):
+        decode_calls.append(1)
+        return original_loads(*args, **kwargs)
+
+    with patch.object(requests.models.complexjson, "loads", counting_loads):
+        api.tests_by_task("task_id")
+    decodes_per_page = len(decode_calls)
+
+    single_decode, _ = cpu_time(lambda: json.loads(body.decode("utf-8")))
+    tests_by_task, tests = cpu_time(lambda: api.tests_by_task("task_id"))
+
+    print(f"page size:              {len(body) / 2**20:.1f} MiB ({len(tests)} tests)")
+    print(f"json decodes per page:  {decodes_per_page}")
+    print(f"single json.loads:      {single_decode * 1000:.1f} ms CPU")
+    print(f"tests_by_task:          {tests_by_task * 1000:.1f} ms CPU")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,101 @@
+"""
+Benchmark the peak memory of lazily paginating a huge page of test results.
+
+Writes a single page of scaled up sample tests to a file and serves it as the response body of
+every request. Each mode consumes the page in a fresh process, creating a `Tst` object for each
+result and dropping it, and reports the peak RSS of the process. The page is decoded at once
+by default and incrementally when `stream_json_pages` is enabled.
+
+Usage: python benchmarks/bench_streamed_pages.py [number of tests]
+"""
+
+import json
+import os
+import resource
+import subprocess
+import sys
+import tempfile
+import time
+from typing import Any
+
+import requests
+from common import scaled_page
+from requests.adapters import BaseAdapter
+
+from evergreen.api import EvergreenApi
+from evergreen.tst import Tst
+
+
+class FileAdapter(BaseAdapter):
+    """Transport adapter that answers every request with the contents of a file."""
+
+    def __init__(self, path: str) -> None:
+        """Create an adapter answering with the given file."""
+        super().__init__()
+        self.path = path
+
+    def send(
+        self, request: requests.PreparedRequest, stream: bool = False, **kwargs: Any
+    ) -> requests.Response:
+        """Build a response reading the file."""
+        response = requests.Response()
+        response.status_code = 200
+        response.headers["Content-Type"] = "application/json"
+        response.raw = open(self.path, "rb")
+        response.encoding = "utf-8"
+        response.request = request
+        response.url = request.url or ""
+        if not stream:
+            _ = response.content
+        return response
+
+    def close(self) -> None:
+        """Nothing to clean up."""
+
+
+def run_child(path: str, stream: bool) -> None:
+    """Consume the page in this process and print the results as json."""
+    api = EvergreenApi(use_default_logger_factory=False, stream_json_pages=stream)
+    api.session.mount("https://", FileAdapter(path))
+    url = api._create_url("/tasks/task_id/tests")
+
+    start = time.perf_counter()
+    count = 0
+    for test in api._lazy_paginate(url):
+        Tst(test, api)
+        count += 1
+    elapsed = time.perf_counter() - start
+    # ru_maxrss is in kilobytes on Linux.
+    peak_rss = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss * 1024
+    print(json.dumps({"count": count, "seconds": elapsed, "peak_rss": peak_rss}))
+
+
+def main() -> None:
+    """Run the benchmark."""
+    if len(sys.argv) > 1 and sys.argv[1] == "--child":
+        run_child(sys.argv[2], sys.argv[3] == "stream")
+        return
+
+    n_tests = int(sys.argv[1]) if len(sys.argv) > 1 else 100_000
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        path = os.path.join(tmp_dir, "page.json")
+        with open(path, "w") as page_file:
+            json.dump(scaled_page("test.json", n_tests, "test_file"), page_file)
+        size = os.path.getsize(path)
+
+        print(f"page: {n_tests} tests, {size / 2**20:.1f} MiB")
+        print(f"{'mode':<10}{'peak rss':>14}{'time':>10}")
+        for mode in ("buffered", "stream"):
+            output = subprocess.run(
+                [sys.executable, __file__, "--child", path, mode],
+                check=True,
+                capture_output=True,
+                text=True,
+            ).stdout
+            result = json.loads(output)
+            assert result["count"] == n_tests
+            print(f"{mode:<10}{result['peak_rss'] / 2**20:>10.1f} MiB{result['seconds']:>8.2f} s")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,79 @@
+"""Shared helpers for the evergreen.py benchmarks."""
+
+import json
+import logging
+import os
+import time
+from typing import Any, Callable, Dict, List, Tuple
+
+import requests
+import structlog
+from requests.adapters import BaseAdapter
+
+from evergreen.api import EvergreenApi
+
+SAMPLE_DATA_PATH = os.path.join(
+    os.path.dirname(os.path.abspath(__file__)), "..", "tests", "evergreen", "data"
+)
+
+
+structlog.configure(wrapper_class=structlog.make_filtering_bound_logger(logging.INFO))
+
+
+def load_sample(filename: str) -> Any:
+    """Load a sample json document from the test data directory."""
+    with open(os.path.join(SAMPLE_DATA_PATH, filename)) as file_data:
+        return json.load(file_data)
+
+
+def scaled_page(filename: str, count: int, id_field: str) -> List[Dict[str, Any]]:
+    """Create a page of `count` copies of a sample document, each with a unique id."""
+    sample = load_sample(filename)
+    page = []
+    for i in range(count):
+        item = dict(sample)
+        item[id_field] = f"{sample[id_field]}_{i}"
+        page.append(item)
+    return page
+
+
+class CannedAdapter(BaseAdapter):
+    """Transport adapter that answers every request with the same body."""
+
+    def __init__(self, body: bytes, content_type: str = "application/json") -> None:
+        """Create an adapter answering with the given body."""
+        super().__init__()
+        self.body = body
+        self.content_type = content_type
+
+    def send(self, request: requests.PreparedRequest, **kwargs: Any) -> requests.Response:
+        """Build a response with the canned body."""
+        response = requests.Response()
+        response.status_code = 200
+        response.headers["Content-Type"] = self.content_type
+        response._content = self.body
+        response.encoding = "utf-8"
+        response.request = request
+        response.url = request.url or ""
+        return response
+
+    def close(self) -> None:
+        """Nothing to clean up."""
+
+
+def canned_api(body: bytes, **kwargs: Any) -> EvergreenApi:
+    """Create an API client whose requests are all answered with `body`."""
+    api = EvergreenApi(use_default_logger_factory=False, **kwargs)
+    api.session.mount("https://", CannedAdapter(body))
+    return api
+
+
+def cpu_time(fn: Callable[[], Any], repeat: int = 5) -> Tuple[float, Any]:
+    """Return the best CPU time of `repeat` runs of `fn` and the result of the last run."""
+    best = float("inf")
+    result = None
+    for _ in range(repeat):
+        start = time.process_time()
+        result = fn()
+        best = min(best, time.process_time() - start)
+    return best, result
@@ -1,7 +1,13 @@
 """Evergreen API Module."""
 
 # Shortcuts for importing.
-from evergreen.api import CachedEvergreenApi, EvergreenApi, Requester, RetryingEvergreenApi
+from evergreen.api import (
+    AsyncEvergreenApi,
+    CachedEvergreenApi,
+    EvergreenApi,
+    Requester,
+    RetryingEvergreenApi,
+)
 from evergreen.api_requests import IssueLinkRequest
 from evergreen.build import Build
 from evergreen.commitqueue import CommitQueue
@@ -3,26 +3,51 @@
 from __future__ import absolute_import
 
 import json
+import logging
 import re
 import shlex
 import subprocess
-from contextlib import contextmanager
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import ExitStack, contextmanager
 from datetime import datetime
-from functools import lru_cache
 from http import HTTPStatus
 from json.decoder import JSONDecodeError
 from time import time
-from typing import Any, Callable, Dict, Generator, Iterable, Iterator, List, Optional, Union, cast
-from urllib.parse import urlparse
+from typing import (
+    Any,
+    AsyncIterator,
+    Callable,
+    Collection,
+    Dict,
+    Generator,
+    Iterable,
+    Iterator,
+    List,
+    NamedTuple,
+    Optional,
+    Tuple,
+    Type,
+    TypeVar,
+    Union,
+    cast,
+)
+from urllib.parse import parse_qsl, urlencode, urlparse, urlsplit, urlunsplit
 
 import requests
 import structlog
 import urllib3
+from dateutil import tz
 from packaging.version import Version as PackagingVersion
 from requests.exceptions import HTTPError
 from structlog.stdlib import LoggerFactory
 from urllib3.util import Retry
 
+try:
+    import httpx
+except ImportError:  # pragma: no cover
+    httpx = None  # type: ignore[assignment]
+
 from evergreen.alias import VariantAlias
 from evergreen.api_requests import (
     IssueLinkRequest,
@@ -30,11 +55,14 @@ from evergreen.api_requests import (
     ProjectAliasDefinition,
     SlackAttachment,
 )
+from evergreen.base import EvgObjectType, compact_class
 from evergreen.build import Build
+from evergreen.cache import DEFAULT_CACHE_MAX_ENTRIES, CacheStats, CacheTtl, TtlCache
 from evergreen.commitqueue import CommitQueue
 from evergreen.config import (
     DEFAULT_API_SERVER,
     DEFAULT_API_SERVER_OIDC,
+    DEFAULT_MAX_WORKERS,
     DEFAULT_NETWORK_TIMEOUT_SEC,
     EvgAuth,
     OidcConfig,
@@ -44,12 +72,36 @@ from evergreen.config import (
     read_evergreen_from_file,
 )
 from evergreen.distro import Distro
+from evergreen.download import (
+    DEFAULT_DOWNLOAD_CHUNK_SIZE,
+    DEFAULT_PARALLEL_RANGES,
+    ArtifactDownload,
+    ArtifactDownloadSummary,
+    RangedDownload,
+    StreamTarget,
+    download_task_artifacts,
+    stream_into,
+)
 from evergreen.host import Host
+from evergreen.http_cache import CachingHTTPAdapter, HttpCache
+from evergreen.json_codec import DEFAULT_STREAM_CHUNK_SIZE, JsonCodec, iter_json_array
+from evergreen.log_follow import (
+    DEFAULT_MAX_POLL_INTERVAL_SEC,
+    DEFAULT_MIN_POLL_INTERVAL_SEC,
+    LogFollower,
+)
+from evergreen.log_grep import (
+    DEFAULT_GREP_LOG_NAME,
+    TaskLogMatches,
+    compile_patterns,
+    search_task_logs,
+)
 from evergreen.manifest import Manifest
 from evergreen.oidc import OidcTokenManager
 from evergreen.patch import Patch, PatchCreationDetails
 from evergreen.performance_results import PerformanceData
 from evergreen.project import Project
+from evergreen.rate_limit import RateLimiter, RequestPermit
 from evergreen.resource_type_permissions import (
     PermissionableResourceType,
     RemovablePermission,
@@ -61,14 +113,29 @@ from evergreen.task_annotations import TaskAnnotation
 from evergreen.task_reliability import TaskReliability
 from evergreen.tst import Tst
 from evergreen.users_for_role import UsersForRole
-from evergreen.util import evergreen_input_to_output, format_evergreen_date, iterate_by_time_window
+from evergreen.util import (
+    SingleFlight,
+    evergreen_input_to_output,
+    format_evergreen_date,
+    format_evergreen_datetime,
+    iterate_by_time_window,
+    prefetch,
+)
 from evergreen.version import RecentVersions, Requester, Version
 
 LOGGER = structlog.getLogger(__name__)
 
-CACHE_SIZE = 5000
+CachedType = TypeVar("CachedType")
+
+CACHE_SIZE = DEFAULT_CACHE_MAX_ENTRIES
+DEFAULT_CACHE_TTL = CacheTtl(completed=None, active=30.0)
 DEFAULT_LIMIT = 100
 
+DEFAULT_POOL_CONNECTIONS = 10
+DEFAULT_POOL_MAXSIZE = 10
+
+DEFAULT_SLOW_REQUEST_THRESHOLD_SEC = 10.0
+
 DEFAULT_HTTP_RETRY_ATTEMPTS = 10
 DEFAULT_HTTP_RETRY_BACKOFF_FACTOR = 0.1
 DEFAULT_HTTP_RETRY_BACKOFF_MAX_SEC = 120
@@ -91,6 +158,195 @@ EVERGREEN_PATCH_ID_REGEX = re.compile(r"(?<=ID : )\w{24}")
 INCLUDE_REPO_QUERY = "?includeRepo=true"
 
 
+class RequestTiming(NamedTuple):
+    """Timing record of a single request to the API."""
+
+    method: str
+    url: str
+    status_code: int
+    duration_sec: float
+    response_size: Optional[int]
+
+
+def _is_log_enabled(level: int) -> bool:
+    """
+    Determine if messages of the given level would be emitted by the module logger.
+
+    :param level: Logging level to check.
+    :return: True if messages at the given level are emitted.
+    """
+    logger = LOGGER.bind()
+    is_enabled_for = getattr(logger, "is_enabled_for", None)
+    if is_enabled_for is not None and not is_enabled_for(level):
+        return False
+    # Filtering structlog loggers wrapping the standard library only know about the structlog
+    # level, the standard library logger decides what is actually emitted.
+    wrapped_logger = getattr(logger, "_logger", None)
+    if isinstance(wrapped_logger, logging.Logger):
+        return wrapped_logger.isEnabledFor(level)
+    if hasattr(logger, "isEnabledFor"):
+        return logger.isEnabledFor(level)
+    return True
+
+
+class ConnectionPoolStats(NamedTuple):
+    """Usage statistics of a single host connection pool."""
+
+    scheme: str
+    host: str
+    port: Optional[int]
+    maxsize: int
+    num_connections: int
+    num_requests: int
+    idle_connections: int
+
+
+class PaginationStats(NamedTuple):
+    """Number of pages and results fetched by paginated queries."""
+
+    pages: int
+    results: int
+
+
+def _page_length(page: Any) -> int:
+    """
+    Get the number of results in a decoded page.
+
+    :param page: Decoded page of results.
+    :return: Number of results in the page, 0 if it is not a list of results.
+    """
+    return len(page) if isinstance(page, list) else 0
+
+
+def _limit_page(url: str, params: Optional[Dict], limit: int) -> Tuple[str, Optional[Dict]]:
+    """
+    Set the number of results a page request asks for.
+
+    The limit is set in the query of the url if it is already there or if there are no params,
+    as the 'next' links of responses carry the limit of the previous request.
+
+    :param url: URL of the page.
+    :param params: Params to pass to url.
+    :param limit: Number of results to ask for.
+    :return: The url and params of the request.
+    """
+    parts = urlsplit(url)
+    query = parse_qsl(parts.query, keep_blank_values=True)
+    if params is None or any(name == "limit" for name, _ in query):
+        query = [(name, value) for name, value in query if name != "limit"]
+        query.append(("limit", str(limit)))
+        url = urlunsplit(parts._replace(query=urlencode(query)))
+    if params is not None:
+        params = dict(params, limit=limit)
+    return url, params
+
+
+def _close_with(response: requests.Response, on_close: Callable[[], None]) -> None:
+    """
+    Call a function when a response is closed, after its connection is released.
+
+    :param response: Response to watch.
+    :param on_close: Function to call when the response is closed.
+    """
+    close = response.close
+
+    def _close() -> None:
+        try:
+            close()
+        finally:
+            on_close()
+
+    response.close = _close  # type: ignore[method-assign]
+
+
+def _stats_params(
+    after_date: datetime,
+    before_date: datetime,
+    group_num_days: Optional[int] = None,
+    requesters: Optional[Requester] = None,
+    tasks: Optional[List[str]] = None,
+    variants: Optional[List[str]] = None,
+    distros: Optional[List[str]] = None,
+    group_by: Optional[str] = None,
+    sort: Optional[str] = None,
+    tests: Optional[List[str]] = None,
+) -> Dict[str, Any]:
+    """
+    Build the query parameters for the test and task stats endpoints.
+
+    :param after_date: Collect stats after this date.
+    :param before_date: Collect stats before this date.
+    :param group_num_days: Aggregate statistics to this size.
+    :param requesters: Filter by requestors (mainline, patch, trigger, or adhoc).
+    :param tasks: Only include specified tasks.
+    :param variants: Only include specified variants.
+    :param distros: Only include specified distros.
+    :param group_by: How to group results.
+    :param sort: How to sort results (earliest or latest).
+    :param tests: Only include specified tests.
+    :return: Query parameters for the stats endpoint.
+    """
+    params: Dict[str, Any] = {
+        "after_date": format_evergreen_date(after_date),
+        "before_date": format_evergreen_date(before_date),
+    }
+    if group_num_days is not None:
+        params["group_num_days"] = group_num_days
+    if requesters is not None:
+        params["requesters"] = requesters.stats_value()
+    if tests is not None:
+        params["tests"] = tests
+    if tasks is not None:
+        params["tasks"] = tasks
+    if variants is not None:
+        params["variants"] = variants
+    if distros is not None:
+        params["distros"] = distros
+    if group_by is not None:
+        params["group_by"] = group_by
+    if sort is not None:
+        params["sort"] = sort
+    return params
+
+
+def _select_fields(
+    document: Dict[str, Any], fields: Optional[Collection[str]] = None
+) -> Dict[str, Any]:
+    """
+    Keep only the given fields of a document.
+
+    :param document: Json document.
+    :param fields: Fields to keep, all fields are kept if None.
+    :return: Document with only the given fields.
+    """
+    if fields is None:
+        return document
+    return {field: document[field] for field in fields if field in document}
+
+
+def _tests_params(
+    status: Optional[str] = None,
+    execution: Optional[int] = None,
+    test_name: Optional[str] = None,
+) -> Dict[str, Any]:
+    """
+    Build the query parameters for the tests endpoint.
+
+    :param status: Limit results to given status.
+    :param execution: Retrieve the specified task execution.
+    :param test_name: Limit results to given test name.
+    :return: Query parameters for the tests endpoint.
+    """
+    params: Dict[str, Any] = {}
+    if status is not None:
+        params["status"] = status
+    if execution is not None:
+        params["execution"] = execution
+    if test_name is not None:
+        params["test_name"] = test_name
+    return params
+
+
 class EvergreenApi(object):
     """Base methods for building API objects."""
 
@@ -104,6 +360,19 @@ class EvergreenApi(object):
         use_default_logger_factory: bool = True,
         http_retry: Optional[Retry] = None,
         oidc_config: Optional[OidcConfig] = None,
+        pool_connections: int = DEFAULT_POOL_CONNECTIONS,
+        pool_maxsize: int = DEFAULT_POOL_MAXSIZE,
+        prefetch_pages: int = 0,
+        json_codec: Optional[JsonCodec] = None,
+        log_response_body_size: int = 0,
+        slow_request_threshold_sec: float = DEFAULT_SLOW_REQUEST_THRESHOLD_SEC,
+        on_request_timing: Optional[Callable[[RequestTiming], None]] = None,
+        compact_models: bool = False,
+        http_cache: Optional[HttpCache] = None,
+        object_cache: Optional[TtlCache] = None,
+        coalesce_requests: bool = True,
+        stream_json_pages: bool = False,
+        rate_limiter: Optional[RateLimiter] = None,
     ) -> None:
         """
         Create a _BaseEvergreenApi object.
@@ -116,11 +385,54 @@ class EvergreenApi(object):
         :param use_default_logger_factory: Indicate if the module should configure the default logger factory.
         :param http_retry: Optional Retry object that can be used to customize http request retries.
         :param oidc_config: Optional OidcConfig for OIDC authentication.
+        :param pool_connections: Number of host connection pools to keep in the session.
+        :param pool_maxsize: Maximum number of connections to keep open per host.
+        :param prefetch_pages: Number of pages lazy paginated endpoints should fetch ahead of the
+            consumer in the background. Disabled when 0.
+        :param json_codec: Codec used to decode responses, defaults to the standard library json
+            module. See `evergreen.json_codec.get_json_codec`.
+        :param log_response_body_size: Number of bytes of each response body to include in debug
+            logs. Response bodies are not logged when 0.
+        :param slow_request_threshold_sec: Requests taking longer than this are logged at info
+            level instead of debug.
+        :param on_request_timing: Function called with the timing record of each request.
+        :param compact_models: Return compact versions of Task, Build, Tst, TestStats and TaskStats
+            objects, which use less memory. See `evergreen.base.compact_class`.
+        :param http_cache: Persistent cache to store responses in and revalidate them with the
+            server on later requests. Not used with a custom session.
+        :param object_cache: Cache of the results of completed task executions and manifests,
+            which no longer change. Cached results are returned without querying the API. The
+            cache can be shared between clients of the same server.
+        :param coalesce_requests: Share a single request between threads making identical GET
+            requests at the same time.
+        :param stream_json_pages: Decode the pages of lazy paginated endpoints incrementally as
+            they are downloaded, so results are generated before the whole page is received and
+            page bodies are never held in memory. Pages are not prefetched in this mode.
+        :param rate_limiter: Limits on the rate and concurrency of requests, which back off when
+            the server throttles requests. The limiter can be shared between clients, including
+            the ones of `with_session`.
         """
         self._timeout = timeout
         self._api_server = api_server
         self._auth = auth
         self._session = session
+        self._session_lock = threading.Lock()
+        self._pool_connections = pool_connections
+        self._pool_maxsize = pool_maxsize
+        self._prefetch_pages = prefetch_pages
+        self._json_codec = json_codec if json_codec is not None else JsonCodec()
+        self._log_response_body_size = log_response_body_size
+        self._slow_request_threshold_sec = slow_request_threshold_sec
+        self._on_request_timing = on_request_timing
+        self._compact_models = compact_models
+        self._http_cache = http_cache
+        self._object_cache = object_cache
+        self._single_flight = SingleFlight() if coalesce_requests else None
+        self._stream_json_pages = stream_json_pages
+        self._rate_limiter = rate_limiter
+        self._pagination_lock = threading.Lock()
+        self._pages_fetched = 0
+        self._results_fetched = 0
         self._log_on_error = log_on_error
         self._http_retry = http_retry
         self._oidc_config = oidc_config
@@ -133,7 +445,7 @@ class EvergreenApi(object):
 
     @contextmanager
     def with_session(self) -> Generator["EvergreenApi", None, None]:
-        """Yield an instance of the API client with a shared session."""
+        """Yield an instance of the API client with its own dedicated session."""
         session = self._create_session()
         evg_api = EvergreenApi(
             self._api_server,
@@ -141,38 +453,143 @@ class EvergreenApi(object):
             self._timeout,
             session,
             self._log_on_error,
+            use_default_logger_factory=False,
+            http_retry=self._http_retry,
             oidc_config=self._oidc_config,
+            pool_connections=self._pool_connections,
+            pool_maxsize=self._pool_maxsize,
+            prefetch_pages=self._prefetch_pages,
+            json_codec=self._json_codec,
+            log_response_body_size=self._log_response_body_size,
+            slow_request_threshold_sec=self._slow_request_threshold_sec,
+            on_request_timing=self._on_request_timing,
+            compact_models=self._compact_models,
+            http_cache=self._http_cache,
+            object_cache=self._object_cache,
+            coalesce_requests=self._single_flight is not None,
+            stream_json_pages=self._stream_json_pages,
+            rate_limiter=self._rate_limiter,
         )
-        yield evg_api
+        # Requests are coalesced with the clients of other sessions as well.
+        evg_api._single_flight = self._single_flight
+        try:
+            yield evg_api
+        finally:
+            session.close()
+
+    @property
+    def json_codec(self) -> JsonCodec:
+        """Get the codec used to decode responses."""
+        return self._json_codec
 
     @property
     def session(self) -> requests.Session:
         """
-        Get the shared session if it exists, else create a new session.
+        Get the session used to query the API.
+
+        The session is created on first use and then reused for the lifetime of this client so
+        that connections to the API server are kept alive between calls.
 
         :return: Session to query the API with.
         """
-        if self._session:
-            return self._session
+        if self._session is None:
+            with self._session_lock:
+                if self._session is None:
+                    self._session = self._create_session()
 
-        return self._create_session()
+        return self._session
 
     def _create_session(self) -> requests.Session:
         """Create a new session to query the API with."""
         session = requests.Session()
-        adapter = requests.adapters.HTTPAdapter(max_retries=self._http_retry)
+        adapter_kwargs: Dict[str, Any] = {
+            "pool_connections": self._pool_connections,
+            "pool_maxsize": self._pool_maxsize,
+            "max_retries": self._http_retry,
+        }
+        adapter = (
+            CachingHTTPAdapter(self._http_cache, **adapter_kwargs)
+            if self._http_cache is not None
+            else requests.adapters.HTTPAdapter(**adapter_kwargs)
+        )
         session.mount(f"{urlparse(self._api_server).scheme}://", adapter)
+        session.headers.update(self._auth_headers())
+        return session
 
-        # Add authentication headers
+    def _auth_headers(self) -> Dict[str, str]:
+        """Get the headers used to authenticate with the API."""
         if self._oidc_token_manager:
             # Use OIDC Bearer token
             token = self._oidc_token_manager.get_token()
-            session.headers.update({"Authorization": f"Bearer {token}"})
-        elif self._auth:
+            return {"Authorization": f"Bearer {token}"}
+        if self._auth:
             # Use API key authentication
-            session.headers.update({"Api-User": self._auth.username, "Api-Key": self._auth.api_key})
+            return {"Api-User": self._auth.username, "Api-Key": self._auth.api_key}
+        return {}
 
-        return session
+    def _refresh_auth_headers(self) -> None:
+        """Refresh the OIDC bearer token in the session headers if it has expired."""
+        if self._oidc_token_manager:
+            token = self._oidc_token_manager.get_token()
+            self.session.headers.update({"Authorization": f"Bearer {token}"})
+
+    def close(self) -> None:
+        """Close the session and release any pooled connections."""
+        with self._session_lock:
+            if self._session is not None:
+                self._session.close()
+                self._session = None
+
+    def pagination_stats(self) -> PaginationStats:
+        """
+        Get the number of pages and results fetched by paginated queries of this client.
+
+        :return: Statistics of the paginated queries.
+        """
+        with self._pagination_lock:
+            return PaginationStats(pages=self._pages_fetched, results=self._results_fetched)
+
+    def _count_page(self, num_results: int) -> None:
+        """
+        Record a page fetched by a paginated query.
+
+        :param num_results: Number of results in the page.
+        """
+        with self._pagination_lock:
+            self._pages_fetched += 1
+            self._results_fetched += num_results
+
+    def connection_pool_stats(self) -> List[ConnectionPoolStats]:
+        """
+        Get usage statistics of the connection pools held by the session.
+
+        :return: Statistics for each host connection pool currently in the session.
+        """
+        if self._session is None:
+            return []
+
+        stats = []
+        adapters = {id(adapter): adapter for adapter in self._session.adapters.values()}
+        for adapter in adapters.values():
+            pools = getattr(getattr(adapter, "poolmanager", None), "pools", None)
+            if pools is None:
+                continue
+            for key in pools.keys():
+                pool = pools.get(key)
+                if pool is None:
+                    continue
+                stats.append(
+                    ConnectionPoolStats(
+                        scheme=pool.scheme,
+                        host=pool.host,
+                        port=pool.port,
+                        maxsize=pool.pool.maxsize if pool.pool else 0,
+                        num_connections=pool.num_connections,
+                        num_requests=pool.num_requests,
+                        idle_connections=pool.pool.qsize() if pool.pool else 0,
+                    )
+                )
+        return stats
 
     def _create_url(self, endpoint: str) -> str:
         """
@@ -192,19 +609,57 @@ class EvergreenApi(object):
         """
         return f"{self._api_server}/plugin/json{endpoint}"
 
-    @staticmethod
-    def _log_api_call_time(response: requests.Response, start_time: float) -> None:
+    def _record_request_timing(
+        self,
+        method: str,
+        url: str,
+        status_code: int,
+        start_time: float,
+        response_size: Optional[int] = None,
+    ) -> RequestTiming:
         """
-        Log how long the api call took.
+        Log the timing record of a request and pass it to the timing callback.
 
-        :param response: Response from API.
-        :param start_time: Time the response was started.
+        Requests slower than the slow request threshold are logged at info level, all others at
+        debug level.
+
+        :param method: HTTP method of the request.
+        :param url: Url of the request.
+        :param status_code: Status code of the response.
+        :param start_time: Time the request was started.
+        :param response_size: Size of the response body in bytes, if known.
+        :return: Timing record of the request.
         """
-        duration = round(time() - start_time, 2)
-        if duration > 10:
-            LOGGER.info("Request completed.", url=response.request.url, duration=duration)
-        else:
-            LOGGER.debug("Request completed.", url=response.request.url, duration=duration)
+        timing = RequestTiming(
+            method=method,
+            url=url,
+            status_code=status_code,
+            duration_sec=round(time() - start_time, 3),
+            response_size=response_size,
+        )
+        if timing.duration_sec > self._slow_request_threshold_sec:
+            LOGGER.info("Request completed.", **timing._asdict())
+        elif _is_log_enabled(logging.DEBUG):
+            LOGGER.debug("Request completed.", **timing._asdict())
+
+        if self._on_request_timing is not None:
+            self._on_request_timing(timing)
+        return timing
+
+    def _truncated_body(self, response: requests.Response) -> str:
+        """
+        Get the start of a response body for logging, without decoding the rest of it.
+
+        :param response: Response to get the body of.
+        :return: Up to `log_response_body_size` bytes of the body as text.
+        """
+        content = response.content or b""
+        body = content[: self._log_response_body_size].decode(
+            response.encoding or "utf-8", errors="replace"
+        )
+        if len(content) > self._log_response_body_size:
+            body += f"... ({len(content) - self._log_response_body_size} more bytes)"
+        return body
 
     def _call_api(
         self,
@@ -222,34 +677,84 @@ class EvergreenApi(object):
         :param data: Extra data to send to the endpoint.
         :return: response from api server.
         """
-        start_time = time()
-        LOGGER.debug(
-            "Request to be sent",
-            url=url,
-            params=params,
-            timeout=self._timeout,
-            data=data,
-            method=method,
-        )
+        if self._single_flight is None or method != "GET" or data is not None:
+            return self._send_request(url, params, method, data)
 
-        # Refresh OIDC bearer token in session headers if expired
-        if self._oidc_token_manager:
-            token = self._oidc_token_manager.get_token()
-            self.session.headers.update({"Authorization": f"Bearer {token}"})
+        # Concurrent identical GET requests share the response of the first one.
+        key = (url, urlencode(sorted(params.items()), doseq=True) if params else "")
+        response, _ = self._single_flight.do(key, lambda: self._send_request(url, params))
+        return response
 
-        response = self.session.request(
-            url=url, params=params, timeout=self._timeout, data=data, method=method
-        )
+    @contextmanager
+    def _request_permit(self, url: str) -> Generator[Optional[RequestPermit], None, None]:
+        """
+        Wait until the rate limiter allows a request to the given url.
+
+        :param url: Url the request is sent to.
+        :return: Context manager yielding the permit of the request, None without a rate limiter.
+        """
+        if self._rate_limiter is None:
+            yield None
+            return
+
+        with self._rate_limiter.limit(urlparse(url).netloc) as permit:
+            yield permit
+
+    def _send_request(
+        self,
+        url: str,
+        params: Optional[Dict] = None,
+        method: str = "GET",
+        data: Optional[str] = None,
+    ) -> requests.Response:
+        """
+        Send a request to the evergreen api.
+
+        :param url: Url of call to make.
+        :param params: parameters to pass to api.
+        :param method: HTTP method to make call with.
+        :param data: Extra data to send to the endpoint.
+        :return: response from api server.
+        """
+        start_time = time()
+        debug_enabled = _is_log_enabled(logging.DEBUG)
+        if debug_enabled:
+            LOGGER.debug(
+                "Request to be sent",
+                url=url,
+                params=params,
+                timeout=self._timeout,
+                data=data,
+                method=method,
+            )
 
-        LOGGER.debug(
-            "Response received",
-            request_url=response.request.url,
-            request_method=response.request.method,
-            request_body=response.request.body,
-            response_status_code=response.status_code,
-            response_text=response.text,
+        self._refresh_auth_headers()
+        with self._request_permit(url) as permit:
+            response = self.session.request(
+                url=url, params=params, timeout=self._timeout, data=data, method=method
+            )
+            if permit is not None:
+                permit.record(response.status_code, response.headers.get("Retry-After"))
+
+        if debug_enabled:
+            log_kwargs = {}
+            if self._log_response_body_size > 0:
+                log_kwargs["response_body"] = self._truncated_body(response)
+            LOGGER.debug(
+                "Response received",
+                request_url=response.request.url,
+                request_method=response.request.method,
+                request_body=response.request.body,
+                response_status_code=response.status_code,
+                **log_kwargs,
+            )
+        self._record_request_timing(
+            method,
+            response.request.url or url,
+            response.status_code,
+            start_time,
+            len(response.content),
         )
-        self._log_api_call_time(response, start_time)
 
         self._raise_for_status(response)
         return response
@@ -273,15 +778,175 @@ class EvergreenApi(object):
         :return: Iterable over the lines of the returned content.
         """
         start_time = time()
+        self._refresh_auth_headers()
+
+        # The permit is held while the body is read, so it counts against the concurrency limit.
+        with self._request_permit(url) as permit:
+            response = self.session.get(url=url, params=params, stream=True, timeout=self._timeout)
+            if permit is not None:
+                permit.record(response.status_code, response.headers.get("Retry-After"))
+            with response as res:
+                self._record_request_timing(
+                    "GET", res.request.url or url, res.status_code, start_time
+                )
+                if is_binary:
+                    for line in res.iter_content(
+                        chunk_size=chunk_size, decode_unicode=decode_unicode
+                    ):
+                        yield line
+                else:
+                    for line in res.iter_lines(decode_unicode=decode_unicode):
+                        yield line
+
+    def _stream_into(
+        self,
+        url: str,
+        target: StreamTarget,
+        chunk_size: int = DEFAULT_DOWNLOAD_CHUNK_SIZE,
+        encoding: Optional[str] = None,
+    ) -> int:
+        """
+        Read the contents of a url into a file object, a file descriptor or a buffer.
 
-        with self.session.get(url=url, params=params, stream=True, timeout=self._timeout) as res:
-            self._log_api_call_time(res, start_time)
-            if is_binary:
-                for line in res.iter_content(chunk_size=chunk_size, decode_unicode=decode_unicode):
-                    yield line
-            else:
-                for line in res.iter_lines(decode_unicode=decode_unicode):
-                    yield line
+        :param url: URL to read.
+        :param target: Binary or text file object, file descriptor, or buffer to fill.
+        :param chunk_size: Number of bytes to read at a time.
+        :param encoding: Encoding of the contents when writing to a text file.
+        :return: Number of bytes read.
+        """
+        response = self._open_stream(url)
+        try:
+            return stream_into(response, target, chunk_size=chunk_size, encoding=encoding)
+        finally:
+            response.close()
+
+    def _download_file(
+        self,
+        url: str,
+        path: str,
+        parallel_ranges: int = DEFAULT_PARALLEL_RANGES,
+        chunk_size: int = DEFAULT_DOWNLOAD_CHUNK_SIZE,
+    ) -> int:
+        """
+        Download a file over parallel ranged requests, resuming a previous partial download.
+
+        :param url: URL of the file.
+        :param path: Path to download the file to.
+        :param parallel_ranges: Maximum number of ranges to download at once.
+        :param chunk_size: Number of bytes to read from a response at a time.
+        :return: Size of the downloaded file.
+        """
+        download = RangedDownload(
+            lambda range_url, headers: self._open_stream(range_url, headers=headers),
+            url,
+            path,
+            parallel_ranges=parallel_ranges,
+            chunk_size=chunk_size,
+        )
+        return download.run()
+
+    def _model_class(self, model_cls: Type[EvgObjectType]) -> Type[EvgObjectType]:
+        """
+        Get the class to create model objects of the given type with.
+
+        :param model_cls: Model class.
+        :return: Compact version of the class if compact models are enabled, otherwise the class.
+        """
+        if self._compact_models:
+            return compact_class(model_cls)
+        return model_cls
+
+    def _immutable_result(
+        self,
+        key: Tuple[Any, ...],
+        query_fn: Callable[[], Any],
+        is_immutable_fn: Callable[[Any], bool],
+    ) -> Any:
+        """
+        Get a result from the object cache, querying the API and caching it if it is not cached.
+
+        :param key: Key of the result in the object cache.
+        :param query_fn: Function to query the API with.
+        :param is_immutable_fn: Function to determine if the result will no longer change.
+        :return: Result of the query.
+        """
+        if self._object_cache is None:
+            return query_fn()
+
+        found, result = self._object_cache.get(key)
+        if found:
+            return result
+
+        result = query_fn()
+        if is_immutable_fn(result):
+            self._object_cache.put(key, result)
+        return result
+
+    def _remember_completed_task(
+        self, task_json: Dict[str, Any], all_executions: bool, latest: bool
+    ) -> bool:
+        """
+        Record a task in the object cache if it is completed.
+
+        Once an execution of a task is known to be completed, its test and performance results
+        are cached as well.
+
+        :param task_json: Json of the task.
+        :param all_executions: Whether the json includes the previous executions of the task.
+        :param latest: Whether the json is of the latest execution of the task.
+        :return: True if the task is completed.
+        """
+        if self._object_cache is None:
+            return False
+
+        task_id = task_json.get("task_id")
+        execution = task_json.get("execution")
+        if not Task(task_json, self).is_completed():
+            if latest:
+                # The task may have been restarted since it was last seen completed.
+                self._object_cache.discard(("completed_task", task_id, None))
+            return False
+
+        self._object_cache.put(("task", task_id, execution, all_executions), task_json)
+        self._object_cache.put(("completed_task", task_id, execution), True)
+        if latest:
+            # An older execution being completed says nothing about the latest one.
+            self._object_cache.put(("completed_task", task_id, None), execution)
+        return True
+
+    def _is_task_completed(self, task_id: str, execution: int) -> bool:
+        """
+        Determine if an execution of a task is known to be completed from the object cache.
+
+        :param task_id: Id of the task.
+        :param execution: Execution of the task.
+        :return: True if the execution has been seen completed.
+        """
+        return (
+            self._object_cache is not None
+            and ("completed_task", task_id, execution) in self._object_cache
+        )
+
+    def _latest_completed_execution(self, task_id: str) -> Optional[int]:
+        """
+        Get the latest execution of a task, if it was completed when the task was last queried.
+
+        :param task_id: Id of the task.
+        :return: Latest execution of the task, None if it is not known to be completed.
+        """
+        if self._object_cache is None:
+            return None
+        found, execution = self._object_cache.get(("completed_task", task_id, None))
+        return execution if found else None
+
+    def _decode_json(self, response: requests.Response) -> Any:
+        """
+        Decode the json body of a response with the configured codec.
+
+        :param response: Response from evergreen api.
+        :return: Decoded body of the response.
+        """
+        return self._json_codec.decode_response(response)
 
     def _raise_for_status(self, response: requests.Response) -> None:
         """
@@ -289,90 +954,306 @@ class EvergreenApi(object):
 
         :param response: response from evergreen api.
         """
-        try:
-            json_data = response.json()
-            if response.status_code >= 400 and "error" in json_data:
-                if self._log_on_error:
-                    LOGGER.error(
-                        "Error found in json",
-                        request_url=response.request.url,
-                        request_method=response.request.method,
-                        request_body=response.request.body,
-                        response_status_code=response.status_code,
-                        response_text=response.text,
-                    )
-                raise requests.exceptions.HTTPError(json_data["error"], response=response)
-        except JSONDecodeError:
-            pass
+        # Only error responses are decoded here so successful bodies are decoded once, by the
+        # caller that consumes them.
+        if response.status_code >= 400:
+            try:
+                json_data = self._decode_json(response)
+                if "error" in json_data:
+                    if self._log_on_error:
+                        LOGGER.error(
+                            "Error found in json",
+                            request_url=response.request.url,
+                            request_method=response.request.method,
+                            request_body=response.request.body,
+                            response_status_code=response.status_code,
+                            response_text=response.text,
+                        )
+                    raise requests.exceptions.HTTPError(json_data["error"], response=response)
+            except JSONDecodeError:
+                pass
 
         response.raise_for_status()
 
     def _paginate(
-        self, url: str, params: Optional[Dict] = None
+        self, url: str, params: Optional[Dict] = None, fields: Optional[Collection[str]] = None
     ) -> Union[List[Dict[str, Any]], Dict[str, Any]]:
         """
         Paginate until all results are returned and return a list of all JSON results.
 
+        If the params include a 'limit', at most that many results are returned and the last page
+        is requested with only the number of results still needed.
+
         :param url: url to make request to.
         :param params: parameters to pass to request.
+        :param fields: Fields to keep in each result, the other fields are dropped as each page is
+            decoded. All fields are kept if None.
         :return: json list of all results.
         """
+        max_results = params.get("limit") if params else None
         response = self._call_api(url, params)
-        json_data = response.json()
+        page = self._decode_json(response)
+        self._count_page(_page_length(page))
+        json_data = self._select_page_fields(page, fields)
         while "next" in response.links:
-            if params and "limit" in params and len(json_data) >= params["limit"]:
-                break
-            response = self._call_api(response.links["next"]["url"])
-            if response.json():
-                json_data.extend(response.json())
-
+            next_url = response.links["next"]["url"]
+            if max_results is not None:
+                remaining = max_results - len(json_data)
+                if remaining <= 0:
+                    break
+                next_url, _ = _limit_page(next_url, None, remaining)
+            response = self._call_api(next_url)
+            next_page = self._decode_json(response)
+            self._count_page(_page_length(next_page))
+            if next_page:
+                json_data.extend(self._select_page_fields(next_page, fields))
+
+        if max_results is not None and isinstance(json_data, list):
+            del json_data[max_results:]
         return json_data
 
-    def _lazy_paginate(self, url: str, params: Optional[Dict] = None) -> Iterable:
+    @staticmethod
+    def _select_page_fields(page: Any, fields: Optional[Collection[str]]) -> Any:
+        """
+        Keep only the given fields of each result of a page.
+
+        :param page: Decoded page of results.
+        :param fields: Fields to keep, all fields are kept if None.
+        :return: Page with only the given fields in each result.
+        """
+        if fields is None or not isinstance(page, list):
+            return page
+        return [_select_fields(document, fields) for document in page]
+
+    def _lazy_paginate(
+        self,
+        url: str,
+        params: Optional[Dict] = None,
+        prefetch_pages: Optional[int] = None,
+        fields: Optional[Collection[str]] = None,
+        max_results: Optional[int] = None,
+    ) -> Iterable:
         """
         Lazy paginate, the results are returned lazily.
 
         :param url: URL to query.
         :param params: Params to pass to url.
+        :param prefetch_pages: Number of pages to fetch ahead in the background, defaults to the
+            value the client was created with.
+        :param fields: Fields to keep in each result, all fields are kept if None.
+        :param max_results: Maximum number of results to return, pages are not requested past it.
         :return: A generator to get results from.
         """
         if not params:
             params = {
                 "limit": DEFAULT_LIMIT,
             }
+        if max_results is not None and max_results <= 0:
+            return
 
-        next_url = url
-        while True:
-            response = self._call_api(next_url, params)
-            json_response = response.json()
-            if not json_response:
-                break
-            for result in json_response:
-                yield result
-            if "next" not in response.links:
-                break
+        results: Iterable
+        if self._stream_json_pages:
+            results = self._stream_pages(url, params, max_results)
+        else:
+            results = self._flatten_pages(
+                self._iterate_pages(url, params, max_results), prefetch_pages
+            )
 
-            next_url = response.links["next"]["url"]
+        if fields is None:
+            yield from results
+        else:
+            for result in results:
+                yield _select_fields(result, fields)
 
-    def _lazy_paginate_by_date(self, url: str, params: Optional[Dict] = None) -> Iterable:
+    def _lazy_paginate_by_date(
+        self,
+        url: str,
+        params: Optional[Dict] = None,
+        prefetch_pages: Optional[int] = None,
+        max_results: Optional[int] = None,
+    ) -> Iterable:
         """
         Paginate based on date, the results are returned lazily.
 
         :param url: URL to query.
         :param params: Params to pass to url.
+        :param prefetch_pages: Number of pages to fetch ahead in the background, defaults to the
+            value the client was created with.
+        :param max_results: Maximum number of results to return, pages are not requested past it.
         :return: A generator to get results from.
         """
         if not params:
             params = {
                 "limit": DEFAULT_LIMIT,
             }
+        if max_results is not None and max_results <= 0:
+            return
+
+        yield from self._flatten_pages(
+            self._iterate_pages_by_date(url, params, max_results), prefetch_pages
+        )
+
+    def _flatten_pages(
+        self, pages: Iterator[List[Any]], prefetch_pages: Optional[int] = None
+    ) -> Iterable:
+        """
+        Generate the results of each page, optionally reading pages ahead of the consumer.
+
+        :param pages: Iterator over pages of results.
+        :param prefetch_pages: Number of pages to fetch ahead in the background.
+        :return: A generator to get results from.
+        """
+        if prefetch_pages is None:
+            prefetch_pages = self._prefetch_pages
+        if prefetch_pages > 0:
+            pages = prefetch(pages, prefetch_pages)
+
+        for page in pages:
+            yield from page
+
+    def _iterate_pages(
+        self, url: str, params: Dict, max_results: Optional[int] = None
+    ) -> Iterator[List[Any]]:
+        """
+        Generate each page of results by following the 'next' links of the responses.
+
+        :param url: URL to query.
+        :param params: Params to pass to url.
+        :param max_results: Maximum number of results to generate.
+        :return: A generator of pages of results.
+        """
+        page_size = params.get("limit", DEFAULT_LIMIT)
+        remaining = max_results
+        next_url = url
+        page_params: Optional[Dict] = params
+        while True:
+            if remaining is not None and remaining < page_size:
+                next_url, page_params = _limit_page(next_url, page_params, remaining)
+            response = self._call_api(next_url, page_params)
+            json_response = self._decode_json(response)
+            self._count_page(_page_length(json_response))
+            if not json_response:
+                break
+            if remaining is not None:
+                json_response = json_response[:remaining]
+                remaining -= len(json_response)
+            yield json_response
+            if "next" not in response.links or remaining == 0:
+                break
+
+            next_url = response.links["next"]["url"]
+
+    def _stream_pages(
+        self, url: str, params: Dict, max_results: Optional[int] = None
+    ) -> Iterator[Any]:
+        """
+        Generate the results of each page as they are decoded from the response stream.
+
+        :param url: URL to query.
+        :param params: Params to pass to url.
+        :param max_results: Maximum number of results to generate.
+        :return: A generator of results.
+        """
+        page_size = params.get("limit", DEFAULT_LIMIT)
+        remaining = max_results
+        next_url: Optional[str] = url
+        page_params: Optional[Dict] = params
+        while next_url and remaining != 0:
+            if remaining is not None and remaining < page_size:
+                next_url, page_params = _limit_page(next_url, page_params, remaining)
+            response = self._open_stream(next_url, page_params)
+            count = 0
+            try:
+                next_url = response.links.get("next", {}).get("url")
+                chunks = response.iter_content(chunk_size=DEFAULT_STREAM_CHUNK_SIZE)
+                for result in iter_json_array(chunks, response.encoding or "utf-8"):
+                    count += 1
+                    yield result
+                    if count == remaining:
+                        break
+            finally:
+                self._count_page(count)
+                response.close()
+            if count == 0:
+                break
+            if remaining is not None:
+                remaining -= count
+
+    def _open_stream(
+        self, url: str, params: Optional[Dict] = None, headers: Optional[Dict[str, str]] = None
+    ) -> requests.Response:
+        """
+        Send a GET request to the evergreen api without reading the response body.
+
+        :param url: Url of call to make.
+        :param params: parameters to pass to api.
+        :param headers: Headers to send in addition to the ones of the session.
+        :return: response from api server, its body is read as it is consumed. It must be closed
+            to release its rate limiter permit.
+        """
+        start_time = time()
+        self._refresh_auth_headers()
+        # The permit is held until the response is closed, so the body being read counts against
+        # the concurrency limit.
+        permit_scope = ExitStack()
+        try:
+            permit = permit_scope.enter_context(self._request_permit(url))
+            response = self.session.get(
+                url=url, params=params, headers=headers, stream=True, timeout=self._timeout
+            )
+            if permit is not None:
+                permit.record(response.status_code, response.headers.get("Retry-After"))
+        except BaseException:
+            permit_scope.close()
+            raise
+        if permit is not None:
+            _close_with(response, permit_scope.close)
+        self._record_request_timing(
+            "GET", response.request.url or url, response.status_code, start_time
+        )
+        try:
+            self._raise_for_status(response)
+        except Exception:
+            response.close()
+            raise
+        return response
 
+    def _iterate_pages_by_date(
+        self, url: str, params: Dict, max_results: Optional[int] = None
+    ) -> Iterator[List[Any]]:
+        """
+        Generate each page of results by querying from the create time of the last result.
+
+        The server may return fewer results than the 'limit' of the params, so pages are requested
+        until one is empty. Only when the limit is lowered to the number of results still wanted
+        is a shorter page known to be the last one, and no request is made for the empty page
+        after it.
+
+        :param url: URL to query.
+        :param params: Params to pass to url.
+        :param max_results: Maximum number of results to generate.
+        :return: A generator of pages of results.
+        """
+        params = dict(params)
+        page_size = params.get("limit")
+        remaining = max_results
         while True:
-            data = self._call_api(url, params).json()
+            limited_by_max_results = remaining is not None and (
+                page_size is None or remaining < page_size
+            )
+            if limited_by_max_results:
+                params["limit"] = remaining
+            data = self._decode_json(self._call_api(url, params))
+            self._count_page(_page_length(data))
             if not data:
                 break
-            for result in data:
-                yield result
+            last_page = limited_by_max_results and len(data) < params["limit"]
+            if remaining is not None:
+                data = data[:remaining]
+                remaining -= len(data)
+            yield data
+            if last_page or remaining == 0:
+                break
             params["start_at"] = evergreen_input_to_output(data[-1]["create_time"])
 
     def all_distros(self) -> List[Distro]:
@@ -496,7 +1377,7 @@ class EvergreenApi(object):
         """
         url = self._create_url(f"/projects/{project_id}/recent_versions")
         resp = self._call_api(url, params)
-        return RecentVersions(resp.json(), self)  # type: ignore[arg-type]
+        return RecentVersions(self._decode_json(resp), self)  # type: ignore[arg-type]
 
     def send_slack_message(
         self, target: str, msg: str, attachments: Optional[List[SlackAttachment]] = None
@@ -632,20 +1513,67 @@ class EvergreenApi(object):
         :param time_attr: Attributes to use to window timestamps.
         :return: Iterator for the given time window.
         """
+        start = None
+        if time_attr == "create_time":
+            # Versions are ordered by creation, so the versions created after the window can be
+            # skipped by starting at the right order number.
+            start = self._version_order_after(project_id, requester, before)
         return iterate_by_time_window(
-            self.versions_by_project(project_id, requester), before, after, time_attr
+            self.versions_by_project(project_id, requester, start=start), before, after, time_attr
         )
 
-    def patches_by_project(self, project_id: str, params: Optional[Dict] = None) -> Iterable[Patch]:
+    def _version_order_after(
+        self, project_id: str, requester: Requester, before: datetime
+    ) -> Optional[int]:
+        """
+        Find the order number to start at to skip the versions created after the given time.
+
+        The versions endpoint cannot be queried by date, so the order number is found with a
+        binary search, querying a single version for each step.
+
+        :param project_id: Id of project to query.
+        :param requester: Type of versions to query.
+        :param before: Versions created after this time are skipped.
+        :return: Order number to pass as `start`, None if no versions need to be skipped.
+        """
+        url = self._create_url(f"/projects/{project_id}/versions")
+
+        def newest_version(start: Optional[int] = None) -> Optional[Version]:
+            params: Dict[str, Any] = {"requester": requester, "limit": 1}
+            if start is not None:
+                params["start"] = start
+            versions = self._decode_json(self._call_api(url, params))
+            return Version(versions[0], self) if versions else None
+
+        latest = newest_version()
+        if latest is None or latest.order is None or latest.create_time <= before:
+            return None
+
+        # Every version with an order number up to `low` was created before the window ends, the
+        # version at `high + 1` was created after it.
+        low, high = 0, latest.order - 1
+        while low < high:
+            middle = (low + high + 1) // 2
+            version = newest_version(start=middle + 1)
+            if version is None or version.create_time <= before:
+                low = middle
+            else:
+                high = min(version.order, middle) - 1
+        return low + 1
+
+    def patches_by_project(
+        self, project_id: str, params: Optional[Dict] = None, limit: Optional[int] = None
+    ) -> Iterable[Patch]:
         """
         Get a list of patches for the specified project.
 
         :param project_id: Id of project to query.
         :param params: parameters to pass to endpoint.
+        :param limit: If specified, return at most this many patches.
         :return: List of recent patches.
         """
         url = self._create_url(f"/projects/{project_id}/patches")
-        patches = self._lazy_paginate_by_date(url, params)
+        patches = self._lazy_paginate_by_date(url, params, max_results=limit)
         return (Patch(patch, self) for patch in patches)  # type: ignore[arg-type]
 
     def update_patch_status(
@@ -708,6 +1636,12 @@ class EvergreenApi(object):
         :param time_attr: Attributes to use to window timestamps.
         :return: Iterator for the given time window.
         """
+        if time_attr == "create_time" and not (params and "start_at" in params):
+            # Patches are paginated by creation time, so the query can start at the end of the
+            # window instead of at the most recent patch.
+            start_at = before.astimezone(tz.UTC) if before.tzinfo is not None else before
+            params = dict(params or {"limit": DEFAULT_LIMIT})
+            params["start_at"] = format_evergreen_datetime(start_at)
         return iterate_by_time_window(
             self.patches_by_project(project_id, params), before, after, time_attr
         )
@@ -770,41 +1704,106 @@ class EvergreenApi(object):
         :param sort: How to sort results (earliest or latest).
         :return: Patch queried for.
         """
-        params: Dict[str, Any] = {
-            "after_date": format_evergreen_date(after_date),
-            "before_date": format_evergreen_date(before_date),
-        }
-        if group_num_days is not None:
-            params["group_num_days"] = group_num_days
-        if requesters is not None:
-            params["requesters"] = requesters.stats_value()
-        if tests is not None:
-            params["tests"] = tests
-        if tasks is not None:
-            params["tasks"] = tasks
-        if variants is not None:
-            params["variants"] = variants
-        if distros is not None:
-            params["distros"] = distros
-        if group_by is not None:
-            params["group_by"] = group_by
-        if sort is not None:
-            params["sort"] = sort
+        params = _stats_params(
+            after_date,
+            before_date,
+            group_num_days,
+            requesters,
+            tasks,
+            variants,
+            distros,
+            group_by,
+            sort,
+            tests=tests,
+        )
         url = self._create_url(f"/projects/{project_id}/test_stats")
         test_stats_list = self._paginate(url, params)
-        return [TestStats(test_stat, self) for test_stat in test_stats_list]  # type: ignore[arg-type]
+        model_cls = self._model_class(TestStats)
+        return [model_cls(test_stat, self) for test_stat in test_stats_list]  # type: ignore[arg-type]
+
+    def iter_test_stats_by_project(
+        self,
+        project_id: str,
+        after_date: datetime,
+        before_date: datetime,
+        group_num_days: Optional[int] = None,
+        requesters: Optional[Requester] = None,
+        tests: Optional[List[str]] = None,
+        tasks: Optional[List[str]] = None,
+        variants: Optional[List[str]] = None,
+        distros: Optional[List[str]] = None,
+        group_by: Optional[str] = None,
+        sort: Optional[str] = None,
+    ) -> Iterator[TestStats]:
+        """
+        Generate the test stats of a project, a page at a time.
+
+        :param project_id: Id of project to query for.
+        :param after_date: Collect stats after this date.
+        :param before_date: Collect stats before this date.
+        :param group_num_days: Aggregate statistics to this size.
+        :param requesters: Filter by requestors (mainline, patch, trigger, or adhoc).
+        :param tests: Only include specified tests.
+        :param tasks: Only include specified tasks.
+        :param variants: Only include specified variants.
+        :param distros: Only include specified distros.
+        :param group_by: How to group results (test_task_variant, test_task, or test)
+        :param sort: How to sort results (earliest or latest).
+        :return: Generator of test stats.
+        """
+        params = _stats_params(
+            after_date,
+            before_date,
+            group_num_days,
+            requesters,
+            tasks,
+            variants,
+            distros,
+            group_by,
+            sort,
+            tests=tests,
+        )
+        url = self._create_url(f"/projects/{project_id}/test_stats")
+        model_cls = self._model_class(TestStats)
+        return (model_cls(test_stat, self) for test_stat in self._lazy_paginate(url, params))
 
-    def tasks_by_project(self, project_id: str, statuses: Optional[List[str]] = None) -> List[Task]:
+    def tasks_by_project(
+        self,
+        project_id: str,
+        statuses: Optional[List[str]] = None,
+        fields: Optional[Collection[str]] = None,
+    ) -> List[Task]:
         """
         Get all the tasks for a project.
 
         :param project_id: The project's id.
         :param statuses: the types of statuses to get tasks for.
+        :param fields: Only keep these fields of each task, to reduce memory use.
         :return: The list of matching tasks.
         """
         url = self._create_url(f"/projects/{project_id}/versions/tasks")
         params = {"status": statuses} if statuses is not None else None
-        return [Task(json, self) for json in self._paginate(url, params)]  # type: ignore[arg-type]
+        model_cls = self._model_class(Task)
+        return [model_cls(json, self) for json in self._paginate(url, params, fields)]  # type: ignore[arg-type]
+
+    def iter_tasks_by_project(
+        self,
+        project_id: str,
+        statuses: Optional[List[str]] = None,
+        fields: Optional[Collection[str]] = None,
+    ) -> Iterator[Task]:
+        """
+        Generate the tasks of a project, a page at a time.
+
+        :param project_id: The project's id.
+        :param statuses: the types of statuses to get tasks for.
+        :param fields: Only keep these fields of each task, to reduce memory use.
+        :return: Generator of the matching tasks.
+        """
+        url = self._create_url(f"/projects/{project_id}/versions/tasks")
+        params = {"status": statuses} if statuses is not None else None
+        model_cls = self._model_class(Task)
+        return (model_cls(json, self) for json in self._lazy_paginate(url, params, fields=fields))
 
     def tasks_by_project_and_commit(
         self, project_id: str, commit_hash: str, params: Optional[Dict] = None
@@ -818,7 +1817,8 @@ class EvergreenApi(object):
         :return: The list of matching tasks.
         """
         url = self._create_url(f"/projects/{project_id}/revisions/{commit_hash}/tasks")
-        return [Task(json, self) for json in self._paginate(url, params)]  # type: ignore[arg-type]
+        model_cls = self._model_class(Task)
+        return [model_cls(json, self) for json in self._paginate(url, params)]  # type: ignore[arg-type]
 
     def tasks_by_project_and_name(
         self,
@@ -846,7 +1846,8 @@ class EvergreenApi(object):
             data["start_at"] = start_at
         url = self._create_url(f"/projects/{project_id}/tasks/{task_name}")
         return [
-            Task(task_json, self) for task_json in self._call_api(url, data=json.dumps(data)).json()
+            self._model_class(Task)(task_json, self)
+            for task_json in self._decode_json(self._call_api(url, data=json.dumps(data)))
         ]
 
     def task_stats_by_project(
@@ -877,27 +1878,64 @@ class EvergreenApi(object):
         :param sort: How to sort results (earliest or latest).
         :return: Patch queried for.
         """
-        params: Dict[str, Any] = {
-            "after_date": format_evergreen_date(after_date),
-            "before_date": format_evergreen_date(before_date),
-        }
-        if group_num_days is not None:
-            params["group_num_days"] = group_num_days
-        if requesters is not None:
-            params["requesters"] = requesters.stats_value()
-        if tasks is not None:
-            params["tasks"] = tasks
-        if variants is not None:
-            params["variants"] = variants
-        if distros is not None:
-            params["distros"] = distros
-        if group_by is not None:
-            params["group_by"] = group_by
-        if sort is not None:
-            params["sort"] = sort
+        params = _stats_params(
+            after_date,
+            before_date,
+            group_num_days,
+            requesters,
+            tasks,
+            variants,
+            distros,
+            group_by,
+            sort,
+        )
         url = self._create_url(f"/projects/{project_id}/task_stats")
         task_stats_list = self._paginate(url, params)
-        return [TaskStats(task_stat, self) for task_stat in task_stats_list]  # type: ignore[arg-type]
+        model_cls = self._model_class(TaskStats)
+        return [model_cls(task_stat, self) for task_stat in task_stats_list]  # type: ignore[arg-type]
+
+    def iter_task_stats_by_project(
+        self,
+        project_id: str,
+        after_date: datetime,
+        before_date: datetime,
+        group_num_days: Optional[int] = None,
+        requesters: Optional[Requester] = None,
+        tasks: Optional[List[str]] = None,
+        variants: Optional[List[str]] = None,
+        distros: Optional[List[str]] = None,
+        group_by: Optional[str] = None,
+        sort: Optional[str] = None,
+    ) -> Iterator[TaskStats]:
+        """
+        Generate the task stats of a project, a page at a time.
+
+        :param project_id: Id of project to query for.
+        :param after_date: Collect stats after this date.
+        :param before_date: Collect stats before this date.
+        :param group_num_days: Aggregate statistics to this size.
+        :param requesters: Filter by requestors (mainline, patch, trigger, or adhoc).
+        :param tasks: Only include specified tasks.
+        :param variants: Only include specified variants.
+        :param distros: Only include specified distros.
+        :param group_by: How to group results (task_variant, task).
+        :param sort: How to sort results (earliest or latest).
+        :return: Generator of task stats.
+        """
+        params = _stats_params(
+            after_date,
+            before_date,
+            group_num_days,
+            requesters,
+            tasks,
+            variants,
+            distros,
+            group_by,
+            sort,
+        )
+        url = self._create_url(f"/projects/{project_id}/task_stats")
+        model_cls = self._model_class(TaskStats)
+        return (model_cls(task_stat, self) for task_stat in self._lazy_paginate(url, params))
 
     def task_reliability_by_project(
         self,
@@ -961,16 +1999,23 @@ class EvergreenApi(object):
         :return: Build queried for.
         """
         url = self._create_url(f"/builds/{build_id}")
-        return Build(self._paginate(url), self)  # type: ignore[arg-type]
+        # Restarting a task puts a completed build back into an active state, so it is always
+        # queried.
+        build_json = self._paginate(url)
+        return self._model_class(Build)(build_json, self)  # type: ignore[arg-type]
 
     def tasks_by_build(
-        self, build_id: str, fetch_all_executions: Optional[bool] = None
+        self,
+        build_id: str,
+        fetch_all_executions: Optional[bool] = None,
+        fields: Optional[Collection[str]] = None,
     ) -> List[Task]:
         """
         Get all tasks for a given build.
 
         :param build_id: build_id to query.
         :param fetch_all_executions: Fetch all executions for a given task.
+        :param fields: Only keep these fields of each task, to reduce memory use.
         :return: List of tasks for the specified build.
         """
         params = {}
@@ -978,8 +2023,27 @@ class EvergreenApi(object):
             params["fetch_all_executions"] = 1
 
         url = self._create_url(f"/builds/{build_id}/tasks")
-        task_list = self._paginate(url, params)
-        return [Task(task, self) for task in task_list]  # type: ignore[arg-type]
+        task_list = self._paginate(url, params, fields)
+        return [self._model_class(Task)(task, self) for task in task_list]  # type: ignore[arg-type]
+
+    def iter_tasks_by_build(
+        self,
+        build_id: str,
+        fetch_all_executions: Optional[bool] = None,
+        fields: Optional[Collection[str]] = None,
+    ) -> Iterator[Task]:
+        """
+        Generate the tasks of a build, a page at a time.
+
+        :param build_id: build_id to query.
+        :param fetch_all_executions: Fetch all executions for a given task.
+        :param fields: Only keep these fields of each task, to reduce memory use.
+        :return: Generator of the tasks of the build.
+        """
+        params = {"fetch_all_executions": 1} if fetch_all_executions else None
+        url = self._create_url(f"/builds/{build_id}/tasks")
+        model_cls = self._model_class(Task)
+        return (model_cls(task, self) for task in self._lazy_paginate(url, params, fields=fields))
 
     def version_by_id(self, version_id: str) -> Version:
         """
@@ -989,19 +2053,47 @@ class EvergreenApi(object):
         :return: Version queried for.
         """
         url = self._create_url(f"/versions/{version_id}")
-        return Version(self._paginate(url), self)  # type: ignore[arg-type]
+        # Restarting a task puts a completed version back into an active state, so it is always
+        # queried.
+        version_json = self._paginate(url)
+        return Version(version_json, self)  # type: ignore[arg-type]
 
-    def builds_by_version(self, version_id: str, params: Optional[Dict] = None) -> List[Build]:
+    def builds_by_version(
+        self,
+        version_id: str,
+        params: Optional[Dict] = None,
+        fields: Optional[Collection[str]] = None,
+    ) -> List[Build]:
         """
         Get all builds for a given Evergreen version_id.
 
         :param version_id: Version Id to query for.
         :param params: Dictionary of parameters to pass to query.
+        :param fields: Only keep these fields of each build, to reduce memory use.
         :return: List of builds for the specified version.
         """
         url = self._create_url(f"/versions/{version_id}/builds")
-        build_list = self._paginate(url, params)
-        return [Build(build, self) for build in build_list]  # type: ignore[arg-type]
+        build_list = self._paginate(url, params, fields)
+        model_cls = self._model_class(Build)
+        return [model_cls(build, self) for build in build_list]  # type: ignore[arg-type]
+
+    def iter_builds_by_version(
+        self,
+        version_id: str,
+        params: Optional[Dict] = None,
+        fields: Optional[Collection[str]] = None,
+    ) -> Iterator[Build]:
+        """
+        Generate the builds of a version, a page at a time.
+
+        :param version_id: Version Id to query for.
+        :param params: Dictionary of parameters to pass to query.
+        :param fields: Only keep these fields of each build, to reduce memory use.
+        :return: Generator of the builds of the version.
+        """
+        url = self._create_url(f"/versions/{version_id}/builds")
+        model_cls = self._model_class(Build)
+        return (model_cls(build, self) for build in self._lazy_paginate(url, params, fields=fields))
 
     def patch_by_id(self, patch_id: str, params: Optional[Dict] = None) -> Patch:
         """
@@ -1012,7 +2104,7 @@ class EvergreenApi(object):
         :return: Patch queried for.
         """
         url = self._create_url(f"/patches/{patch_id}")
-        return Patch(self._call_api(url, params).json(), self)  # type: ignore[arg-type]
+        return Patch(self._decode_json(self._call_api(url, params)), self)  # type: ignore[arg-type]
 
     def get_patch_diff(self, patch_id: str, module: str = "") -> str:
         """
@@ -1165,6 +2257,7 @@ class EvergreenApi(object):
         task_id: str,
         fetch_all_executions: Optional[bool] = None,
         execution: Optional[int] = None,
+        fields: Optional[Collection[str]] = None,
     ) -> Task:
         """
         Get a task by task_id.
@@ -1172,6 +2265,7 @@ class EvergreenApi(object):
         :param task_id: Id of task to query for.
         :param execution: Will query for a specific task execution
         :param fetch_all_executions: Should all executions of the task be fetched.
+        :param fields: Only keep these fields of the task, to reduce memory use.
         :return: Task queried for.
         """
         params: Dict[str, Any] = {}
@@ -1180,7 +2274,90 @@ class EvergreenApi(object):
         if fetch_all_executions is not None:
             params["fetch_all_executions"] = fetch_all_executions
         url = self._create_url(f"/tasks/{task_id}")
-        return Task(self._call_api(url, params).json(), self)  # type: ignore[arg-type]
+        model_cls = self._model_class(Task)
+        if execution is None:
+            # The latest execution changes when the task is restarted, so it is always queried.
+            task_json = self._decode_json(self._call_api(url, params))
+            self._remember_completed_task(task_json, bool(fetch_all_executions), latest=True)
+        else:
+            task_json = self._immutable_result(
+                ("task", task_id, execution, bool(fetch_all_executions)),
+                lambda: self._decode_json(self._call_api(url, params)),
+                lambda task: self._remember_completed_task(
+                    task, bool(fetch_all_executions), latest=False
+                ),
+            )
+        return model_cls(_select_fields(task_json, fields), self)
+
+    def tasks_by_ids(
+        self,
+        task_ids: Iterable[str],
+        fetch_all_executions: Optional[bool] = None,
+        execution: Optional[int] = None,
+        max_workers: int = DEFAULT_MAX_WORKERS,
+        fields: Optional[Collection[str]] = None,
+    ) -> List[Task]:
+        """
+        Get several tasks by task_id, querying for them concurrently.
+
+        :param task_ids: Ids of tasks to query for.
+        :param fetch_all_executions: Should all executions of the tasks be fetched.
+        :param execution: Will query for a specific task execution.
+        :param max_workers: Maximum number of requests to have in flight at once.
+        :param fields: Only keep these fields of each task, to reduce memory use.
+        :return: Tasks queried for, in the same order as `task_ids`.
+        """
+        task_ids = list(task_ids)
+        if len(task_ids) <= 1 or max_workers <= 1:
+            return [
+                self.task_by_id(task_id, fetch_all_executions, execution, fields)
+                for task_id in task_ids
+            ]
+
+        with ThreadPoolExecutor(max_workers=min(max_workers, len(task_ids))) as executor:
+            return list(
+                executor.map(
+                    lambda task_id: self.task_by_id(
+                        task_id, fetch_all_executions, execution, fields
+                    ),
+                    task_ids,
+                )
+            )
+
+    def download_artifacts(
+        self,
+        tasks: Iterable[Task],
+        directory: str,
+        patterns: Optional[Iterable[str]] = None,
+        max_workers: int = DEFAULT_MAX_WORKERS,
+        parallel_ranges: int = 1,
+        on_progress: Optional[Callable[[ArtifactDownload, int, int], None]] = None,
+    ) -> ArtifactDownloadSummary:
+        """
+        Download the artifacts of several tasks concurrently.
+
+        Each artifact is downloaded to `<directory>/<build variant>/<task name>/<file name>`.
+        Artifacts marked `ignore_for_fetch` or not matching any of the patterns are skipped and
+        artifacts sharing a url are downloaded once.
+
+        :param tasks: Tasks to download the artifacts of.
+        :param directory: Directory to download the artifacts to.
+        :param patterns: Glob patterns matched against the name of each artifact and the name of
+            its file, None to download all artifacts.
+        :param max_workers: Maximum number of artifacts to download at once.
+        :param parallel_ranges: Maximum number of ranges of each artifact to download at once.
+        :param on_progress: Function called with the outcome of each download, the number of
+            downloads completed and the total number of downloads.
+        :return: Summary of the downloads, including the ones that failed.
+        """
+        return download_task_artifacts(
+            lambda url, path: self._download_file(url, path, parallel_ranges=parallel_ranges),
+            tasks,
+            directory,
+            patterns=patterns,
+            max_workers=max_workers,
+            on_progress=on_progress,
+        )
 
     def tests_by_task(
         self,
@@ -1198,15 +2375,43 @@ class EvergreenApi(object):
         :param test_name: Limit results to given test name.
         :return: List of tests for the specified task.
         """
-        params: Dict[str, Any] = {}
-        if status is not None:
-            params["status"] = status
-        if execution is not None:
-            params["execution"] = execution
-        if test_name is not None:
-            params["test_name"] = test_name
+        params = _tests_params(status, execution, test_name)
+        url = self._create_url(f"/tasks/{task_id}/tests")
+        model_cls = self._model_class(Tst)
+        tests: Any
+        if execution is None:
+            # The execution the server resolves is not known, so the results cannot be cached.
+            tests = self._paginate(url, params)
+        else:
+            tests = self._immutable_result(
+                ("tests", task_id, execution, status, test_name),
+                lambda: self._paginate(url, params),
+                lambda _: self._is_task_completed(task_id, execution),
+            )
+        return [model_cls(test, self) for test in tests]
+
+    def iter_tests_by_task(
+        self,
+        task_id: str,
+        status: Optional[str] = None,
+        execution: Optional[int] = None,
+        test_name: Optional[str] = None,
+    ) -> Iterator[Tst]:
+        """
+        Generate the tests of a task, a page at a time.
+
+        Results are always queried, the object cache is not used.
+
+        :param task_id: Id of task to query for.
+        :param status: Limit results to given status.
+        :param execution: Retrieve the specified task execution (defaults to 0).
+        :param test_name: Limit results to given test name.
+        :return: Generator of the tests of the task.
+        """
         url = self._create_url(f"/tasks/{task_id}/tests")
-        return [Tst(test, self) for test in self._paginate(url, params)]  # type: ignore[arg-type]
+        model_cls = self._model_class(Tst)
+        params = _tests_params(status, execution, test_name)
+        return (model_cls(test, self) for test in self._lazy_paginate(url, params))
 
     def single_test_by_task_and_test_file(self, task_id: str, test_file: str) -> List[Tst]:
         """
@@ -1218,7 +2423,10 @@ class EvergreenApi(object):
         """
         url = self._create_url(f"/tasks/{task_id}/tests")
         param = {"test_name": test_file}
-        return [Tst(test, self) for test in self._call_api(url, params=param).json()]
+        return [
+            self._model_class(Tst)(test, self)
+            for test in self._decode_json(self._call_api(url, params=param))
+        ]
 
     def num_of_tests_by_task(self, task_id: str) -> int:
         """
@@ -1241,7 +2449,11 @@ class EvergreenApi(object):
 
         manifest: Optional[Manifest] = None
         try:
-            manifest = Manifest(self._call_api(url).json(), self)  # type: ignore[arg-type]
+            # Manifests are created with their version and never change.
+            manifest_json = self._immutable_result(
+                ("manifest", task_id), lambda: self._decode_json(self._call_api(url)), bool
+            )
+            manifest = Manifest(manifest_json, self)
         except HTTPError as e:
             if e.response.status_code != HTTPStatus.NOT_FOUND:
                 raise e
@@ -1272,10 +2484,10 @@ class EvergreenApi(object):
         if fetch_all_executions is not None:
             params["fetch_all_executions"] = fetch_all_executions
 
-        response = self._call_api(url, params)
-        if response.text.strip() == "null":
+        annotations = self._decode_json(self._call_api(url, params))
+        if annotations is None:
             return []
-        return [TaskAnnotation(annotation, self) for annotation in response.json()]
+        return [TaskAnnotation(annotation, self) for annotation in annotations]
 
     def file_ticket_for_task(
         self, task_id: str, execution: int, ticket_link: str, ticket_key: str
@@ -1349,7 +2561,19 @@ class EvergreenApi(object):
         :return: Contents of 'perf.json'
         """
         url = self._create_plugin_url(f"/task/{task_id}/perf")
-        return PerformanceData(self._paginate(url), self)  # type: ignore[arg-type]
+        execution = self._latest_completed_execution(task_id)
+        perf_json: Any
+        if execution is None:
+            perf_json = self._paginate(url)
+        else:
+            # Keyed by execution, so the results of a restarted task are queried again once the
+            # restart has been seen.
+            perf_json = self._immutable_result(
+                ("performance_results", task_id, execution),
+                lambda: self._paginate(url),
+                lambda _: self._latest_completed_execution(task_id) == execution,
+            )
+        return PerformanceData(perf_json, self)
 
     def performance_results_by_task_name(
         self, task_id: str, task_name: str
@@ -1407,7 +2631,7 @@ class EvergreenApi(object):
         :return: Manifest of the given revision of the given project.
         """
         url = self._create_old_url(f"plugin/manifest/get/{project_id}/{revision}")
-        return Manifest(self._call_api(url).json(), self)  # type: ignore[arg-type]
+        return Manifest(self._decode_json(self._call_api(url)), self)  # type: ignore[arg-type]
 
     def retrieve_task_log(self, log_url: str, raw: bool = False) -> str:
         """
@@ -1422,15 +2646,87 @@ class EvergreenApi(object):
             params["text"] = "true"
         return self._call_api(log_url, params=params).text
 
-    def stream_log(self, log_url: str) -> Iterable:
+    def stream_log(
+        self,
+        log_url: str,
+        follow: bool = False,
+        is_completed: Optional[Callable[[], bool]] = None,
+        min_poll_interval: float = DEFAULT_MIN_POLL_INTERVAL_SEC,
+        max_poll_interval: float = DEFAULT_MAX_POLL_INTERVAL_SEC,
+    ) -> Iterable:
         """
         Stream the given log url as a python generator.
 
+        In follow mode the log is polled for the lines added since the previous poll, with polls
+        further apart while the log is not growing, until `is_completed` returns True.
+
         :param log_url: URL of log file to stream.
+        :param follow: Keep streaming the lines added to the log of a running task.
+        :param is_completed: Function determining whether the task writing the log has completed,
+            None to follow the log until the caller stops iterating.
+        :param min_poll_interval: Number of seconds between polls while the log is growing.
+        :param max_poll_interval: Longest number of seconds between polls.
         :return: Iterable for contents of log_url.
         """
         params = {"text": "true"}
-        return self._stream_api(log_url, params)
+        if not follow:
+            return self._stream_api(log_url, params)
+        follower = LogFollower(
+            lambda url, headers: self._open_stream(url, params, headers),
+            log_url,
+            is_completed,
+            min_poll_interval=min_poll_interval,
+            max_poll_interval=max_poll_interval,
+        )
+        return iter(follower)
+
+    def _iter_log_chunks(self, log_url: str) -> Iterator[bytes]:
+        """
+        Stream the raw bytes of a log.
+
+        :param log_url: URL of the log.
+        :return: Iterator of chunks of the log. Closing it before the end closes the response.
+        """
+        response = self._open_stream(log_url, {"text": "true"})
+        try:
+            yield from response.iter_content(chunk_size=DEFAULT_DOWNLOAD_CHUNK_SIZE)
+        finally:
+            response.close()
+
+    def grep_task_logs(
+        self,
+        tasks: Iterable[Task],
+        patterns: Iterable[str],
+        log_name: str = DEFAULT_GREP_LOG_NAME,
+        first_match_only: bool = False,
+        ignore_case: bool = False,
+        max_workers: int = DEFAULT_MAX_WORKERS,
+        on_result: Optional[Callable[[TaskLogMatches], None]] = None,
+    ) -> List[TaskLogMatches]:
+        """
+        Search the logs of several tasks for regular expressions concurrently.
+
+        The patterns are compiled once and each log is searched as it is streamed. A log that
+        cannot be read is reported with its error instead of stopping the search.
+
+        :param tasks: Tasks to search the logs of.
+        :param patterns: Regular expressions to search for.
+        :param log_name: Name of the log of each task to search, e.g. 'task_log' or 'all_log'.
+        :param first_match_only: Stop reading the log of a task at its first match.
+        :param ignore_case: Match the patterns without regard to case.
+        :param max_workers: Maximum number of logs to search at once.
+        :param on_result: Function called with the matches of each task as its search completes.
+        :return: Matches in the log of each task, in the same order as the tasks.
+        """
+        return search_task_logs(
+            self._iter_log_chunks,
+            tasks,
+            compile_patterns(patterns, ignore_case),
+            log_name=log_name,
+            first_match_only=first_match_only,
+            max_workers=max_workers,
+            on_result=on_result,
+        )
 
     def get_project_alias_ids_by_name(self, project_id: str, alias_name: str) -> list[str]:
         """
@@ -1441,7 +2737,7 @@ class EvergreenApi(object):
         :return: List of ids for the given alias name.
         """
         url = self._create_url(f"/alias/{project_id}")
-        response = self._call_api(url).json()
+        response = self._decode_json(self._call_api(url))
         return [alias["_id"] for alias in response if alias["alias"] == alias_name]
 
     def delete_project_aliases(self, project_id: str, alias_ids: list[str]) -> None:
@@ -1495,7 +2791,7 @@ class EvergreenApi(object):
         :return: List of permissions the user has.
         """
         url = self._create_url(f"/users/{user_id}/permissions")
-        raw_permissions = self._call_api(url).json()
+        raw_permissions = self._decode_json(self._call_api(url))
         return [ResourceTypePermissions(r, self) for r in raw_permissions]
 
     def give_permissions_to_user(
@@ -1562,7 +2858,7 @@ class EvergreenApi(object):
         :param role: Role to fetch users for.
         """
         url = self._create_url(f"/roles/{role}/users")
-        return UsersForRole(self._call_api(url, method="GET").json(), self)
+        return UsersForRole(self._decode_json(self._call_api(url, method="GET")), self)
 
     def all_user_permissions_for_resource(
         self, resource_id: str, resource_type: PermissionableResourceType
@@ -1590,9 +2886,11 @@ class EvergreenApi(object):
         :return: A dict containing user to permissions mappings.
         """
         url = self._create_url("/permissions/users")
-        return self._call_api(
-            url, data=json.dumps({"resource_id": resource_id, "resource_type": resource_type})
-        ).json()
+        return self._decode_json(
+            self._call_api(
+                url, data=json.dumps({"resource_id": resource_id, "resource_type": resource_type})
+            )
+        )
 
     def select_tests(
         self,
@@ -1626,7 +2924,7 @@ class EvergreenApi(object):
             "tests": tests,
             "strategies": strategies,
         }
-        return self._call_api(url, method="POST", data=json.dumps(data)).json()
+        return self._decode_json(self._call_api(url, method="POST", data=json.dumps(data)))
 
     @classmethod
     def get_api(
@@ -1636,6 +2934,8 @@ class EvergreenApi(object):
         config_file: Optional[str] = None,
         timeout: Optional[int] = DEFAULT_NETWORK_TIMEOUT_SEC,
         log_on_error: bool = False,
+        json_codec: Optional[JsonCodec] = None,
+        http_cache: Optional[HttpCache] = None,
     ) -> "EvergreenApi":
         """
         Get an evergreen api instance based on config file settings.
@@ -1646,6 +2946,8 @@ class EvergreenApi(object):
         :param timeout: Network timeout.
         :return: EvergreenApi instance.
         :param log_on_error: Flag to use for error logs.
+        :param json_codec: Codec used to decode responses.
+        :param http_cache: Persistent cache to store responses in.
         """
         kwargs = EvergreenApi._setup_kwargs(
             timeout=timeout,
@@ -1654,6 +2956,10 @@ class EvergreenApi(object):
             config_file=config_file,
             log_on_error=log_on_error,
         )
+        if json_codec is not None:
+            kwargs["json_codec"] = json_codec
+        if http_cache is not None:
+            kwargs["http_cache"] = http_cache
         return cls(**kwargs)
 
     @staticmethod
@@ -1705,56 +3011,145 @@ class CachedEvergreenApi(EvergreenApi):
         timeout: Optional[int] = None,
         log_on_error: bool = False,
         oidc_config: Optional[OidcConfig] = None,
+        pool_connections: int = DEFAULT_POOL_CONNECTIONS,
+        pool_maxsize: int = DEFAULT_POOL_MAXSIZE,
+        prefetch_pages: int = 0,
+        json_codec: Optional[JsonCodec] = None,
+        log_response_body_size: int = 0,
+        slow_request_threshold_sec: float = DEFAULT_SLOW_REQUEST_THRESHOLD_SEC,
+        on_request_timing: Optional[Callable[[RequestTiming], None]] = None,
+        compact_models: bool = False,
+        http_cache: Optional[HttpCache] = None,
+        object_cache: Optional[TtlCache] = None,
+        coalesce_requests: bool = True,
+        stream_json_pages: bool = False,
+        rate_limiter: Optional[RateLimiter] = None,
+        cache_size: int = CACHE_SIZE,
+        cache_ttls: Optional[Dict[str, CacheTtl]] = None,
     ) -> None:
-        """Create an Evergreen Api object."""
+        """
+        Create an Evergreen Api object.
+
+        Results of completed builds, versions and tasks are cached until they are evicted, results
+        of active ones expire after a short time.
+
+        :param cache_size: Maximum number of results to cache.
+        :param cache_ttls: Time to live of cached results by endpoint name ('build_by_id',
+            'version_by_id' or 'tasks_by_build'), overriding `DEFAULT_CACHE_TTL`.
+        """
+        self._cache = TtlCache(cache_size)
+        self._cache_ttls = dict(cache_ttls or {})
         super(CachedEvergreenApi, self).__init__(
-            api_server, auth, timeout, log_on_error=log_on_error, oidc_config=oidc_config
+            api_server,
+            auth,
+            timeout,
+            log_on_error=log_on_error,
+            oidc_config=oidc_config,
+            pool_connections=pool_connections,
+            pool_maxsize=pool_maxsize,
+            prefetch_pages=prefetch_pages,
+            json_codec=json_codec,
+            log_response_body_size=log_response_body_size,
+            slow_request_threshold_sec=slow_request_threshold_sec,
+            on_request_timing=on_request_timing,
+            compact_models=compact_models,
+            http_cache=http_cache,
+            object_cache=object_cache,
+            coalesce_requests=coalesce_requests,
+            stream_json_pages=stream_json_pages,
+            rate_limiter=rate_limiter,
         )
 
-    @lru_cache(maxsize=CACHE_SIZE)  # noqa: B019
-    def build_by_id(self, build_id: str) -> Build:  # type: ignore[override]
+    def build_by_id(self, build_id: str) -> Build:
         """
         Get a build by id.
 
         :param build_id: build id to query.
         :return: Build queried for.
         """
-        return super(CachedEvergreenApi, self).build_by_id(build_id)
+        return self._cached(
+            "build_by_id",
+            (build_id,),
+            lambda: super(CachedEvergreenApi, self).build_by_id(build_id),
+            lambda build: build.is_completed(),
+        )
 
-    @lru_cache(maxsize=CACHE_SIZE)  # noqa: B019
-    def version_by_id(self, version_id: str) -> Version:  # type: ignore[override]
+    def version_by_id(self, version_id: str) -> Version:
         """
         Get version by version id.
 
         :param version_id: Id of version to query.
         :return: Version queried for.
         """
-        return super(CachedEvergreenApi, self).version_by_id(version_id)
+        return self._cached(
+            "version_by_id",
+            (version_id,),
+            lambda: super(CachedEvergreenApi, self).version_by_id(version_id),
+            lambda version: version.is_completed(),
+        )
 
-    @lru_cache(maxsize=CACHE_SIZE)  # noqa: B019
     def tasks_by_build(
-        self, build_id: str, fetch_all_executions: Optional[bool] = None
+        self,
+        build_id: str,
+        fetch_all_executions: Optional[bool] = None,
+        fields: Optional[Collection[str]] = None,
     ) -> List[Task]:
         """
         Get tasks by build.
 
         :param build_id: Id of build to query.
         :param fetch_all_executions: should fetch all executions of the tasks
+        :param fields: Only keep these fields of each task, to reduce memory use.
         :return: List of the queried tasks.
         """
-        return super(CachedEvergreenApi, self).tasks_by_build(
-            build_id=build_id, fetch_all_executions=fetch_all_executions
+        return self._cached(
+            "tasks_by_build",
+            (build_id, fetch_all_executions, tuple(fields) if fields is not None else None),
+            lambda: super(CachedEvergreenApi, self).tasks_by_build(
+                build_id=build_id, fetch_all_executions=fetch_all_executions, fields=fields
+            ),
+            # A build listed before its tasks are created has no tasks, it is not completed.
+            lambda tasks: bool(tasks) and all(task.is_completed() for task in tasks),
+        )
+
+    def _cached(
+        self,
+        endpoint: str,
+        key: Tuple[Any, ...],
+        query_fn: Callable[[], CachedType],
+        is_completed_fn: Callable[[CachedType], bool],
+    ) -> CachedType:
+        """
+        Get the result of a call from the cache, querying the API if it is not cached.
+
+        :param endpoint: Name of the endpoint being called.
+        :param key: Arguments of the call.
+        :param query_fn: Function to query the API with.
+        :param is_completed_fn: Function to determine if the result has completed running.
+        :return: Result of the call.
+        """
+        found, result = self._cache.get((endpoint,) + key)
+        if found:
+            return result
+
+        result = query_fn()
+        ttl = self._cache_ttls.get(endpoint, DEFAULT_CACHE_TTL)
+        self._cache.put(
+            (endpoint,) + key, result, ttl.completed if is_completed_fn(result) else ttl.active
         )
+        return result
+
+    def cache_stats(self) -> CacheStats:
+        """
+        Get usage statistics of the cache.
+
+        :return: Statistics of the cache.
+        """
+        return self._cache.stats()
 
     def clear_caches(self) -> None:
         """Clear the cache."""
-        cached_functions = [
-            self.build_by_id,
-            self.version_by_id,
-            self.tasks_by_build,
-        ]
-        for fn in cached_functions:
-            fn.cache_clear()  # type: ignore[attr-defined]
+        self._cache.clear()
 
 
 class RetryingEvergreenApi(EvergreenApi):
@@ -1787,9 +3182,22 @@ class RetryingEvergreenApi(EvergreenApi):
         use_default_logger_factory: bool = True,
         http_retry: Retry = DEFAULT_HTTP_RETRY,
         oidc_config: Optional[OidcConfig] = None,
+        pool_connections: int = DEFAULT_POOL_CONNECTIONS,
+        pool_maxsize: int = DEFAULT_POOL_MAXSIZE,
+        prefetch_pages: int = 0,
+        json_codec: Optional[JsonCodec] = None,
+        log_response_body_size: int = 0,
+        slow_request_threshold_sec: float = DEFAULT_SLOW_REQUEST_THRESHOLD_SEC,
+        on_request_timing: Optional[Callable[[RequestTiming], None]] = None,
+        compact_models: bool = False,
+        http_cache: Optional[HttpCache] = None,
+        object_cache: Optional[TtlCache] = None,
+        coalesce_requests: bool = True,
+        stream_json_pages: bool = False,
+        rate_limiter: Optional[RateLimiter] = None,
     ) -> None:
         """Create an Evergreen Api object."""
-        sticky_session_with_retry = EvergreenApi(
+        super(RetryingEvergreenApi, self).__init__(
             api_server,
             auth,
             timeout,
@@ -1797,15 +3205,519 @@ class RetryingEvergreenApi(EvergreenApi):
             use_default_logger_factory=use_default_logger_factory,
             http_retry=http_retry,
             oidc_config=oidc_config,
-        )._create_session()
+            pool_connections=pool_connections,
+            pool_maxsize=pool_maxsize,
+            prefetch_pages=prefetch_pages,
+            json_codec=json_codec,
+            log_response_body_size=log_response_body_size,
+            slow_request_threshold_sec=slow_request_threshold_sec,
+            on_request_timing=on_request_timing,
+            compact_models=compact_models,
+            http_cache=http_cache,
+            object_cache=object_cache,
+            coalesce_requests=coalesce_requests,
+            stream_json_pages=stream_json_pages,
+            rate_limiter=rate_limiter,
+        )
 
-        super(RetryingEvergreenApi, self).__init__(
+
+class AsyncEvergreenApi(object):
+    """
+    Asynchronous access to the read endpoints of the Evergreen API.
+
+    Requests are made over a single pooled ``httpx.AsyncClient``. Model objects are created with a
+    synchronous ``EvergreenApi`` sharing this client's configuration, so their helper methods
+    (e.g. ``Task.get_tests``) keep working, but block.
+    """
+
+    def __init__(
+        self,
+        api_server: str = DEFAULT_API_SERVER,
+        auth: Optional[EvgAuth] = None,
+        timeout: Optional[int] = None,
+        log_on_error: bool = False,
+        use_default_logger_factory: bool = True,
+        oidc_config: Optional[OidcConfig] = None,
+        max_connections: int = DEFAULT_POOL_MAXSIZE,
+        client: Optional["httpx.AsyncClient"] = None,
+        json_codec: Optional[JsonCodec] = None,
+        slow_request_threshold_sec: float = DEFAULT_SLOW_REQUEST_THRESHOLD_SEC,
+        on_request_timing: Optional[Callable[[RequestTiming], None]] = None,
+        compact_models: bool = False,
+    ) -> None:
+        """
+        Create an AsyncEvergreenApi object.
+
+        :param api_server: URI of Evergreen API server.
+        :param auth: EvgAuth object with auth information.
+        :param timeout: Time (in sec) to wait before considering a call as failed.
+        :param log_on_error: Flag to use for error logs.
+        :param use_default_logger_factory: Indicate if the module should configure the default logger factory.
+        :param oidc_config: Optional OidcConfig for OIDC authentication.
+        :param max_connections: Maximum number of concurrent connections to the API server.
+        :param client: Async http client to use for requests.
+        :param json_codec: Codec used to decode responses, defaults to the standard library json
+            module.
+        :param slow_request_threshold_sec: Requests taking longer than this are logged at info
+            level instead of debug.
+        :param on_request_timing: Function called with the timing record of each request.
+        :param compact_models: Return compact versions of Task, Build and Tst objects.
+        """
+        if httpx is None:
+            raise ImportError("AsyncEvergreenApi requires httpx, install 'evergreen.py[async]'")
+
+        self._timeout = timeout
+        self._log_on_error = log_on_error
+        self._max_connections = max_connections
+        self._client = client
+        self._evg_api = EvergreenApi(
             api_server,
             auth,
             timeout,
-            sticky_session_with_retry,
-            log_on_error,
-            use_default_logger_factory,
-            http_retry,
-            oidc_config,
+            log_on_error=log_on_error,
+            use_default_logger_factory=use_default_logger_factory,
+            oidc_config=oidc_config,
+            pool_maxsize=max_connections,
+            json_codec=json_codec,
+            slow_request_threshold_sec=slow_request_threshold_sec,
+            on_request_timing=on_request_timing,
+            compact_models=compact_models,
+        )
+
+    async def __aenter__(self) -> "AsyncEvergreenApi":
+        """Enter the async context of the client."""
+        return self
+
+    async def __aexit__(self, *args: Any) -> None:
+        """Close the client when leaving the async context."""
+        await self.aclose()
+
+    @property
+    def client(self) -> "httpx.AsyncClient":
+        """
+        Get the async http client, creating it on first use.
+
+        :return: Client to query the API with.
+        """
+        if self._client is None:
+            self._client = httpx.AsyncClient(
+                headers=self._evg_api._auth_headers(),
+                timeout=self._timeout,
+                limits=httpx.Limits(
+                    max_connections=self._max_connections,
+                    max_keepalive_connections=self._max_connections,
+                ),
+            )
+        return self._client
+
+    async def aclose(self) -> None:
+        """Close the async http client and release its connections."""
+        if self._client is not None:
+            await self._client.aclose()
+            self._client = None
+        self._evg_api.close()
+
+    async def _call_api(self, url: str, params: Optional[Dict] = None) -> "httpx.Response":
+        """
+        Make a GET call to the evergreen api.
+
+        :param url: Url of call to make.
+        :param params: parameters to pass to api.
+        :return: response from api server.
+        """
+        start_time = time()
+        if _is_log_enabled(logging.DEBUG):
+            LOGGER.debug("Request to be sent", url=url, params=params, timeout=self._timeout)
+
+        if self._evg_api._oidc_token_manager:
+            self.client.headers.update(self._evg_api._auth_headers())
+
+        response = await self.client.get(url, params=params)
+
+        self._evg_api._record_request_timing(
+            "GET",
+            str(response.request.url),
+            response.status_code,
+            start_time,
+            len(response.content),
         )
+
+        self._raise_for_status(response)
+        return response
+
+    def _decode_json(self, response: "httpx.Response") -> Any:
+        """
+        Decode the json body of a response with the configured codec.
+
+        :param response: Response from evergreen api.
+        :return: Decoded body of the response.
+        """
+        return self._evg_api.json_codec.loads(response.content)
+
+    def _raise_for_status(self, response: "httpx.Response") -> None:
+        """
+        Raise an exception with the evergreen message if it exists.
+
+        :param response: response from evergreen api.
+        """
+        if response.status_code >= 400:
+            try:
+                json_data = self._decode_json(response)
+            except ValueError:
+                json_data = None
+            if isinstance(json_data, dict) and "error" in json_data:
+                if self._log_on_error:
+                    LOGGER.error(
+                        "Error found in json",
+                        request_url=str(response.request.url),
+                        response_status_code=response.status_code,
+                        response_text=response.text,
+                    )
+                raise httpx.HTTPStatusError(
+                    json_data["error"], request=response.request, response=response
+                )
+
+        response.raise_for_status()
+
+    async def _paginate(
+        self, url: str, params: Optional[Dict] = None
+    ) -> Union[List[Dict[str, Any]], Dict[str, Any]]:
+        """
+        Paginate until all results are returned and return a list of all JSON results.
+
+        :param url: url to make request to.
+        :param params: parameters to pass to request.
+        :return: json list of all results.
+        """
+        response = await self._call_api(url, params)
+        json_data = self._decode_json(response)
+        while "next" in response.links:
+            if params and "limit" in params and len(json_data) >= params["limit"]:
+                break
+            response = await self._call_api(response.links["next"]["url"])
+            next_page = self._decode_json(response)
+            if next_page:
+                json_data.extend(next_page)
+
+        return json_data
+
+    async def _lazy_paginate(self, url: str, params: Optional[Dict] = None) -> AsyncIterator:
+        """
+        Lazy paginate, the results are returned lazily.
+
+        :param url: URL to query.
+        :param params: Params to pass to url.
+        :return: An async generator to get results from.
+        """
+        if not params:
+            params = {
+                "limit": DEFAULT_LIMIT,
+            }
+
+        next_url = url
+        while True:
+            response = await self._call_api(next_url, params)
+            json_response = self._decode_json(response)
+            if not json_response:
+                break
+            for result in json_response:
+                yield result
+            if "next" not in response.links:
+                break
+
+            next_url = response.links["next"]["url"]
+
+    async def _lazy_paginate_by_date(
+        self, url: str, params: Optional[Dict] = None
+    ) -> AsyncIterator:
+        """
+        Paginate based on date, the results are returned lazily.
+
+        :param url: URL to query.
+        :param params: Params to pass to url.
+        :return: An async generator to get results from.
+        """
+        if not params:
+            params = {
+                "limit": DEFAULT_LIMIT,
+            }
+
+        while True:
+            data = self._decode_json(await self._call_api(url, params))
+            if not data:
+                break
+            for result in data:
+                yield result
+            params["start_at"] = evergreen_input_to_output(data[-1]["create_time"])
+
+    async def task_by_id(
+        self,
+        task_id: str,
+        fetch_all_executions: Optional[bool] = None,
+        execution: Optional[int] = None,
+    ) -> Task:
+        """
+        Get a task by task_id.
+
+        :param task_id: Id of task to query for.
+        :param execution: Will query for a specific task execution
+        :param fetch_all_executions: Should all executions of the task be fetched.
+        :return: Task queried for.
+        """
+        params: Dict[str, Any] = {}
+        if execution is not None:
+            params["execution"] = execution
+        if fetch_all_executions is not None:
+            params["fetch_all_executions"] = fetch_all_executions
+        url = self._evg_api._create_url(f"/tasks/{task_id}")
+        response = await self._call_api(url, params)
+        return self._evg_api._model_class(Task)(self._decode_json(response), self._evg_api)
+
+    async def tasks_by_build(
+        self, build_id: str, fetch_all_executions: Optional[bool] = None
+    ) -> List[Task]:
+        """
+        Get all tasks for a given build.
+
+        :param build_id: build_id to query.
+        :param fetch_all_executions: Fetch all executions for a given task.
+        :return: List of tasks for the specified build.
+        """
+        params = {}
+        if fetch_all_executions:
+            params["fetch_all_executions"] = 1
+
+        url = self._evg_api._create_url(f"/builds/{build_id}/tasks")
+        task_list = await self._paginate(url, params)
+        model_cls = self._evg_api._model_class(Task)
+        return [model_cls(task, self._evg_api) for task in task_list]  # type: ignore[arg-type]
+
+    async def build_by_id(self, build_id: str) -> Build:
+        """
+        Get a build by id.
+
+        :param build_id: build id to query.
+        :return: Build queried for.
+        """
+        url = self._evg_api._create_url(f"/builds/{build_id}")
+        model_cls = self._evg_api._model_class(Build)
+        return model_cls(await self._paginate(url), self._evg_api)  # type: ignore[arg-type]
+
+    async def builds_by_version(
+        self, version_id: str, params: Optional[Dict] = None
+    ) -> List[Build]:
+        """
+        Get all builds for a given Evergreen version_id.
+
+        :param version_id: Version Id to query for.
+        :param params: Dictionary of parameters to pass to query.
+        :return: List of builds for the specified version.
+        """
+        url = self._evg_api._create_url(f"/versions/{version_id}/builds")
+        build_list = await self._paginate(url, params)
+        model_cls = self._evg_api._model_class(Build)
+        return [model_cls(build, self._evg_api) for build in build_list]  # type: ignore[arg-type]
+
+    async def version_by_id(self, version_id: str) -> Version:
+        """
+        Get version by version id.
+
+        :param version_id: Id of version to query.
+        :return: Version queried for.
+        """
+        url = self._evg_api._create_url(f"/versions/{version_id}")
+        return Version(await self._paginate(url), self._evg_api)  # type: ignore[arg-type]
+
+    async def tests_by_task(
+        self,
+        task_id: str,
+        status: Optional[str] = None,
+        execution: Optional[int] = None,
+        test_name: Optional[str] = None,
+    ) -> List[Tst]:
+        """
+        Get all tests for a given task.
+
+        :param task_id: Id of task to query for.
+        :param status: Limit results to given status.
+        :param execution: Retrieve the specified task execution (defaults to 0).
+        :param test_name: Limit results to given test name.
+        :return: List of tests for the specified task.
+        """
+        params: Dict[str, Any] = {}
+        if status is not None:
+            params["status"] = status
+        if execution is not None:
+            params["execution"] = execution
+        if test_name is not None:
+            params["test_name"] = test_name
+        url = self._evg_api._create_url(f"/tasks/{task_id}/tests")
+        test_list = await self._paginate(url, params)
+        model_cls = self._evg_api._model_class(Tst)
+        return [model_cls(test, self._evg_api) for test in test_list]  # type: ignore[arg-type]
+
+    async def versions_by_project(
+        self,
+        project_id: str,
+        requester: Requester = Requester.GITTER_REQUEST,
+        start: Optional[int] = None,
+        limit: Optional[int] = None,
+        revision_start: Optional[int] = None,
+        revision_end: Optional[int] = None,
+    ) -> AsyncIterator[Version]:
+        """
+        Get the versions created in the specified project.
+
+        :param project_id: Id of project to query.
+        :param requester: Type of versions to query.
+        :param start: Optional. The revision order number to start after, for pagination.
+        :param limit: Optional. The number of versions to be returned per page of pagination.
+        :param revision_start: Optional. The version order number to start at, for pagination.
+        :param revision_end: Optional. The version order number to end at, for pagination.
+        :return: Async generator of versions.
+        """
+        url = self._evg_api._create_url(f"/projects/{project_id}/versions")
+        params: Dict[str, Any] = {"requester": requester.evg_value()}
+        if start is not None:
+            params["start"] = start
+        if limit is not None:
+            params["limit"] = limit
+        if revision_start is not None:
+            params["revision_start"] = revision_start
+        if revision_end is not None:
+            params["revision_end"] = revision_end
+        async for version in self._lazy_paginate(url, params):
+            yield Version(version, self._evg_api)
+
+    async def patches_by_project(
+        self, project_id: str, params: Optional[Dict] = None
+    ) -> AsyncIterator[Patch]:
+        """
+        Get the patches for the specified project.
+
+        :param project_id: Id of project to query.
+        :param params: parameters to pass to endpoint.
+        :return: Async generator of recent patches.
+        """
+        url = self._evg_api._create_url(f"/projects/{project_id}/patches")
+        async for patch in self._lazy_paginate_by_date(url, params):
+            yield Patch(patch, self._evg_api)
+
+    async def test_stats_by_project(
+        self,
+        project_id: str,
+        after_date: datetime,
+        before_date: datetime,
+        group_num_days: Optional[int] = None,
+        requesters: Optional[Requester] = None,
+        tests: Optional[List[str]] = None,
+        tasks: Optional[List[str]] = None,
+        variants: Optional[List[str]] = None,
+        distros: Optional[List[str]] = None,
+        group_by: Optional[str] = None,
+        sort: Optional[str] = None,
+    ) -> List[TestStats]:
+        """
+        Get test stats by project id.
+
+        :param project_id: Id of project to query for.
+        :param after_date: Collect stats after this date.
+        :param before_date: Collect stats before this date.
+        :param group_num_days: Aggregate statistics to this size.
+        :param requesters: Filter by requestors (mainline, patch, trigger, or adhoc).
+        :param tests: Only include specified tests.
+        :param tasks: Only include specified tasks.
+        :param variants: Only include specified variants.
+        :param distros: Only include specified distros.
+        :param group_by: How to group results (test_task_variant, test_task, or test)
+        :param sort: How to sort results (earliest or latest).
+        :return: Test stats queried for.
+        """
+        params = _stats_params(
+            after_date,
+            before_date,
+            group_num_days,
+            requesters,
+            tasks,
+            variants,
+            distros,
+            group_by,
+            sort,
+            tests=tests,
+        )
+        url = self._evg_api._create_url(f"/projects/{project_id}/test_stats")
+        test_stats_list = await self._paginate(url, params)
+        model_cls = self._evg_api._model_class(TestStats)
+        return [model_cls(test_stat, self._evg_api) for test_stat in test_stats_list]  # type: ignore[arg-type]
+
+    async def task_stats_by_project(
+        self,
+        project_id: str,
+        after_date: datetime,
+        before_date: datetime,
+        group_num_days: Optional[int] = None,
+        requesters: Optional[Requester] = None,
+        tasks: Optional[List[str]] = None,
+        variants: Optional[List[str]] = None,
+        distros: Optional[List[str]] = None,
+        group_by: Optional[str] = None,
+        sort: Optional[str] = None,
+    ) -> List[TaskStats]:
+        """
+        Get task stats by project id.
+
+        :param project_id: Id of project to query for.
+        :param after_date: Collect stats after this date.
+        :param before_date: Collect stats before this date.
+        :param group_num_days: Aggregate statistics to this size.
+        :param requesters: Filter by requestors (mainline, patch, trigger, or adhoc).
+        :param tasks: Only include specified tasks.
+        :param variants: Only include specified variants.
+        :param distros: Only include specified distros.
+        :param group_by: How to group results (task_variant or task)
+        :param sort: How to sort results (earliest or latest).
+        :return: Task stats queried for.
+        """
+        params = _stats_params(
+            after_date,
+            before_date,
+            group_num_days,
+            requesters,
+            tasks,
+            variants,
+            distros,
+            group_by,
+            sort,
+        )
+        url = self._evg_api._create_url(f"/projects/{project_id}/task_stats")
+        task_stats_list = await self._paginate(url, params)
+        model_cls = self._evg_api._model_class(TaskStats)
+        return [model_cls(task_stat, self._evg_api) for task_stat in task_stats_list]  # type: ignore[arg-type]
+
+    @classmethod
+    def get_api(
+        cls,
+        auth: Optional[EvgAuth] = None,
+        use_config_file: bool = False,
+        config_file: Optional[str] = None,
+        timeout: Optional[int] = DEFAULT_NETWORK_TIMEOUT_SEC,
+        log_on_error: bool = False,
+    ) -> "AsyncEvergreenApi":
+        """
+        Get an async evergreen api instance based on config file settings.
+
+        :param auth: EvgAuth with authentication to use.
+        :param use_config_file: attempt to read auth from default config file.
+        :param config_file: config file with authentication information.
+        :param timeout: Network timeout.
+        :param log_on_error: Flag to use for error logs.
+        :return: AsyncEvergreenApi instance.
+        """
+        kwargs = EvergreenApi._setup_kwargs(
+            timeout=timeout,
+            auth=auth,
+            use_config_file=use_config_file,
+            config_file=config_file,
+            log_on_error=log_on_error,
+        )
+        return cls(**kwargs)
@@ -2,7 +2,9 @@
 """Task representation of evergreen."""
 from __future__ import absolute_import
 
-from typing import TYPE_CHECKING, Any, Callable, Dict, Optional
+import sys
+import threading
+from typing import TYPE_CHECKING, Any, Callable, Dict, Optional, Tuple, Type, TypeVar
 
 from evergreen.util import (
     parse_evergreen_date,
@@ -13,6 +15,37 @@ from evergreen.util import (
 if TYPE_CHECKING:
     from evergreen.api import EvergreenApi
 
+EvgObjectType = TypeVar("EvgObjectType", bound="_BaseEvergreenObject")
+
+_MISSING = object()
+_COMPACT_SLOT_PREFIX = "_evg_"
+_COMPACT_CLASSES: Dict[type, type] = {}
+_COMPACT_CLASSES_LOCK = threading.Lock()
+
+
+class _EvgAttrib(property):
+    """Property reading a field of the json of an evergreen object."""
+
+    def __init__(
+        self,
+        fget: Callable[[Any], Any],
+        attrib_name: str,
+        type_fn: Optional[Callable],
+        cached: bool,
+    ) -> None:
+        """
+        Create a property for the given evergreen field.
+
+        :param fget: getter of the property.
+        :param attrib_name: name of the json field the property reads.
+        :param type_fn: method used to convert the field.
+        :param cached: True if the converted value is cached by the instance.
+        """
+        super(_EvgAttrib, self).__init__(fget, doc=f"value of {attrib_name}")
+        self.attrib_name = attrib_name
+        self.type_fn = type_fn
+        self.cached = cached
+
 
 def evg_attrib(attrib_name: str, type_fn: Optional[Callable] = None) -> property:
     """
@@ -33,7 +66,21 @@ def evg_attrib(attrib_name: str, type_fn: Optional[Callable] = None) -> property
             return type_fn(instance.json[attrib_name])
         return instance.json.get(attrib_name, None)
 
-    return property(attrib_getter, doc=f"value of {attrib_name}")
+    return _EvgAttrib(attrib_getter, attrib_name, type_fn, cached=False)
+
+
+def _evg_parsed_attrib(attrib_name: str, parse_fn: Callable) -> property:
+    """
+    Create an attribute that is parsed on first access and then cached by the instance.
+
+    :param attrib_name: name of attribute.
+    :param parse_fn: method to use to parse the attribute.
+    """
+
+    def attrib_getter(instance: _BaseEvergreenObject) -> Any:
+        return instance._parse_field(attrib_name, parse_fn)
+
+    return _EvgAttrib(attrib_getter, attrib_name, parse_fn, cached=True)
 
 
 def evg_datetime_attrib(attrib_name: str) -> property:
@@ -42,7 +89,7 @@ def evg_datetime_attrib(attrib_name: str) -> property:
 
     :param attrib_name: Name of attribute.
     """
-    return evg_attrib(attrib_name, parse_evergreen_datetime)
+    return _evg_parsed_attrib(attrib_name, parse_evergreen_datetime)
 
 
 def evg_short_datetime_attrib(attrib_name: str) -> property:
@@ -51,7 +98,7 @@ def evg_short_datetime_attrib(attrib_name: str) -> property:
 
     :param attrib_name: Name of attribute.
     """
-    return evg_attrib(attrib_name, parse_evergreen_short_datetime)
+    return _evg_parsed_attrib(attrib_name, parse_evergreen_short_datetime)
 
 
 def evg_date_attrib(attrib_name: str) -> property:
@@ -60,7 +107,7 @@ def evg_date_attrib(attrib_name: str) -> property:
 
     :param attrib_name: Name of attribute.
     """
-    return evg_attrib(attrib_name, parse_evergreen_date)
+    return _evg_parsed_attrib(attrib_name, parse_evergreen_date)
 
 
 class _BaseEvergreenObject(object):
@@ -71,6 +118,40 @@ class _BaseEvergreenObject(object):
         self.json = json
         self._api = api
         self._date_fields = None
+        self._parsed_fields: Optional[Dict[str, Tuple[Any, Any]]] = None
+
+    def _parse_field(self, item: str, parse_fn: Callable) -> Any:
+        """
+        Parse the value of a field, reusing the previous result if the value has not changed.
+
+        :param item: field to parse.
+        :param parse_fn: method to use to parse the field.
+        :return: Parsed value of the field or None if the field does not exist.
+        """
+        if item not in self.json:
+            return None
+
+        return self._parse_value(item, self.json[item], parse_fn)
+
+    def _parse_value(self, item: str, value: Any, parse_fn: Callable) -> Any:
+        """
+        Parse the value of a field, reusing the previous result if the value has not changed.
+
+        :param item: field the value belongs to.
+        :param value: value to parse.
+        :param parse_fn: method to use to parse the field.
+        :return: Parsed value of the field.
+        """
+        if self._parsed_fields is None:
+            self._parsed_fields = {}
+
+        cached = self._parsed_fields.get(item)
+        if cached is not None and cached[0] is value:
+            return cached[1]
+
+        parsed = parse_fn(value)
+        self._parsed_fields[item] = (value, parsed)
+        return parsed
 
     def _is_field_a_date(self, item: str) -> bool:
         """
@@ -85,7 +166,7 @@ class _BaseEvergreenObject(object):
         """Lookup an attribute if it exists."""
         if item != "json" and item in self.json:
             if self._is_field_a_date(item):
-                return parse_evergreen_datetime(self.json[item])
+                return self._parse_field(item, parse_evergreen_datetime)
             return self.json[item]
         raise AttributeError("Unknown attribute {0}".format(item))
 
@@ -96,3 +177,157 @@ class _BaseEvergreenObject(object):
 
     def __ne__(self, other: Any) -> bool:
         return not self.__eq__(other)
+
+
+def compact_class(cls: Type[EvgObjectType]) -> Type[EvgObjectType]:
+    """
+    Get a compact version of an evergreen object class.
+
+    Instances of the compact class do not hold on to the json they are created from. Each field
+    declared on the class with `evg_attrib` (and the date variants) is stored in a slot, any
+    other fields are kept in a small dictionary. String values of declared fields are interned
+    so values repeated across objects are only stored once. Other attributes set by the class
+    should be listed in its `_compact_slots`. The `json` attribute is rebuilt on demand, so it
+    should not be used on hot paths. Compact instances are instances of the original class.
+
+    :param cls: Evergreen object class to get a compact version of.
+    :return: Compact version of the class.
+    """
+    compact_cls = _COMPACT_CLASSES.get(cls)
+    if compact_cls is None:
+        with _COMPACT_CLASSES_LOCK:
+            compact_cls = _COMPACT_CLASSES.get(cls)
+            if compact_cls is None:
+                compact_cls = _create_compact_class(cls)
+                _COMPACT_CLASSES[cls] = compact_cls
+    return compact_cls  # type: ignore[return-value]
+
+
+def _create_compact(
+    cls: Type[_BaseEvergreenObject], json: Dict[str, Any], api: "EvergreenApi"
+) -> _BaseEvergreenObject:
+    """Create a compact instance of an evergreen object, used to unpickle compact objects."""
+    return compact_class(cls)(json, api)
+
+
+def _compact_attrib(attrib: _EvgAttrib, slot: str) -> property:
+    """
+    Create a property reading a field stored in a slot of a compact object.
+
+    :param attrib: property of the original class reading the field.
+    :param slot: name of the slot the field is stored in.
+    """
+    attrib_name = attrib.attrib_name
+    type_fn = attrib.type_fn
+
+    if type_fn is None:
+
+        def attrib_getter(instance: Any) -> Any:
+            value = getattr(instance, slot)
+            return None if value is _MISSING else value
+
+    elif attrib.cached:
+
+        def attrib_getter(instance: Any) -> Any:
+            value = getattr(instance, slot)
+            if value is _MISSING:
+                return None
+            return instance._parse_value(attrib_name, value, type_fn)
+
+    else:
+
+        def attrib_getter(instance: Any) -> Any:
+            value = getattr(instance, slot)
+            return None if value is _MISSING else type_fn(value)  # type: ignore[misc]
+
+    return property(attrib_getter, doc=attrib.__doc__)
+
+
+class _CompactEvergreenObject(object):
+    """Behaviour shared by the compact versions of evergreen object classes."""
+
+    # Json field name to slot name of the fields stored in slots, set by each compact class.
+    _compact_fields: Dict[str, str] = {}
+    _compact_base: type = _BaseEvergreenObject
+    _extra: Optional[Dict[str, Any]]
+    _api: "EvergreenApi"
+    _date_fields: Optional[Any]
+
+    @property
+    def json(self) -> Dict[str, Any]:
+        """Get the json version of the object."""
+        json = {}
+        for key, slot in self._compact_fields.items():
+            value = getattr(self, slot)
+            if value is not _MISSING:
+                json[key] = value
+        if self._extra:
+            json.update(self._extra)
+        return json
+
+    @json.setter
+    def json(self, json: Dict[str, Any]) -> None:
+        """Store the fields of the given json in the object."""
+        fields = self._compact_fields
+        for key, slot in fields.items():
+            value = json.get(key, _MISSING)
+            if type(value) is str:
+                # Values such as statuses, variants and revisions repeat across objects, interning
+                # them stores each distinct value once.
+                value = sys.intern(value)
+            setattr(self, slot, value)
+        extra = {key: value for key, value in json.items() if key not in fields}
+        self._extra = extra or None
+
+    def __getattr__(self, item: str) -> Any:
+        """Lookup an attribute if it exists."""
+        if item in ("_extra", "_parsed_fields", "_date_fields", "_api"):
+            raise AttributeError("Unknown attribute {0}".format(item))
+
+        slot = self._compact_fields.get(item)
+        if slot is not None:
+            value = getattr(self, slot)
+            if value is not _MISSING:
+                return value
+        elif self._extra and item in self._extra:
+            value = self._extra[item]
+            if self._date_fields and item in self._date_fields and value:
+                return self._parse_value(item, value, parse_evergreen_datetime)  # type: ignore
+            return value
+        raise AttributeError("Unknown attribute {0}".format(item))
+
+    def __reduce__(self) -> Tuple[Callable, Tuple[type, Dict[str, Any], Any]]:
+        """Pickle compact objects by the json they were created from."""
+        return _create_compact, (self._compact_base, self.json, self._api)
+
+
+def _create_compact_class(cls: type) -> type:
+    """
+    Create the compact version of an evergreen object class.
+
+    :param cls: Evergreen object class to create a compact version of.
+    :return: Compact version of the class.
+    """
+    fields: Dict[str, str] = {}
+    namespace: Dict[str, Any] = {}
+    for klass in reversed(cls.__mro__):
+        for name, attrib in vars(klass).items():
+            if isinstance(attrib, _EvgAttrib) and attrib.attrib_name.isidentifier():
+                slot = fields.setdefault(
+                    attrib.attrib_name, _COMPACT_SLOT_PREFIX + attrib.attrib_name
+                )
+                namespace[name] = _compact_attrib(attrib, slot)
+
+    namespace.update(
+        {
+            "__slots__": ("_api", "_date_fields", "_parsed_fields", "_extra")
+            + tuple(getattr(cls, "_compact_slots", ()))
+            + tuple(fields.values()),
+            "__doc__": f"Compact representation of {cls.__name__}.",
+            "__module__": cls.__module__,
+            "__qualname__": f"Compact{cls.__qualname__}",
+            "_compact_fields": fields,
+            "_compact_base": cls,
+        }
+    )
+    return type(f"Compact{cls.__name__}", (_CompactEvergreenObject, cls), namespace)
@@ -2,9 +2,12 @@
 """Representation of an evergreen build."""
 from __future__ import absolute_import
 
-from typing import TYPE_CHECKING, Any, Callable, Dict, List, Optional
+from typing import TYPE_CHECKING, Any, Callable, Collection, Dict, Iterable, List, Optional
 
 from evergreen.base import _BaseEvergreenObject, evg_attrib, evg_datetime_attrib
+from evergreen.config import DEFAULT_MAX_WORKERS
+from evergreen.download import ARTIFACT_TASK_FIELDS, ArtifactDownload, ArtifactDownloadSummary
+from evergreen.log_grep import DEFAULT_GREP_LOG_NAME, LOG_GREP_TASK_FIELDS, TaskLogMatches
 from evergreen.metrics.buildmetrics import BuildMetrics
 
 if TYPE_CHECKING:
@@ -91,14 +94,75 @@ class Build(_BaseEvergreenObject):
         """
         return self.project_identifier
 
-    def get_tasks(self, fetch_all_executions: bool = False) -> List["Task"]:
+    def get_tasks(
+        self, fetch_all_executions: bool = False, fields: Optional[Collection[str]] = None
+    ) -> List["Task"]:
         """
         Get all tasks for this build.
 
         :param fetch_all_executions:  fetch all executions for tasks.
+        :param fields: Only keep these fields of each task, to reduce memory use.
         :return: List of all tasks.
         """
-        return self._api.tasks_by_build(self.id, fetch_all_executions)
+        return self._api.tasks_by_build(self.id, fetch_all_executions, fields=fields)
+
+    def download_artifacts(
+        self,
+        directory: str,
+        patterns: Optional[Iterable[str]] = None,
+        max_workers: int = DEFAULT_MAX_WORKERS,
+        parallel_ranges: int = 1,
+        on_progress: Optional[Callable[[ArtifactDownload, int, int], None]] = None,
+    ) -> ArtifactDownloadSummary:
+        """
+        Download the artifacts of all tasks of this build concurrently.
+
+        :param directory: Directory to download the artifacts to.
+        :param patterns: Glob patterns selecting the artifacts to download, None for all.
+        :param max_workers: Maximum number of artifacts to download at once.
+        :param parallel_ranges: Maximum number of ranges of each artifact to download at once.
+        :param on_progress: Function called with the outcome of each download, the number of
+            downloads completed and the total number of downloads.
+        :return: Summary of the downloads.
+        """
+        return self._api.download_artifacts(
+            self.get_tasks(fields=ARTIFACT_TASK_FIELDS),
+            directory,
+            patterns=patterns,
+            max_workers=max_workers,
+            parallel_ranges=parallel_ranges,
+            on_progress=on_progress,
+        )
+
+    def grep_logs(
+        self,
+        patterns: Iterable[str],
+        log_name: str = DEFAULT_GREP_LOG_NAME,
+        first_match_only: bool = False,
+        ignore_case: bool = False,
+        max_workers: int = DEFAULT_MAX_WORKERS,
+        on_result: Optional[Callable[[TaskLogMatches], None]] = None,
+    ) -> List[TaskLogMatches]:
+        """
+        Search the logs of all tasks of this build for regular expressions concurrently.
+
+        :param patterns: Regular expressions to search for.
+        :param log_name: Name of the log of each task to search.
+        :param first_match_only: Stop reading the log of a task at its first match.
+        :param ignore_case: Match the patterns without regard to case.
+        :param max_workers: Maximum number of logs to search at once.
+        :param on_result: Function called with the matches of each task as its search completes.
+        :return: Matches in the log of each task.
+        """
+        return self._api.grep_task_logs(
+            self.get_tasks(fields=LOG_GREP_TASK_FIELDS),
+            patterns,
+            log_name=log_name,
+            first_match_only=first_match_only,
+            ignore_case=ignore_case,
+            max_workers=max_workers,
+            on_result=on_result,
+        )
 
     def is_completed(self) -> bool:
         """
@@ -0,0 +1,136 @@
+# -*- encoding: utf-8 -*-
+"""Caches used by the evergreen API clients."""
+from __future__ import absolute_import
+
+import threading
+from collections import OrderedDict
+from time import monotonic
+from typing import Any, Callable, Hashable, NamedTuple, Optional, Tuple
+
+DEFAULT_CACHE_MAX_ENTRIES = 5000
+
+
+class CacheStats(NamedTuple):
+    """Usage statistics of a cache."""
+
+    hits: int
+    misses: int
+    evictions: int
+    expirations: int
+    entries: int
+    max_entries: int
+
+
+class CacheTtl(NamedTuple):
+    """
+    Time to live of cache entries of an endpoint, in seconds.
+
+    A time to live of None means entries do not expire.
+    """
+
+    completed: Optional[float]
+    active: Optional[float]
+
+
+class TtlCache(object):
+    """Thread-safe LRU cache whose entries can expire after a time to live."""
+
+    def __init__(
+        self,
+        max_entries: int = DEFAULT_CACHE_MAX_ENTRIES,
+        clock: Callable[[], float] = monotonic,
+    ) -> None:
+        """
+        Create a cache.
+
+        :param max_entries: Maximum number of entries to keep, the least recently used entries are
+            evicted once it is reached.
+        :param clock: Function returning the current time in seconds.
+        """
+        self._max_entries = max_entries
+        self._clock = clock
+        self._entries: "OrderedDict[Hashable, Tuple[Any, Optional[float]]]" = OrderedDict()
+        self._lock = threading.Lock()
+        self._hits = 0
+        self._misses = 0
+        self._evictions = 0
+        self._expirations = 0
+
+    def get(self, key: Hashable) -> Tuple[bool, Any]:
+        """
+        Look up an entry of the cache.
+
+        :param key: Key of the entry.
+        :return: Tuple of whether the entry was found and its value.
+        """
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None:
+                value, expires_at = entry
+                if expires_at is None or expires_at > self._clock():
+                    self._entries.move_to_end(key)
+                    self._hits += 1
+                    return True, value
+                del self._entries[key]
+                self._expirations += 1
+            self._misses += 1
+            return False, None
+
+    def put(self, key: Hashable, value: Any, ttl: Optional[float] = None) -> None:
+        """
+        Add an entry to the cache.
+
+        :param key: Key of the entry.
+        :param value: Value of the entry.
+        :param ttl: Number of seconds the entry should be kept, None to keep it until evicted.
+        """
+        if ttl is not None and ttl <= 0:
+            return
+
+        expires_at = self._clock() + ttl if ttl is not None else None
+        with self._lock:
+            self._entries[key] = (value, expires_at)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self._max_entries:
+                self._entries.popitem(last=False)
+                self._evictions += 1
+
+    def discard(self, key: Hashable) -> None:
+        """
+        Remove an entry from the cache if it exists.
+
+        :param key: Key of the entry.
+        """
+        with self._lock:
+            self._entries.pop(key, None)
+
+    def clear(self) -> None:
+        """Remove all entries from the cache."""
+        with self._lock:
+            self._entries.clear()
+
+    def stats(self) -> CacheStats:
+        """
+        Get usage statistics of the cache.
+
+        :return: Statistics of the cache.
+        """
+        with self._lock:
+            return CacheStats(
+                hits=self._hits,
+                misses=self._misses,
+                evictions=self._evictions,
+                expirations=self._expirations,
+                entries=len(self._entries),
+                max_entries=self._max_entries,
+            )
+
+    def __contains__(self, key: Hashable) -> bool:
+        """Determine if an entry is in the cache, without counting it as a use of the entry."""
+        with self._lock:
+            entry = self._entries.get(key)
+            return entry is not None and (entry[1] is None or entry[1] > self._clock())
+
+    def __len__(self) -> int:
+        """Get the number of entries in the cache."""
+        return len(self._entries)
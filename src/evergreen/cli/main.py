@@ -2,7 +2,6 @@
 
 from __future__ import absolute_import
 
-import json
 from enum import Enum
 from itertools import islice
 from typing import Optional
@@ -11,6 +10,9 @@ import click
 import yaml
 
 from evergreen import EvergreenApi
+from evergreen.http_cache import HttpCache
+from evergreen.json_codec import JSON_CODEC_NAMES, STDLIB_CODEC, JsonCodec, get_json_codec
+from evergreen.log_grep import LOG_GREP_TASK_FIELDS
 from evergreen.oidc import get_username_from_api
 from evergreen.resource_type_permissions import PermissionableResourceType, RemovablePermission
 
@@ -19,16 +21,18 @@ DATE_FORMAT = "%Y-%m-%d"
 DisplayFormat = Enum("DisplayFormat", "human json yaml")
 
 
-def fmt_output(fmt, data):
+def fmt_output(fmt, data, codec: Optional[JsonCodec] = None):
     """
     Convert the given data into the specified format.
 
     :param fmt: DisplayFormat to use.
     :param data: Data to convertn.
+    :param codec: Json codec to write json output with.
     :return: Data is specified format.
     """
     if fmt == DisplayFormat.json:
-        return json.dumps(data, indent=4)
+        codec = codec if codec is not None else JsonCodec()
+        return codec.dumps(data, indent=4)
     if fmt == DisplayFormat.yaml:
         return yaml.safe_dump(data)
     return data
@@ -57,12 +61,37 @@ def fmt_output(fmt, data):
     default=True,
     help="Write output in a human readable format.",
 )
+@click.option(
+    "--json-codec",
+    "json_codec",
+    type=click.Choice(JSON_CODEC_NAMES),
+    default=STDLIB_CODEC,
+    show_default=True,
+    help="Json library to decode responses and write json output with.",
+)
+@click.option(
+    "--http-cache",
+    "http_cache",
+    is_flag=True,
+    default=False,
+    help="Cache responses on disk and revalidate them with the server on later runs.",
+)
+@click.option(
+    "--http-cache-path",
+    "http_cache_path",
+    type=click.Path(dir_okay=False),
+    default=None,
+    help="Location of the response cache, defaults to the user's cache directory.",
+)
 @click.pass_context
-def cli(ctx, display_format):
+def cli(ctx, display_format, json_codec, http_cache, http_cache_path):
     """Create common CLI options."""
     ctx.ensure_object(dict)
-    ctx.obj["api"] = EvergreenApi.get_api(use_config_file=True)
+    codec = get_json_codec(json_codec)
+    cache = HttpCache(http_cache_path) if http_cache or http_cache_path else None
+    ctx.obj["api"] = EvergreenApi.get_api(use_config_file=True, json_codec=codec, http_cache=cache)
     ctx.obj["format"] = display_format
+    ctx.obj["json_codec"] = codec
 
 
 @cli.command()
@@ -72,7 +101,7 @@ def list_hosts(ctx):
     api = ctx.obj["api"]
     fmt = ctx.obj["format"]
     host_list = api.all_hosts()
-    click.echo(fmt_output(fmt, [host.json for host in host_list]))
+    click.echo(fmt_output(fmt, [host.json for host in host_list], ctx.obj["json_codec"]))
 
 
 @cli.command()
@@ -83,12 +112,9 @@ def list_patches(ctx, project, limit):
     """Get the patches for the given project."""
     api = ctx.obj["api"]
     fmt = ctx.obj["format"]
-    patches = []
-    for i, p in enumerate(api.patches_by_project(project)):
-        if limit and i >= limit:
-            break
-        patches.append(p.json)
-    click.echo(fmt_output(fmt, patches))
+    patch_list = api.patches_by_project(project, limit=limit)
+    patches = [patch.json for patch in islice(patch_list, None, limit)]
+    click.echo(fmt_output(fmt, patches, ctx.obj["json_codec"]))
 
 
 @cli.command()
@@ -99,7 +125,7 @@ def list_projects(ctx):
     fmt = ctx.obj["format"]
     project_list = api.all_projects()
     projects = [project.json for project in project_list]
-    click.echo(fmt_output(fmt, projects))
+    click.echo(fmt_output(fmt, projects, ctx.obj["json_codec"]))
 
 
 @cli.command()
@@ -125,7 +151,7 @@ def list_versions(
     )
     versions_to_display = [version.json for version in islice(version_list, None, limit)]
 
-    click.echo(fmt_output(fmt, versions_to_display))
+    click.echo(fmt_output(fmt, versions_to_display, ctx.obj["json_codec"]))
 
 
 @cli.command()
@@ -195,7 +221,7 @@ def test_stats(
         sort,
     )
     test_statistics = [t.json for t in test_stat_list]
-    click.echo(fmt_output(fmt, test_statistics))
+    click.echo(fmt_output(fmt, test_statistics, ctx.obj["json_codec"]))
 
 
 @cli.command()
@@ -252,7 +278,7 @@ def task_stats(
         sort,
     )
     task_statistics = [t.json for t in task_stat_list]
-    click.echo(fmt_output(fmt, task_statistics))
+    click.echo(fmt_output(fmt, task_statistics, ctx.obj["json_codec"]))
 
 
 RELIABILITY_GROUP_MAPPING = {
@@ -385,29 +411,38 @@ def task_reliability(
         sort,
     )
     task_reliability_scores = [t.json for t in task_reliability_list]
-    click.echo(fmt_output(fmt, task_reliability_scores))
+    click.echo(fmt_output(fmt, task_reliability_scores, ctx.obj["json_codec"]))
 
 
 @cli.command()
 @click.pass_context
 @click.option("-v", "--version", "version_id", required=True)
 @click.option("--builds", is_flag=True, default=False, help="Include builds of version in output")
-def version_stats(ctx, version_id, builds):
+@click.option(
+    "-j",
+    "--jobs",
+    type=click.IntRange(min=1),
+    default=1,
+    help="Number of builds to collect stats for concurrently.",
+)
+def version_stats(ctx, version_id, builds, jobs):
     """
     Collect stats for the given evergreen version.
 
     :param ctx: Command context.
     :param version_id: Id of version to analyze.
     :param builds: Include builds of version in output.
+    :param jobs: Number of builds to collect stats for concurrently.
     """
     api = ctx.obj["api"]
     fmt = ctx.obj["format"]
 
     version = api.version_by_id(version_id)
+    metrics = version.get_metrics(max_workers=jobs)
     if fmt == DisplayFormat.human:
-        click.echo(version.get_metrics())
+        click.echo(metrics)
     else:
-        click.echo(fmt_output(fmt, version.get_metrics().as_dict(include_children=builds)))
+        click.echo(fmt_output(fmt, metrics.as_dict(include_children=builds), ctx.obj["json_codec"]))
 
 
 @cli.command()
@@ -429,7 +464,187 @@ def build_stats(ctx, build_id, tasks):
     if fmt == DisplayFormat.human:
         click.echo(build.get_metrics())
     else:
-        click.echo(fmt_output(fmt, build.get_metrics().as_dict(include_children=tasks)))
+        click.echo(
+            fmt_output(
+                fmt, build.get_metrics().as_dict(include_children=tasks), ctx.obj["json_codec"]
+            )
+        )
+
+
+def _format_size(size):
+    """
+    Format a number of bytes for humans.
+
+    :param size: Number of bytes.
+    :return: Size in the largest unit it is at least one of.
+    """
+    for unit in ("B", "KiB", "MiB", "GiB"):
+        if size < 1024:
+            return f"{size:.1f} {unit}"
+        size /= 1024
+    return f"{size:.1f} TiB"
+
+
+@cli.command()
+@click.pass_context
+@click.option("-b", "--build", "build_id", help="Build to download the artifacts of.")
+@click.option("-v", "--version", "version_id", help="Version to download the artifacts of.")
+@click.option(
+    "-p",
+    "--pattern",
+    "patterns",
+    multiple=True,
+    help="Only download artifacts whose name or file name match this glob pattern.",
+)
+@click.option(
+    "-d",
+    "--dest",
+    "directory",
+    type=click.Path(file_okay=False, writable=True),
+    default=".",
+    help="Directory to download the artifacts to.",
+)
+@click.option(
+    "-j",
+    "--jobs",
+    type=click.IntRange(min=1),
+    default=4,
+    help="Number of artifacts to download concurrently.",
+)
+@click.option(
+    "--parallel-ranges",
+    type=click.IntRange(min=1),
+    default=1,
+    help="Number of ranges of each artifact to download concurrently.",
+)
+def download_artifacts(ctx, build_id, version_id, patterns, directory, jobs, parallel_ranges):
+    """
+    Download the artifacts of the tasks of a build or version.
+
+    Artifacts are written to <dest>/<build variant>/<task name>/<file name>. Artifacts marked to
+    be ignored for fetching are skipped.
+    """
+    if (build_id is None) == (version_id is None):
+        raise click.UsageError("Exactly one of --build or --version must be given.")
+    api = ctx.obj["api"]
+    fmt = ctx.obj["format"]
+
+    def _show_progress(download, completed, total):
+        if download.error is not None:
+            status = f"failed: {download.error}"
+        elif download.duplicate:
+            status = "same url as another artifact"
+        else:
+            status = f"{_format_size(download.size)} in {download.seconds:.1f}s"
+        click.echo(f"[{completed}/{total}] {download.path}: {status}", err=True)
+
+    if build_id is not None:
+        evg_object = api.build_by_id(build_id)
+    else:
+        evg_object = api.version_by_id(version_id)
+    summary = evg_object.download_artifacts(
+        directory,
+        patterns=patterns or None,
+        max_workers=jobs,
+        parallel_ranges=parallel_ranges,
+        on_progress=_show_progress,
+    )
+
+    failed = summary.failed
+    if fmt == DisplayFormat.human:
+        click.echo(
+            f"Downloaded {len(summary.downloads) - len(failed)} artifacts "
+            f"({_format_size(summary.size)}) in {summary.seconds:.1f}s, "
+            f"{_format_size(summary.throughput)}/s. "
+            f"{len(failed)} failed, {summary.skipped} skipped."
+        )
+    else:
+        data = {
+            "downloads": [download._asdict() for download in summary.downloads],
+            "skipped": summary.skipped,
+            "size": summary.size,
+            "seconds": summary.seconds,
+            "throughput": summary.throughput,
+        }
+        click.echo(fmt_output(fmt, data, ctx.obj["json_codec"]))
+    if failed:
+        ctx.exit(1)
+
+
+@cli.command()
+@click.pass_context
+@click.option("-b", "--build", "build_id", help="Build to search the task logs of.")
+@click.option("-t", "--task", "task_ids", multiple=True, help="Task to search the log of.")
+@click.option(
+    "-e",
+    "--regexp",
+    "patterns",
+    multiple=True,
+    required=True,
+    help="Regular expression to search for.",
+)
+@click.option(
+    "--log",
+    "log_name",
+    type=click.Choice(["task_log", "agent_log", "system_log", "all_log"]),
+    default="task_log",
+    help="Log of each task to search.",
+)
+@click.option(
+    "-l", "--first-match", is_flag=True, default=False, help="Stop at the first match in each log."
+)
+@click.option("-i", "--ignore-case", is_flag=True, default=False, help="Ignore case.")
+@click.option(
+    "-j",
+    "--jobs",
+    type=click.IntRange(min=1),
+    default=8,
+    help="Number of logs to search concurrently.",
+)
+def grep_logs(ctx, build_id, task_ids, patterns, log_name, first_match, ignore_case, jobs):
+    """
+    Search the logs of the tasks of a build, or of the given tasks, for regular expressions.
+
+    Each match is printed as <build variant>/<task name>:<line number>:<line>. The exit status is
+    0 if a log matched, 1 if none did and 2 if a log could not be searched.
+    """
+    if (build_id is None) == (not task_ids):
+        raise click.UsageError("Exactly one of --build or --task must be given.")
+    api = ctx.obj["api"]
+    fmt = ctx.obj["format"]
+
+    def _show_matches(result):
+        if result.error is not None:
+            click.echo(f"{result.task_id}: {result.error}", err=True)
+        elif fmt == DisplayFormat.human:
+            for match in result.matches:
+                click.echo(
+                    f"{result.build_variant}/{result.display_name}:{match.line_number}:{match.line}"
+                )
+
+    options = dict(
+        log_name=log_name,
+        first_match_only=first_match,
+        ignore_case=ignore_case,
+        max_workers=jobs,
+        on_result=_show_matches,
+    )
+    if build_id is not None:
+        results = api.build_by_id(build_id).grep_logs(patterns, **options)
+    else:
+        tasks = api.tasks_by_ids(task_ids, max_workers=jobs, fields=LOG_GREP_TASK_FIELDS)
+        results = api.grep_task_logs(tasks, patterns, **options)
+
+    if fmt != DisplayFormat.human:
+        data = [
+            dict(result._asdict(), matches=[match._asdict() for match in result.matches])
+            for result in results
+        ]
+        click.echo(fmt_output(fmt, data, ctx.obj["json_codec"]))
+    if any(result.error is not None for result in results):
+        ctx.exit(2)
+    if not any(result.matches for result in results):
+        ctx.exit(1)
 
 
 @cli.command()
@@ -449,7 +664,7 @@ def manifest(ctx, project, commit):
     fmt = ctx.obj["format"]
 
     manifest = api.manifest(project, commit)
-    click.echo(fmt_output(fmt, manifest.json))
+    click.echo(fmt_output(fmt, manifest.json, ctx.obj["json_codec"]))
 
 
 @cli.command()
@@ -473,7 +688,7 @@ def user_permissions(ctx, user_id):
         user_id = user_id.split("@")[0]
 
     permissions = api.permissions_for_user(user_id)
-    click.echo(fmt_output(fmt, [p.json for p in permissions]))
+    click.echo(fmt_output(fmt, [p.json for p in permissions], ctx.obj["json_codec"]))
 
 
 @cli.command()
@@ -1,5 +1,6 @@
 # -*- encoding: utf-8 -*-
 """Get configuration about connecting to evergreen."""
+
 from __future__ import absolute_import
 
 import os
@@ -12,6 +13,7 @@ EvgAuth = namedtuple("EvgAuth", ["username", "api_key"])
 OidcConfig = namedtuple("OidcConfig", ["issuer", "client_id", "connector_id", "token_file_path"])
 
 DEFAULT_NETWORK_TIMEOUT_SEC = 5 * 60
+DEFAULT_MAX_WORKERS = 10
 DEFAULT_API_SERVER = "https://evergreen.mongodb.com"
 DEFAULT_API_SERVER_OIDC = "https://evergreen.corp.mongodb.com"
 CONFIG_FILE_LOCATIONS = [
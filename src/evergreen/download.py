@@ -0,0 +1,685 @@
+# -*- encoding: utf-8 -*-
+"""
+Downloads of files.
+
+Large files are downloaded over parallel ranged requests, which can be resumed. Responses can also
+be read straight into file objects and buffers.
+"""
+from __future__ import absolute_import
+
+import codecs
+import io
+import json
+import os
+import posixpath
+import re
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from fnmatch import fnmatchcase
+from functools import partial
+from typing import (
+    IO,
+    TYPE_CHECKING,
+    Any,
+    Callable,
+    Dict,
+    Iterable,
+    Iterator,
+    List,
+    NamedTuple,
+    Optional,
+    Tuple,
+    Union,
+)
+from urllib.parse import unquote, urlsplit
+
+import requests
+import structlog
+
+from evergreen.config import DEFAULT_MAX_WORKERS
+from evergreen.errors.exceptions import DownloadException
+
+if TYPE_CHECKING:
+    from evergreen.task import Artifact, Task  # noqa: F401
+
+LOGGER = structlog.getLogger(__name__)
+
+DEFAULT_DOWNLOAD_CHUNK_SIZE = 2**20
+DEFAULT_PARALLEL_RANGES = 4
+# Files are not split into ranges smaller than this, the cost of another request would outweigh
+# the gain of another connection.
+MIN_RANGE_SIZE = 8 * 2**20
+PART_SUFFIX = ".part"
+PROGRESS_SUFFIX = ".part.json"
+# Number of chunks written between saves of the progress of a download.
+_PROGRESS_SAVE_INTERVAL = 64
+
+_CONTENT_RANGE_PATTERN = re.compile(r"bytes (\d+)-(\d+)/(\d+|\*)")
+# Ranges are offsets into the file as stored, so it must not be compressed for the transfer.
+_IDENTITY = {"Accept-Encoding": "identity"}
+
+# Fields of tasks needed to download their artifacts.
+ARTIFACT_TASK_FIELDS = ("task_id", "display_name", "build_variant", "execution", "artifacts")
+_UNSAFE_PATH_CHARACTERS = re.compile(r"[^\w.\-]+")
+
+OpenStream = Callable[[str, Dict[str, str]], requests.Response]
+# A file object, a file descriptor or a writable buffer.
+StreamTarget = Union[IO[Any], int, bytearray, memoryview]
+
+
+def _content_range(response: requests.Response) -> Optional[Tuple[int, int, Optional[int]]]:
+    """
+    Parse the `Content-Range` header of a response.
+
+    :param response: Partial content response.
+    :return: First byte, last byte and total size of the file, None if the header is missing.
+    """
+    match = _CONTENT_RANGE_PATTERN.fullmatch(response.headers.get("Content-Range", "").strip())
+    if match is None:
+        return None
+    first, last, total = match.groups()
+    return int(first), int(last), None if total == "*" else int(total)
+
+
+def _validator(response: requests.Response) -> Optional[str]:
+    """Get the value identifying the version of the file a response is for."""
+    return response.headers.get("ETag") or response.headers.get("Last-Modified")
+
+
+def _split_ranges(size: int, parallel_ranges: int, min_range_size: int) -> List[List[int]]:
+    """
+    Split a file into ranges to download in parallel.
+
+    :param size: Size of the file.
+    :param parallel_ranges: Maximum number of ranges.
+    :param min_range_size: Minimum size of a range.
+    :return: List of the [start, end) offsets of each range.
+    """
+    count = max(1, min(parallel_ranges, size // max(min_range_size, 1)))
+    bounds = [size * i // count for i in range(count + 1)]
+    return [[bounds[i], bounds[i + 1]] for i in range(count)]
+
+
+def _preallocate(path: str, size: int) -> None:
+    """Create a file of the given size, reserving its disk space where supported."""
+    with open(path, "wb") as part_file:
+        if size > 0 and hasattr(os, "posix_fallocate"):
+            try:
+                os.posix_fallocate(part_file.fileno(), 0, size)
+                return
+            except OSError:
+                # Not all file systems support it, the file is extended instead.
+                pass
+        part_file.truncate(size)
+
+
+def _write_all(write: Callable[[memoryview], Optional[int]], view: memoryview) -> None:
+    """
+    Write all of a buffer with a function that may write only part of it.
+
+    :param write: Function writing a buffer, returning the number of bytes written. None is taken
+        to mean the whole buffer was written, as buffered files do.
+    :param view: Buffer to write.
+    """
+    while view:
+        written = write(view)
+        view = view[written if written is not None else len(view) :]
+
+
+def _read_chunks(response: requests.Response, buffer: memoryview) -> Iterator[memoryview]:
+    """
+    Read the body of a response into a buffer, one chunk at a time.
+
+    :param response: Response to read.
+    :param buffer: Buffer reused for every chunk.
+    :return: Iterator of views of the chunk in the buffer, valid until the next chunk is read.
+    """
+    while True:
+        read = response.raw.readinto(buffer)
+        if not read:
+            return
+        yield buffer[:read]
+
+
+def _fill_buffer(response: requests.Response, view: memoryview) -> int:
+    """
+    Read the body of a response into a buffer.
+
+    :param response: Response to read.
+    :param view: Buffer to fill.
+    :return: Number of bytes read.
+    """
+    size = 0
+    while size < len(view):
+        read = response.raw.readinto(view[size:])
+        if not read:
+            return size
+        size += read
+    if response.raw.read(1):
+        raise DownloadException(f"{response.url} is larger than the buffer of {len(view)} bytes")
+    return size
+
+
+def stream_into(
+    response: requests.Response,
+    target: StreamTarget,
+    chunk_size: int = DEFAULT_DOWNLOAD_CHUNK_SIZE,
+    encoding: Optional[str] = None,
+) -> int:
+    """
+    Read the body of a response into a file object, a file descriptor or a buffer.
+
+    The body is read with `readinto`, straight into the given buffer or into a single buffer reused
+    for every chunk, rather than into a new bytes object per chunk. It is only decoded when
+    written to a text file.
+
+    :param response: Streamed response to read.
+    :param target: Binary or text file object, file descriptor, or bytearray or memoryview to fill.
+    :param chunk_size: Number of bytes to read at a time.
+    :param encoding: Encoding of the body when writing to a text file, defaults to the encoding of
+        the response and then utf-8.
+    :return: Number of bytes read from the body.
+    """
+    # Content-Encoding is undone as the body is read, as `iter_content` would.
+    response.raw.decode_content = True
+    if isinstance(target, (bytearray, memoryview)):
+        view = memoryview(target).cast("B")
+        if view.readonly:
+            raise TypeError("Cannot stream into a read-only buffer")
+        return _fill_buffer(response, view)
+
+    size = 0
+    buffer = memoryview(bytearray(chunk_size))
+    if isinstance(target, io.TextIOBase):
+        decoder = codecs.getincrementaldecoder(encoding or response.encoding or "utf-8")()
+        for chunk in _read_chunks(response, buffer):
+            target.write(decoder.decode(chunk))
+            size += len(chunk)
+        target.write(decoder.decode(b"", final=True))
+        return size
+
+    write = partial(os.write, target) if isinstance(target, int) else target.write
+    for chunk in _read_chunks(response, buffer):
+        _write_all(write, chunk)
+        size += len(chunk)
+    return size
+
+
+class _PositionalWriter(object):
+    """Writes data at given offsets of a file, from any number of threads."""
+
+    def __init__(self, path: str) -> None:
+        """
+        Open a file for writing.
+
+        :param path: Path of the file, which must exist.
+        """
+        self._fd = os.open(path, os.O_WRONLY | getattr(os, "O_BINARY", 0))
+        # Without pwrite, seeking and writing must not interleave between threads.
+        self._lock: Optional[threading.Lock] = None if hasattr(os, "pwrite") else threading.Lock()
+
+    def write(self, data: bytes, offset: int) -> None:
+        """
+        Write data at an offset of the file.
+
+        :param data: Data to write.
+        :param offset: Offset to write the data at.
+        """
+        view = memoryview(data)
+        if self._lock is None:
+            while view:
+                written = os.pwrite(self._fd, view, offset)
+                view = view[written:]
+                offset += written
+        else:
+            with self._lock:
+                os.lseek(self._fd, offset, os.SEEK_SET)
+                while view:
+                    view = view[os.write(self._fd, view) :]
+
+    def close(self) -> None:
+        """Close the file."""
+        os.close(self._fd)
+
+
+class _Progress(object):
+    """Progress of a ranged download, saved next to the partial file to resume it."""
+
+    def __init__(
+        self, path: str, size: int, validator: Optional[str], ranges: List[List[int]]
+    ) -> None:
+        """
+        Create the progress of a download.
+
+        :param path: Path the progress is saved to.
+        :param size: Size of the file.
+        :param validator: ETag or Last-Modified date of the file.
+        :param ranges: The [next offset, end) of each range of the file.
+        """
+        self.path = path
+        self.size = size
+        self.validator = validator
+        self.ranges = ranges
+        self._lock = threading.Lock()
+        self._unsaved = 0
+
+    @classmethod
+    def load(cls, path: str, size: int, validator: Optional[str]) -> Optional["_Progress"]:
+        """
+        Load the saved progress of a download of the same version of the file.
+
+        :param path: Path the progress was saved to.
+        :param size: Size of the file.
+        :param validator: ETag or Last-Modified date of the file.
+        :return: Saved progress, None if there is none for this version of the file.
+        """
+        try:
+            with open(path) as progress_file:
+                saved = json.load(progress_file)
+        except (OSError, ValueError):
+            return None
+        if not isinstance(saved, dict):
+            return None
+        if saved.get("size") != size or not validator or saved.get("validator") != validator:
+            return None
+        return cls(path, size, validator, saved["ranges"])
+
+    def advance(self, index: int, offset: int) -> None:
+        """
+        Record that a range has been written up to an offset.
+
+        :param index: Index of the range.
+        :param offset: Offset the range has been written up to.
+        """
+        with self._lock:
+            self.ranges[index][0] = offset
+            self._unsaved += 1
+            if self._unsaved >= _PROGRESS_SAVE_INTERVAL:
+                self._save()
+
+    def remaining(self) -> int:
+        """Get the number of bytes left to download."""
+        with self._lock:
+            return sum(end - start for start, end in self.ranges)
+
+    def save(self) -> None:
+        """Save the progress."""
+        with self._lock:
+            self._save()
+
+    def _save(self) -> None:
+        """Save the progress, with the lock held."""
+        tmp_path = self.path + ".tmp"
+        with open(tmp_path, "w") as progress_file:
+            json.dump(
+                {"size": self.size, "validator": self.validator, "ranges": self.ranges},
+                progress_file,
+            )
+        os.replace(tmp_path, self.path)
+        self._unsaved = 0
+
+
+class RangedDownload(object):
+    """
+    Download of a file over parallel HTTP Range requests.
+
+    The file is written to a preallocated `.part` file next to the destination, with each range
+    written at its offset as it arrives. The progress of each range is saved in a `.part.json`
+    file, so an interrupted download of the same version of the file resumes where it stopped.
+    The part file is moved to the destination once its size has been verified. Servers that do
+    not support ranges send the whole file over a single connection.
+    """
+
+    def __init__(
+        self,
+        open_stream: OpenStream,
+        url: str,
+        path: str,
+        parallel_ranges: int = DEFAULT_PARALLEL_RANGES,
+        chunk_size: int = DEFAULT_DOWNLOAD_CHUNK_SIZE,
+        min_range_size: int = MIN_RANGE_SIZE,
+    ) -> None:
+        """
+        Create a download.
+
+        :param open_stream: Function sending a GET request with the given headers, returning the
+            response without reading its body. It should raise on error responses.
+        :param url: URL of the file.
+        :param path: Path to download the file to.
+        :param parallel_ranges: Maximum number of ranges to download at once.
+        :param chunk_size: Number of bytes to read from a response at a time.
+        :param min_range_size: Minimum size of a range.
+        """
+        self._open_stream = open_stream
+        self._url = url
+        self._path = path
+        self._part_path = path + PART_SUFFIX
+        self._progress_path = path + PROGRESS_SUFFIX
+        self._parallel_ranges = max(1, parallel_ranges)
+        self._chunk_size = chunk_size
+        self._min_range_size = min_range_size
+
+    def run(self) -> int:
+        """
+        Download the file.
+
+        :return: Size of the file.
+        """
+        try:
+            response = self._open_stream(self._url, dict(_IDENTITY, Range="bytes=0-0"))
+        except requests.HTTPError as err:
+            if err.response is None or err.response.status_code != 416:
+                raise
+            # Empty files cannot satisfy any range.
+            response = self._open_stream(self._url, dict(_IDENTITY))
+
+        try:
+            content_range = _content_range(response) if response.status_code == 206 else None
+            total = content_range[2] if content_range is not None else None
+            if total is None:
+                # The server ignored the range and is sending the whole file.
+                return self._finish(self._write_whole(response))
+            size = total
+            validator = _validator(response)
+        finally:
+            response.close()
+
+        progress = None
+        if os.path.exists(self._part_path):
+            progress = _Progress.load(self._progress_path, size, validator)
+        if progress is None:
+            ranges = _split_ranges(size, self._parallel_ranges, self._min_range_size)
+            progress = _Progress(self._progress_path, size, validator, ranges)
+            _preallocate(self._part_path, size)
+        else:
+            LOGGER.debug("Resuming download", url=self._url, remaining=progress.remaining())
+
+        self._download_ranges(progress)
+        return self._finish(size)
+
+    def _download_ranges(self, progress: _Progress) -> None:
+        """
+        Download the ranges of the file that have not been downloaded yet.
+
+        :param progress: Progress of the download.
+        """
+        pending = [i for i, (start, end) in enumerate(progress.ranges) if start < end]
+        writer = _PositionalWriter(self._part_path)
+        try:
+            if len(pending) > 1 and self._parallel_ranges > 1:
+                workers = min(self._parallel_ranges, len(pending))
+                with ThreadPoolExecutor(max_workers=workers) as executor:
+                    futures = [
+                        executor.submit(self._download_range, progress, writer, i) for i in pending
+                    ]
+                    for future in futures:
+                        future.result()
+            else:
+                for i in pending:
+                    self._download_range(progress, writer, i)
+        finally:
+            writer.close()
+            progress.save()
+
+        if progress.remaining() != 0:
+            raise DownloadException(f"Download of {self._url} is incomplete")
+
+    def _download_range(self, progress: _Progress, writer: _PositionalWriter, index: int) -> None:
+        """
+        Download a range of the file.
+
+        :param progress: Progress of the download.
+        :param writer: Writer of the part file.
+        :param index: Index of the range to download.
+        """
+        start, end = progress.ranges[index]
+        headers = dict(_IDENTITY, Range=f"bytes={start}-{end - 1}")
+        if progress.validator:
+            # The server sends the whole file instead of the range if it has changed.
+            headers["If-Range"] = progress.validator
+
+        response = self._open_stream(self._url, headers)
+        try:
+            content_range = _content_range(response) if response.status_code == 206 else None
+            if content_range is None or content_range[0] != start:
+                raise DownloadException(
+                    f"{self._url} did not return the requested range, it may have changed"
+                )
+
+            offset = start
+            for chunk in response.iter_content(chunk_size=self._chunk_size):
+                if offset + len(chunk) > end:
+                    raise DownloadException(f"{self._url} returned more data than requested")
+                writer.write(chunk, offset)
+                offset += len(chunk)
+                progress.advance(index, offset)
+        finally:
+            response.close()
+
+        if offset != end:
+            raise DownloadException(
+                f"Range {start}-{end - 1} of {self._url} ended after {offset - start} bytes"
+            )
+
+    def _write_whole(self, response: requests.Response) -> int:
+        """
+        Write the whole body of a response to the part file.
+
+        :param response: Response with the whole file.
+        :return: Number of bytes written.
+        """
+        size = 0
+        with open(self._part_path, "wb") as part_file:
+            for chunk in response.iter_content(chunk_size=self._chunk_size):
+                part_file.write(chunk)
+                size += len(chunk)
+
+        expected = response.headers.get("Content-Length")
+        if expected is not None and response.headers.get("Content-Encoding") is None:
+            if int(expected) != size:
+                raise DownloadException(
+                    f"{self._url} returned {size} bytes, expected {expected} bytes"
+                )
+        return size
+
+    def _finish(self, size: int) -> int:
+        """
+        Verify the size of the part file and move it to the destination.
+
+        :param size: Expected size of the file.
+        :return: Size of the file.
+        """
+        actual = os.path.getsize(self._part_path)
+        if actual != size:
+            raise DownloadException(f"Downloaded {actual} bytes of {self._url}, expected {size}")
+        os.replace(self._part_path, self._path)
+        if os.path.exists(self._progress_path):
+            os.remove(self._progress_path)
+        return size
+
+
+class ArtifactDownload(NamedTuple):
+    """Outcome of the download of a task artifact."""
+
+    task_id: str
+    name: str
+    url: str
+    path: str
+    size: int = 0
+    seconds: float = 0.0
+    error: Optional[str] = None
+    duplicate: bool = False
+
+
+class ArtifactDownloadSummary(NamedTuple):
+    """Outcome of the download of the artifacts of several tasks."""
+
+    downloads: List[ArtifactDownload]
+    skipped: int
+    seconds: float
+
+    @property
+    def size(self) -> int:
+        """Get the number of bytes downloaded."""
+        return sum(download.size for download in self.downloads)
+
+    @property
+    def failed(self) -> List[ArtifactDownload]:
+        """Get the downloads that failed."""
+        return [download for download in self.downloads if download.error is not None]
+
+    @property
+    def throughput(self) -> float:
+        """Get the number of bytes downloaded per second."""
+        return self.size / self.seconds if self.seconds > 0 else 0.0
+
+
+def _safe_path_component(value: str) -> str:
+    """Replace the characters of a value that are unsafe in a file name."""
+    component = _UNSAFE_PATH_CHARACTERS.sub("_", value).strip(".")
+    return component or "_"
+
+
+def _artifact_file_name(artifact: "Artifact") -> str:
+    """Get the name of the file to download an artifact to, from its url or name."""
+    file_name = unquote(posixpath.basename(urlsplit(artifact.url).path))
+    return _safe_path_component(file_name or artifact.name or "")
+
+
+def _artifact_matches(artifact: "Artifact", patterns: Optional[Iterable[str]]) -> bool:
+    """
+    Determine if an artifact matches any of the given glob patterns.
+
+    :param artifact: Artifact to check.
+    :param patterns: Glob patterns matched against the name of the artifact and the name of its
+        file, None to match all artifacts.
+    :return: True if the artifact matches.
+    """
+    if patterns is None:
+        return True
+    names = [artifact.name or "", posixpath.basename(urlsplit(artifact.url).path)]
+    return any(fnmatchcase(name, pattern) for pattern in patterns for name in names)
+
+
+def _plan_artifact_downloads(
+    tasks: Iterable["Task"], directory: str, patterns: Optional[Iterable[str]]
+) -> Tuple[List[ArtifactDownload], List[ArtifactDownload], int]:
+    """
+    Select the artifacts of tasks to download and the paths to download them to.
+
+    :param tasks: Tasks to download the artifacts of.
+    :param directory: Directory to download the artifacts to.
+    :param patterns: Glob patterns selecting the artifacts to download.
+    :return: Artifacts to download, artifacts with the url of another artifact and the number of
+        artifacts skipped.
+    """
+    patterns = list(patterns) if patterns is not None else None
+    pending: List[ArtifactDownload] = []
+    duplicates: List[ArtifactDownload] = []
+    paths_by_url: Dict[str, str] = {}
+    planned_paths = set()
+    skipped = 0
+    for task in tasks:
+        task_directory = os.path.join(
+            directory,
+            _safe_path_component(task.build_variant or ""),
+            _safe_path_component(task.display_name or task.task_id),
+        )
+        for artifact in task.artifacts:
+            if artifact.ignore_for_fetch or not _artifact_matches(artifact, patterns):
+                skipped += 1
+                continue
+
+            if artifact.url in paths_by_url:
+                duplicates.append(
+                    ArtifactDownload(
+                        task.task_id,
+                        artifact.name,
+                        artifact.url,
+                        paths_by_url[artifact.url],
+                        duplicate=True,
+                    )
+                )
+                continue
+
+            path = os.path.join(task_directory, _artifact_file_name(artifact))
+            root, extension = os.path.splitext(path)
+            index = 1
+            while path in planned_paths:
+                path = f"{root}-{index}{extension}"
+                index += 1
+            planned_paths.add(path)
+            paths_by_url[artifact.url] = path
+            pending.append(ArtifactDownload(task.task_id, artifact.name, artifact.url, path))
+    return pending, duplicates, skipped
+
+
+def _download_artifact(
+    download_fn: Callable[[str, str], int], download: ArtifactDownload
+) -> ArtifactDownload:
+    """
+    Download an artifact, recording any error instead of raising it.
+
+    :param download_fn: Function downloading a url to a path, returning the size of the file.
+    :param download: Artifact to download.
+    :return: Outcome of the download.
+    """
+    start = time.monotonic()
+    try:
+        os.makedirs(os.path.dirname(download.path), exist_ok=True)
+        size = download_fn(download.url, download.path)
+    except (OSError, requests.RequestException, DownloadException) as err:
+        LOGGER.warning("Failed to download artifact", url=download.url, error=str(err))
+        return download._replace(seconds=time.monotonic() - start, error=str(err))
+    return download._replace(size=size, seconds=time.monotonic() - start)
+
+
+def download_task_artifacts(
+    download_fn: Callable[[str, str], int],
+    tasks: Iterable["Task"],
+    directory: str,
+    patterns: Optional[Iterable[str]] = None,
+    max_workers: int = DEFAULT_MAX_WORKERS,
+    on_progress: Optional[Callable[[ArtifactDownload, int, int], None]] = None,
+) -> ArtifactDownloadSummary:
+    """
+    Download the artifacts of several tasks concurrently.
+
+    Each artifact is downloaded to `<directory>/<build variant>/<task name>/<file name>`.
+    Artifacts marked `ignore_for_fetch` and artifacts not matching any of the patterns are
+    skipped. Artifacts sharing a url are downloaded once. A failed download does not stop the
+    others, it is reported with its error.
+
+    :param download_fn: Function downloading a url to a path, returning the size of the file.
+    :param tasks: Tasks to download the artifacts of.
+    :param directory: Directory to download the artifacts to.
+    :param patterns: Glob patterns matched against the name of each artifact and the name of its
+        file, None to download all artifacts.
+    :param max_workers: Maximum number of artifacts to download at once.
+    :param on_progress: Function called with the outcome of each download, the number of
+        downloads completed and the total number of downloads.
+    :return: Summary of the downloads.
+    """
+    start = time.monotonic()
+    pending, duplicates, skipped = _plan_artifact_downloads(tasks, directory, patterns)
+    total = len(pending) + len(duplicates)
+    downloads: List[ArtifactDownload] = []
+
+    def _record(download: ArtifactDownload) -> None:
+        downloads.append(download)
+        if on_progress is not None:
+            on_progress(download, len(downloads), total)
+
+    for duplicate in duplicates:
+        _record(duplicate)
+
+    if pending:
+        with ThreadPoolExecutor(max_workers=max(1, min(max_workers, len(pending)))) as executor:
+            futures = [
+                executor.submit(_download_artifact, download_fn, download) for download in pending
+            ]
+            for future in as_completed(futures):
+                _record(future.result())
+
+    return ArtifactDownloadSummary(downloads, skipped, time.monotonic() - start)
@@ -52,3 +52,18 @@ class ActiveTaskMetricsException(MetricsException):
         super(MetricsException, self).__init__(msg)
 
         self.task = task
+
+
+class DownloadException(EvergreenException):
+    """An exception when a download does not produce the expected file."""
+
+    def __init__(self, msg: Optional[str] = None) -> None:
+        """
+        Create a new exception instance.
+
+        :param msg: Message describing exception.
+        """
+        if not msg:
+            msg = "Exception while downloading file"
+
+        super(DownloadException, self).__init__(msg)
@@ -0,0 +1,356 @@
+# -*- encoding: utf-8 -*-
+"""Persistent cache of API responses, revalidated with the server on reuse."""
+from __future__ import absolute_import
+
+import json
+import os
+import sqlite3
+import threading
+from time import time
+from typing import Any, Dict, List, Mapping, NamedTuple, Optional
+
+import structlog
+from requests import PreparedRequest, Response
+from requests.adapters import HTTPAdapter
+from requests.structures import CaseInsensitiveDict
+from requests.utils import get_encoding_from_headers
+
+LOGGER = structlog.getLogger(__name__)
+
+DEFAULT_HTTP_CACHE_MAX_SIZE_BYTES = 256 * 2**20
+DEFAULT_HTTP_CACHE_TIMEOUT_SEC = 30.0
+
+# Headers describing how the body was transferred, which no longer apply to the decoded body
+# stored in the cache.
+_TRANSFER_HEADERS = frozenset({"content-encoding", "content-length", "transfer-encoding"})
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS responses (
+    key TEXT PRIMARY KEY,
+    etag TEXT,
+    last_modified TEXT,
+    headers TEXT NOT NULL,
+    body BLOB NOT NULL,
+    size INTEGER NOT NULL,
+    accessed REAL NOT NULL
+);
+CREATE INDEX IF NOT EXISTS responses_accessed ON responses (accessed);
+"""
+
+
+def default_http_cache_path() -> str:
+    """
+    Get the default location of the response cache.
+
+    :return: Path of the cache database under the user's cache directory.
+    """
+    cache_home = os.environ.get("XDG_CACHE_HOME") or os.path.join(os.path.expanduser("~"), ".cache")
+    return os.path.join(cache_home, "evergreen", "http_cache.sqlite")
+
+
+class CachedResponse(NamedTuple):
+    """Response stored in the cache."""
+
+    etag: Optional[str]
+    last_modified: Optional[str]
+    headers: Dict[str, str]
+    body: bytes
+
+
+class HttpCacheStats(NamedTuple):
+    """Usage statistics of a response cache."""
+
+    revalidated: int
+    stored: int
+    evictions: int
+    entries: int
+    size_bytes: int
+    max_size_bytes: int
+
+
+class HttpCache(object):
+    """
+    Response cache stored in a SQLite database.
+
+    Responses are stored with their `ETag` and `Last-Modified` validators and the least recently
+    used responses are evicted once the cache grows past its maximum size. SQLite's locking makes
+    the cache safe to share between threads and processes. Usage counters are kept per process.
+    """
+
+    def __init__(
+        self,
+        path: Optional[str] = None,
+        max_size_bytes: int = DEFAULT_HTTP_CACHE_MAX_SIZE_BYTES,
+        timeout_sec: float = DEFAULT_HTTP_CACHE_TIMEOUT_SEC,
+    ) -> None:
+        """
+        Create a response cache.
+
+        :param path: Path of the cache database, defaults to `default_http_cache_path()`.
+        :param max_size_bytes: Maximum total size of the cached response bodies.
+        :param timeout_sec: Time to wait for other users of the cache to release it.
+        """
+        self._path = path if path is not None else default_http_cache_path()
+        self._max_size_bytes = max_size_bytes
+        self._timeout_sec = timeout_sec
+        self._local = threading.local()
+        self._connections: List[sqlite3.Connection] = []
+        self._lock = threading.Lock()
+        self._revalidated = 0
+        self._stored = 0
+        self._evictions = 0
+
+    @property
+    def path(self) -> str:
+        """Get the path of the cache database."""
+        return self._path
+
+    def _connection(self) -> sqlite3.Connection:
+        """Get the connection of the current thread to the cache database, opening it if needed."""
+        connection = getattr(self._local, "connection", None)
+        if connection is None:
+            directory = os.path.dirname(self._path)
+            if directory:
+                os.makedirs(directory, exist_ok=True)
+            connection = sqlite3.connect(
+                self._path,
+                timeout=self._timeout_sec,
+                isolation_level=None,
+                check_same_thread=False,
+            )
+            # Write-ahead logging lets readers in other processes continue while a response is
+            # being written.
+            connection.execute("PRAGMA journal_mode=WAL")
+            connection.execute("PRAGMA synchronous=NORMAL")
+            connection.executescript(_SCHEMA)
+            self._local.connection = connection
+            with self._lock:
+                self._connections.append(connection)
+        return connection
+
+    def get(self, key: str) -> Optional[CachedResponse]:
+        """
+        Look up a cached response.
+
+        :param key: Key of the response.
+        :return: The cached response, None if it is not cached.
+        """
+        row = (
+            self._connection()
+            .execute(
+                "SELECT etag, last_modified, headers, body FROM responses WHERE key = ?", (key,)
+            )
+            .fetchone()
+        )
+        if row is None:
+            return None
+        return CachedResponse(
+            etag=row[0], last_modified=row[1], headers=json.loads(row[2]), body=bytes(row[3])
+        )
+
+    def touch(self, key: str) -> None:
+        """
+        Mark a cached response as used after the server confirmed it is still valid.
+
+        :param key: Key of the response.
+        """
+        self._connection().execute("UPDATE responses SET accessed = ? WHERE key = ?", (time(), key))
+        with self._lock:
+            self._revalidated += 1
+
+    def put(
+        self,
+        key: str,
+        etag: Optional[str],
+        last_modified: Optional[str],
+        headers: Mapping[str, str],
+        body: bytes,
+    ) -> None:
+        """
+        Store a response, evicting the least recently used responses if the cache is full.
+
+        Responses larger than the whole cache are not stored.
+
+        :param key: Key of the response.
+        :param etag: ETag of the response.
+        :param last_modified: Last-Modified date of the response.
+        :param headers: Headers of the response.
+        :param body: Body of the response.
+        """
+        if len(body) > self._max_size_bytes:
+            return
+
+        connection = self._connection()
+        # Take the write lock up front so concurrent writers wait on the busy timeout instead of
+        # failing to upgrade a read lock.
+        connection.execute("BEGIN IMMEDIATE")
+        try:
+            connection.execute(
+                "INSERT OR REPLACE INTO responses "
+                "(key, etag, last_modified, headers, body, size, accessed) "
+                "VALUES (?, ?, ?, ?, ?, ?, ?)",
+                (key, etag, last_modified, json.dumps(dict(headers)), body, len(body), time()),
+            )
+            evictions = self._evict(connection)
+            connection.execute("COMMIT")
+        except BaseException:
+            connection.execute("ROLLBACK")
+            raise
+
+        with self._lock:
+            self._stored += 1
+            self._evictions += evictions
+
+    def _evict(self, connection: sqlite3.Connection) -> int:
+        """
+        Remove the least recently used responses until the cache fits its maximum size.
+
+        :param connection: Connection with an open write transaction.
+        :return: Number of responses removed.
+        """
+        (size,) = connection.execute("SELECT COALESCE(SUM(size), 0) FROM responses").fetchone()
+        if size <= self._max_size_bytes:
+            return 0
+
+        evicted = []
+        for key, entry_size in connection.execute(
+            "SELECT key, size FROM responses ORDER BY accessed"
+        ).fetchall():
+            if size <= self._max_size_bytes:
+                break
+            evicted.append((key,))
+            size -= entry_size
+        connection.executemany("DELETE FROM responses WHERE key = ?", evicted)
+        return len(evicted)
+
+    def clear(self) -> None:
+        """Remove all responses from the cache."""
+        self._connection().execute("DELETE FROM responses")
+
+    def stats(self) -> HttpCacheStats:
+        """
+        Get usage statistics of the cache.
+
+        :return: Statistics of the cache.
+        """
+        entries, size = (
+            self._connection()
+            .execute("SELECT COUNT(*), COALESCE(SUM(size), 0) FROM responses")
+            .fetchone()
+        )
+        with self._lock:
+            return HttpCacheStats(
+                revalidated=self._revalidated,
+                stored=self._stored,
+                evictions=self._evictions,
+                entries=entries,
+                size_bytes=size,
+                max_size_bytes=self._max_size_bytes,
+            )
+
+    def close(self) -> None:
+        """Close all connections to the cache database."""
+        with self._lock:
+            for connection in self._connections:
+                connection.close()
+            self._connections = []
+        self._local = threading.local()
+
+
+class CachingHTTPAdapter(HTTPAdapter):
+    """
+    Transport adapter revalidating cached responses with conditional requests.
+
+    GET requests for responses in the cache are sent with `If-None-Match` and
+    `If-Modified-Since` headers. When the server answers 304 Not Modified, the cached body is
+    returned as a 200 response. Successful responses carrying an `ETag` or `Last-Modified` header
+    are stored. Streamed responses are neither cached nor revalidated.
+    """
+
+    def __init__(self, http_cache: HttpCache, **kwargs: Any) -> None:
+        """
+        Create an adapter.
+
+        :param http_cache: Cache to store responses in.
+        :param kwargs: Arguments for `HTTPAdapter`.
+        """
+        self._http_cache = http_cache
+        super(CachingHTTPAdapter, self).__init__(**kwargs)
+
+    def send(  # type: ignore[override]
+        self, request: PreparedRequest, stream: bool = False, **kwargs: Any
+    ) -> Response:
+        """Send a request, revalidating a cached response if there is one."""
+        if request.method != "GET" or stream or not request.url:
+            return super(CachingHTTPAdapter, self).send(request, stream=stream, **kwargs)
+
+        key = request.url
+        cached = self._lookup(key)
+        if cached is not None:
+            if cached.etag:
+                request.headers["If-None-Match"] = cached.etag
+            if cached.last_modified:
+                request.headers["If-Modified-Since"] = cached.last_modified
+
+        response = super(CachingHTTPAdapter, self).send(request, stream=stream, **kwargs)
+        if response.status_code == 304 and cached is not None:
+            return self._revalidated(key, cached, response)
+        if response.status_code == 200:
+            self._store(key, response)
+        return response
+
+    def _lookup(self, key: str) -> Optional[CachedResponse]:
+        """Look up a cached response, treating errors of the cache as a miss."""
+        try:
+            return self._http_cache.get(key)
+        except sqlite3.Error as err:
+            LOGGER.warning("Failed to read from response cache", error=str(err))
+            return None
+
+    def _revalidated(self, key: str, cached: CachedResponse, response: Response) -> Response:
+        """
+        Turn a 304 Not Modified response into the cached response it confirmed.
+
+        :param key: Key of the cached response.
+        :param cached: Cached response.
+        :param response: Not Modified response from the server.
+        :return: Response with the cached body.
+        """
+        headers = CaseInsensitiveDict(cached.headers)
+        headers.update(
+            {
+                name: value
+                for name, value in response.headers.items()
+                if name.lower() not in _TRANSFER_HEADERS
+            }
+        )
+        response.status_code = 200
+        response.reason = "OK"
+        response.headers = headers
+        response.encoding = get_encoding_from_headers(headers)
+        response._content = cached.body
+        response._content_consumed = True  # type: ignore[attr-defined]
+        try:
+            self._http_cache.touch(key)
+        except sqlite3.Error as err:
+            LOGGER.warning("Failed to update response cache", error=str(err))
+        return response
+
+    def _store(self, key: str, response: Response) -> None:
+        """Store a response if it can be revalidated later."""
+        etag = response.headers.get("ETag")
+        last_modified = response.headers.get("Last-Modified")
+        if not etag and not last_modified:
+            return
+        if "no-store" in response.headers.get("Cache-Control", "").lower():
+            return
+
+        headers = {
+            name: value
+            for name, value in response.headers.items()
+            if name.lower() not in _TRANSFER_HEADERS
+        }
+        try:
+            self._http_cache.put(key, etag, last_modified, headers, response.content)
+        except sqlite3.Error as err:
+            LOGGER.warning("Failed to write to response cache", error=str(err))
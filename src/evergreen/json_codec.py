@@ -0,0 +1,227 @@
+# -*- encoding: utf-8 -*-
+"""Codecs used to encode and decode json documents."""
+from __future__ import absolute_import
+
+import codecs
+import json
+from typing import Any, Iterable, Iterator, Optional, Union
+
+import requests
+
+try:
+    import orjson
+except ImportError:  # pragma: no cover
+    orjson = None  # type: ignore[assignment]
+
+STDLIB_CODEC = "json"
+ORJSON_CODEC = "orjson"
+AUTO_CODEC = "auto"
+JSON_CODEC_NAMES = (STDLIB_CODEC, ORJSON_CODEC, AUTO_CODEC)
+
+DEFAULT_STREAM_CHUNK_SIZE = 64 * 1024
+
+_JSON_WHITESPACE = " \t\n\r"
+_JSON_NUMBER_CHARS = "0123456789.eE+-"
+_STREAM_DECODER = json.JSONDecoder()
+
+
+class JsonCodec(object):
+    """Json codec backed by the standard library json module."""
+
+    name = STDLIB_CODEC
+
+    def loads(self, data: Union[str, bytes]) -> Any:
+        """
+        Decode a json document.
+
+        :param data: Json document to decode.
+        :return: Decoded document.
+        """
+        return json.loads(data)
+
+    def dumps(self, data: Any, indent: Optional[int] = None) -> str:
+        """
+        Encode an object as a json document.
+
+        :param data: Object to encode.
+        :param indent: Number of spaces to indent nested structures with.
+        :return: Json document.
+        """
+        return json.dumps(data, indent=indent)
+
+    def decode_response(self, response: requests.Response) -> Any:
+        """
+        Decode the json body of a response.
+
+        :param response: Response to decode.
+        :return: Decoded body of the response.
+        """
+        return response.json()
+
+
+class OrjsonCodec(JsonCodec):
+    """Json codec backed by orjson."""
+
+    name = ORJSON_CODEC
+
+    def __init__(self) -> None:
+        """Create an orjson codec."""
+        if orjson is None:
+            raise ImportError("orjson must be installed to use the orjson json codec")
+
+    def loads(self, data: Union[str, bytes]) -> Any:
+        """
+        Decode a json document.
+
+        :param data: Json document to decode.
+        :return: Decoded document.
+        """
+        return orjson.loads(data)
+
+    def dumps(self, data: Any, indent: Optional[int] = None) -> str:
+        """
+        Encode an object as a json document.
+
+        orjson only supports indenting with 2 spaces, so any indent results in 2 spaces.
+
+        :param data: Object to encode.
+        :param indent: Indent nested structures if set.
+        :return: Json document.
+        """
+        option = orjson.OPT_INDENT_2 if indent else 0
+        return orjson.dumps(data, option=option).decode("utf-8")
+
+    def decode_response(self, response: requests.Response) -> Any:
+        """
+        Decode the json body of a response.
+
+        The raw bytes of the body are decoded directly, skipping the text decoding requests does.
+
+        :param response: Response to decode.
+        :return: Decoded body of the response.
+        """
+        return self.loads(response.content)
+
+
+def get_json_codec(name: str = STDLIB_CODEC) -> JsonCodec:
+    """
+    Get a json codec by name.
+
+    :param name: Name of codec, one of 'json', 'orjson' or 'auto'. 'auto' uses orjson when it is
+        installed and falls back to the standard library otherwise.
+    :return: Json codec.
+    """
+    if name == STDLIB_CODEC:
+        return JsonCodec()
+    if name == ORJSON_CODEC:
+        return OrjsonCodec()
+    if name == AUTO_CODEC:
+        return OrjsonCodec() if orjson is not None else JsonCodec()
+    raise ValueError(f"Unknown json codec '{name}', expected one of {JSON_CODEC_NAMES}")
+
+
+class _JsonArrayReader(object):
+    """Buffered reader over the text of a json document arriving in chunks."""
+
+    def __init__(self, chunks: Iterable[bytes], encoding: str) -> None:
+        """
+        Create a reader.
+
+        :param chunks: Chunks of the json document.
+        :param encoding: Encoding of the document.
+        """
+        self._decoder = codecs.getincrementaldecoder(encoding)()
+        self._chunks = iter(chunks)
+        self.buffer = ""
+        self.pos = 0
+        self.eof = False
+
+    def read(self, min_size: int) -> None:
+        """
+        Drop the consumed text and read chunks until the buffer holds min_size characters.
+
+        :param min_size: Number of characters to read up to, unless the document ends first.
+        """
+        parts = [self.buffer[self.pos :]]
+        size = len(parts[0])
+        while size < min_size and not self.eof:
+            chunk = next(self._chunks, None)
+            self.eof = chunk is None
+            text = self._decoder.decode(chunk or b"", final=self.eof)
+            parts.append(text)
+            size += len(text)
+        self.buffer = "".join(parts)
+        self.pos = 0
+
+    def peek(self) -> str:
+        """
+        Skip whitespace and get the next character.
+
+        :return: Next character, or an empty string at the end of the document.
+        """
+        while True:
+            while self.pos < len(self.buffer) and self.buffer[self.pos] in _JSON_WHITESPACE:
+                self.pos += 1
+            if self.pos < len(self.buffer) or self.eof:
+                return self.buffer[self.pos : self.pos + 1]
+            self.read(1)
+
+    def expect(self, char: str) -> None:
+        """
+        Consume the next character, which must be the given one.
+
+        :param char: Expected character.
+        """
+        if self.peek() != char:
+            raise json.JSONDecodeError(f"Expecting '{char}'", self.buffer, self.pos)
+        self.pos += 1
+
+    def decode_value(self) -> Any:
+        """
+        Decode the next value, reading more chunks until it is complete.
+
+        :return: Decoded value.
+        """
+        while True:
+            self.peek()
+            try:
+                value, end = _STREAM_DECODER.raw_decode(self.buffer, self.pos)
+            except json.JSONDecodeError:
+                if self.eof:
+                    raise
+            else:
+                # A number at the end of the buffer, or stopped at a partial fraction or
+                # exponent, may continue in the next chunk.
+                if self.eof or (
+                    end < len(self.buffer)
+                    and not (
+                        isinstance(value, (int, float)) and self.buffer[end] in _JSON_NUMBER_CHARS
+                    )
+                ):
+                    self.pos = end
+                    return value
+            # Grow the buffer geometrically so large values are not decoded too many times.
+            self.read(2 * (len(self.buffer) - self.pos) + 1)
+
+
+def iter_json_array(chunks: Iterable[bytes], encoding: str = "utf-8") -> Iterator[Any]:
+    """
+    Decode the elements of a json array incrementally from chunks of the document.
+
+    Only the elements being decoded are held in memory, so arrays larger than memory can be
+    processed as long as their elements are consumed as they are generated.
+
+    :param chunks: Chunks of a json document whose top-level value is an array.
+    :param encoding: Encoding of the document.
+    :return: Iterator over the elements of the array.
+    """
+    reader = _JsonArrayReader(chunks, encoding)
+    reader.expect("[")
+    if reader.peek() == "]":
+        return
+
+    while True:
+        yield reader.decode_value()
+        if reader.peek() == "]":
+            return
+        reader.expect(",")
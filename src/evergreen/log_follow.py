@@ -0,0 +1,160 @@
+# -*- encoding: utf-8 -*-
+"""Following the logs of running tasks, fetching only what was added since the last poll."""
+from __future__ import absolute_import
+
+import re
+import time
+from typing import Callable, Dict, Iterator, List, Optional
+
+import requests
+import structlog
+
+LOGGER = structlog.getLogger(__name__)
+
+DEFAULT_MIN_POLL_INTERVAL_SEC = 2.0
+DEFAULT_MAX_POLL_INTERVAL_SEC = 30.0
+DEFAULT_POLL_BACKOFF_FACTOR = 1.5
+_READ_CHUNK_SIZE = 64 * 1024
+# Byte offsets into the log are only meaningful if it is not compressed for the transfer.
+_IDENTITY = {"Accept-Encoding": "identity"}
+_CONTENT_RANGE_START = re.compile(r"\s*bytes (\d+)-")
+
+OpenStream = Callable[[str, Dict[str, str]], requests.Response]
+
+
+class AdaptivePollInterval(object):
+    """Interval between polls that grows while nothing changes and resets when something does."""
+
+    def __init__(
+        self,
+        minimum: float = DEFAULT_MIN_POLL_INTERVAL_SEC,
+        maximum: float = DEFAULT_MAX_POLL_INTERVAL_SEC,
+        factor: float = DEFAULT_POLL_BACKOFF_FACTOR,
+    ) -> None:
+        """
+        Create a poll interval.
+
+        :param minimum: Interval after a poll that found changes.
+        :param maximum: Longest interval between polls.
+        :param factor: Factor the interval grows by after each poll without changes.
+        """
+        self._minimum = minimum
+        self._maximum = max(minimum, maximum)
+        self._factor = factor
+        self._interval = minimum
+
+    def next(self, changed: bool) -> float:
+        """
+        Get the interval to wait before the next poll.
+
+        :param changed: Whether the last poll found changes.
+        :return: Number of seconds to wait.
+        """
+        if changed:
+            self._interval = self._minimum
+            return self._interval
+        interval = self._interval
+        self._interval = min(self._maximum, self._interval * self._factor)
+        return interval
+
+
+class LogFollower(object):
+    """
+    Follow a log as it is written, yielding each line once.
+
+    Each poll asks for the log from the offset reached by the previous one with an HTTP Range
+    request. If the server does not support ranges, the part of the log already seen is skipped
+    as it is read. Polls grow further apart while the log does not change, and the completion of
+    the task is only checked after a poll that found nothing new. Once the task has completed, the
+    log is polled a last time and following stops.
+    """
+
+    def __init__(
+        self,
+        open_stream: OpenStream,
+        log_url: str,
+        is_completed: Optional[Callable[[], bool]] = None,
+        min_poll_interval: float = DEFAULT_MIN_POLL_INTERVAL_SEC,
+        max_poll_interval: float = DEFAULT_MAX_POLL_INTERVAL_SEC,
+        sleep: Callable[[float], None] = time.sleep,
+    ) -> None:
+        """
+        Create a follower of a log.
+
+        :param open_stream: Function sending a GET request with the given headers, returning the
+            response without reading its body. It should raise on error responses.
+        :param log_url: URL of the log.
+        :param is_completed: Function determining whether the task writing the log has completed,
+            None to follow the log until the caller stops iterating.
+        :param min_poll_interval: Number of seconds between polls while the log is growing.
+        :param max_poll_interval: Longest number of seconds between polls.
+        :param sleep: Function used to wait between polls.
+        """
+        self._open_stream = open_stream
+        self._log_url = log_url
+        self._is_completed = is_completed
+        self._interval = AdaptivePollInterval(min_poll_interval, max_poll_interval)
+        self._sleep = sleep
+        self._offset = 0
+        self._partial_line = b""
+
+    def __iter__(self) -> Iterator[str]:
+        """Poll the log until the task has completed, yielding each new line."""
+        while True:
+            offset = self._offset
+            yield from self._poll()
+            changed = self._offset != offset
+            if not changed and self._is_completed is not None and self._is_completed():
+                yield from self._poll()
+                if self._partial_line:
+                    yield self._partial_line.decode("utf-8", errors="replace")
+                return
+            self._sleep(self._interval.next(changed))
+
+    def _poll(self) -> List[str]:
+        """
+        Fetch the part of the log added since the last poll.
+
+        :return: Lines completed since the last poll.
+        """
+        data = self._partial_line + self._fetch()
+        lines = data.split(b"\n")
+        self._partial_line = lines.pop()
+        return [line.rstrip(b"\r").decode("utf-8", errors="replace") for line in lines]
+
+    def _fetch(self) -> bytes:
+        """
+        Fetch the bytes of the log after the current offset and advance the offset past them.
+
+        :return: Bytes added to the log since the last fetch.
+        """
+        headers = dict(_IDENTITY)
+        if self._offset:
+            headers["Range"] = f"bytes={self._offset}-"
+        try:
+            response = self._open_stream(self._log_url, headers)
+        except requests.HTTPError as err:
+            if err.response is not None and err.response.status_code == 416:
+                # Nothing was added after the offset.
+                return b""
+            raise
+
+        with response:
+            # Bytes of the response that were already read, all of them before the offset if
+            # the server ignored the range and sent the whole log.
+            skip = self._offset
+            match = _CONTENT_RANGE_START.match(response.headers.get("Content-Range", ""))
+            if response.status_code == 206 and match is not None:
+                skip = max(0, self._offset - int(match.group(1)))
+            data = bytearray()
+            for chunk in response.iter_content(chunk_size=_READ_CHUNK_SIZE):
+                if skip >= len(chunk):
+                    skip -= len(chunk)
+                    continue
+                data += memoryview(chunk)[skip:]
+                skip = 0
+
+        if skip:
+            LOGGER.warning("Log is shorter than already read", url=self._log_url, missing=skip)
+        self._offset += len(data)
+        return bytes(data)
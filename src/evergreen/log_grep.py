@@ -0,0 +1,211 @@
+# -*- encoding: utf-8 -*-
+"""Searching the logs of many tasks concurrently for regular expressions."""
+from __future__ import absolute_import
+
+import codecs
+import re
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from typing import TYPE_CHECKING, Callable, Iterable, List, NamedTuple, Optional, Pattern, Tuple
+
+import requests
+import structlog
+
+from evergreen.config import DEFAULT_MAX_WORKERS
+
+if TYPE_CHECKING:
+    from evergreen.task import Task  # noqa: F401
+
+LOGGER = structlog.getLogger(__name__)
+
+DEFAULT_GREP_LOG_NAME = "task_log"
+# Fields of tasks needed to search their logs.
+LOG_GREP_TASK_FIELDS = ("task_id", "display_name", "build_variant", "execution", "logs")
+
+StreamLog = Callable[[str], Iterable[bytes]]
+
+
+class LogMatch(NamedTuple):
+    """Location of a match of a pattern in a log."""
+
+    line_number: int
+    start: int
+    end: int
+    pattern: str
+    line: str
+
+
+class TaskLogMatches(NamedTuple):
+    """Matches of the patterns in the log of a task."""
+
+    task_id: str
+    build_variant: Optional[str]
+    display_name: Optional[str]
+    matches: List[LogMatch]
+    error: Optional[str] = None
+
+
+def compile_patterns(patterns: Iterable[str], ignore_case: bool = False) -> List[Pattern[str]]:
+    """
+    Compile the patterns to search logs for.
+
+    :param patterns: Regular expressions.
+    :param ignore_case: Match the patterns without regard to case.
+    :return: Compiled patterns, with `^` and `$` matching at the start and end of each line.
+    """
+    flags = re.MULTILINE | (re.IGNORECASE if ignore_case else 0)
+    return [re.compile(pattern, flags) for pattern in patterns]
+
+
+def _search_block(
+    block: str, patterns: List[Pattern[str]], first_line_number: int, first_match_only: bool
+) -> List[LogMatch]:
+    """
+    Search a block of whole lines of a log.
+
+    The block is searched as a whole rather than line by line, so the lines with no match are
+    only scanned by the regular expression engine.
+
+    :param block: Lines to search.
+    :param patterns: Compiled patterns to search for.
+    :param first_line_number: Line number of the first line of the block.
+    :param first_match_only: Only find the first match in the block.
+    :return: Matches in the block, in the order they appear.
+    """
+    found: List[Tuple[int, int, str]] = []
+    for pattern in patterns:
+        for match in pattern.finditer(block):
+            found.append((match.start(), match.end(), pattern.pattern))
+            if first_match_only:
+                break
+    found.sort()
+    if first_match_only:
+        found = found[:1]
+
+    matches = []
+    line_number = first_line_number
+    position = 0
+    for start, end, pattern_text in found:
+        line_number += block.count("\n", position, start)
+        position = start
+        line_start = block.rfind("\n", 0, start) + 1
+        line_end = block.find("\n", start)
+        if line_end == -1:
+            line_end = len(block)
+        matches.append(
+            LogMatch(
+                line_number,
+                start - line_start,
+                min(end, line_end) - line_start,
+                pattern_text,
+                block[line_start:line_end].rstrip("\r"),
+            )
+        )
+    return matches
+
+
+def search_log(
+    chunks: Iterable[bytes], patterns: List[Pattern[str]], first_match_only: bool = False
+) -> List[LogMatch]:
+    """
+    Search a log for patterns as it is streamed.
+
+    The log is decoded as utf-8 and searched a block of whole lines at a time. Matches are
+    located by the line they start on.
+
+    :param chunks: Chunks of the log.
+    :param patterns: Compiled patterns to search for.
+    :param first_match_only: Stop reading the log at the first match.
+    :return: Matches in the log, in the order they appear.
+    """
+    decoder = codecs.getincrementaldecoder("utf-8")(errors="replace")
+    matches: List[LogMatch] = []
+    partial_line = ""
+    line_number = 1
+    for chunk in chunks:
+        text = partial_line + decoder.decode(chunk)
+        block_end = text.rfind("\n") + 1
+        block, partial_line = text[:block_end], text[block_end:]
+        matches.extend(_search_block(block, patterns, line_number, first_match_only))
+        if first_match_only and matches:
+            return matches
+        line_number += block.count("\n")
+
+    block = partial_line + decoder.decode(b"", final=True)
+    matches.extend(_search_block(block, patterns, line_number, first_match_only))
+    return matches
+
+
+def _grep_task_log(
+    stream_log: StreamLog,
+    task: "Task",
+    log_name: str,
+    patterns: List[Pattern[str]],
+    first_match_only: bool,
+) -> TaskLogMatches:
+    """
+    Search the log of a task, recording any error instead of raising it.
+
+    :param stream_log: Function streaming the contents of a log url in chunks.
+    :param task: Task to search the log of.
+    :param log_name: Name of the log to search.
+    :param patterns: Compiled patterns to search for.
+    :param first_match_only: Stop reading the log at the first match.
+    :return: Matches in the log of the task.
+    """
+    result = TaskLogMatches(task.task_id, task.build_variant, task.display_name, [])
+    log_url = (task.json.get("logs") or {}).get(log_name)
+    if not log_url:
+        return result._replace(error=f"Task has no {log_name}")
+
+    chunks = stream_log(log_url)
+    try:
+        return result._replace(matches=search_log(chunks, patterns, first_match_only))
+    except requests.RequestException as err:
+        LOGGER.warning("Failed to search task log", task_id=task.task_id, error=str(err))
+        return result._replace(error=str(err))
+    finally:
+        # Stops reading the rest of the log after a first match.
+        close = getattr(chunks, "close", None)
+        if close is not None:
+            close()
+
+
+def search_task_logs(
+    stream_log: StreamLog,
+    tasks: Iterable["Task"],
+    patterns: List[Pattern[str]],
+    log_name: str = DEFAULT_GREP_LOG_NAME,
+    first_match_only: bool = False,
+    max_workers: int = DEFAULT_MAX_WORKERS,
+    on_result: Optional[Callable[[TaskLogMatches], None]] = None,
+) -> List[TaskLogMatches]:
+    """
+    Search the logs of several tasks concurrently.
+
+    :param stream_log: Function streaming the contents of a log url in chunks.
+    :param tasks: Tasks to search the logs of.
+    :param patterns: Compiled patterns to search for.
+    :param log_name: Name of the log of each task to search.
+    :param first_match_only: Stop reading the log of a task at its first match.
+    :param max_workers: Maximum number of logs to search at once.
+    :param on_result: Function called with the matches of each task as its search completes.
+    :return: Matches in the log of each task, in the same order as the tasks.
+    """
+    tasks = list(tasks)
+    if not tasks:
+        return []
+
+    results: List[Optional[TaskLogMatches]] = [None] * len(tasks)
+    with ThreadPoolExecutor(max_workers=max(1, min(max_workers, len(tasks)))) as executor:
+        futures = {
+            executor.submit(
+                _grep_task_log, stream_log, task, log_name, patterns, first_match_only
+            ): index
+            for index, task in enumerate(tasks)
+        }
+        for future in as_completed(futures):
+            result = future.result()
+            results[futures[future]] = result
+            if on_result is not None:
+                on_result(result)
+    return [result for result in results if result is not None]
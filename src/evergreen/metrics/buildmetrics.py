@@ -4,7 +4,7 @@ from __future__ import absolute_import, division
 
 from collections import defaultdict
 from datetime import datetime, timedelta
-from typing import TYPE_CHECKING, Callable, Dict, List, Optional
+from typing import TYPE_CHECKING, Callable, Collection, Dict, List, Optional
 
 from structlog import get_logger
 
@@ -18,6 +18,20 @@ if TYPE_CHECKING:
 
 LOGGER = get_logger(__name__)
 
+# Task fields used to calculate build metrics.
+TASK_FIELDS = (
+    "display_only",
+    "finish_time",
+    "generated_by",
+    "ingest_time",
+    "scheduled_time",
+    "start_time",
+    "status",
+    "status_details",
+    "task_id",
+    "time_taken_ms",
+)
+
 
 class BuildMetrics(object):
     """Metrics about an evergreen build."""
@@ -52,15 +66,24 @@ class BuildMetrics(object):
 
         self._display_map: Dict[str, List[Task]] = defaultdict(list)
 
-    def calculate(self, task_filter_fn: Optional[Callable] = None) -> "BuildMetrics":
+    def calculate(
+        self,
+        task_filter_fn: Optional[Callable] = None,
+        task_fields: Optional[Collection[str]] = None,
+    ) -> "BuildMetrics":
         """
         Calculate metrics for the given build.
 
         :param task_filter_fn: function to filter tasks included for metrics, should accept a task
                                argument.
+        :param task_fields: Only keep these fields of the tasks of the build, to reduce memory use.
+                            Should include `TASK_FIELDS` and any field used by `task_filter_fn`.
         :returns: self.
         """
-        all_tasks = self.build.get_tasks()
+        if task_fields is None:
+            all_tasks = self.build.get_tasks()
+        else:
+            all_tasks = self.build.get_tasks(fields=task_fields)
         filtered_task_list = all_tasks
         if task_filter_fn:
             filtered_task_list = [task for task in filtered_task_list if task_filter_fn(task)]
@@ -2,6 +2,7 @@
 """Metrics for an evergreen version."""
 from __future__ import absolute_import, division
 
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
 from typing import TYPE_CHECKING, Callable, Dict, List, Optional
 
@@ -39,17 +40,34 @@ class VersionMetrics(object):
         self.build_metrics: List[BuildMetrics] = []
         self.build_list: Optional[List[Build]] = None
 
-    def calculate(self, task_filter_fn: Optional[Callable] = None) -> "VersionMetrics":
+    def calculate(
+        self, task_filter_fn: Optional[Callable] = None, max_workers: int = 1
+    ) -> "VersionMetrics":
         """
         Calculate metrics for the given build.
 
         :param task_filter_fn: function to filter tasks included for metrics, should accept a task
                                argument.
+        :param max_workers: Number of builds to calculate metrics for concurrently.
         :returns: self.
         """
         self.build_list = self.version.get_builds()
-        for build in self.build_list:
-            self._count_build(build, task_filter_fn)
+        if max_workers > 1 and len(self.build_list) > 1:
+            with ThreadPoolExecutor(max_workers=min(max_workers, len(self.build_list))) as executor:
+                build_metrics_list = list(
+                    executor.map(
+                        lambda build: self._calculate_build(build, task_filter_fn), self.build_list
+                    )
+                )
+        else:
+            build_metrics_list = [
+                self._calculate_build(build, task_filter_fn) for build in self.build_list
+            ]
+
+        # Aggregate in build order so the results match the serial calculation.
+        for build_metrics in build_metrics_list:
+            if build_metrics:
+                self._add_build_metrics(build_metrics)
 
         return self
 
@@ -173,32 +191,56 @@ class VersionMetrics(object):
                                argument.
         :param build: Build to add.
         """
+        build_metrics = self._calculate_build(build, task_filter_fn)
+        if build_metrics:
+            self._add_build_metrics(build_metrics)
+
+    @staticmethod
+    def _calculate_build(
+        build: "Build", task_filter_fn: Optional[Callable]
+    ) -> Optional["BuildMetrics"]:
+        """
+        Calculate the metrics for the given build if it has any data.
+
+        :param build: Build to calculate metrics for.
+        :param task_filter_fn: function to filter tasks included for metrics, should accept a task
+                               argument.
+        :return: Metrics for the build, or None if the build has no data.
+        """
         log = LOGGER.bind(build_id=build.id)
-        if build.activated:
-            log.debug("Processing metrics for build")
-            # If all tasks have been undispatched there is no data.
-            if not build.tasks or build.status_counts.undispatched == len(build.tasks):
-                log.warning("Build had no tasks or all tasks undispatched")
-                return
-
-            build_metrics = build.get_metrics(task_filter_fn)
-            if build_metrics:
-                self.build_metrics.append(build_metrics)
+        if not build.activated:
+            return None
+
+        log.debug("Processing metrics for build")
+        # If all tasks have been undispatched there is no data.
+        if not build.tasks or build.status_counts.undispatched == len(build.tasks):
+            log.warning("Build had no tasks or all tasks undispatched")
+            return None
+
+        return build.get_metrics(task_filter_fn)
+
+    def _add_build_metrics(self, build_metrics: "BuildMetrics") -> None:
+        """
+        Add the given build metrics to the version metrics.
+
+        :param build_metrics: Build metrics to add.
+        """
+        self.build_metrics.append(build_metrics)
 
-                self.total_processing_time += build_metrics.total_processing_time
-                self.task_success_count += build_metrics.success_count
-                self.task_failure_count += build_metrics.failure_count
-                self.task_timeout_count += build_metrics.timed_out_count
-                self.task_system_failure_count += build_metrics.system_failure_count
+        self.total_processing_time += build_metrics.total_processing_time
+        self.task_success_count += build_metrics.success_count
+        self.task_failure_count += build_metrics.failure_count
+        self.task_timeout_count += build_metrics.timed_out_count
+        self.task_system_failure_count += build_metrics.system_failure_count
 
-                if build_metrics.create_time:
-                    self._create_times.append(build_metrics.create_time)
+        if build_metrics.create_time:
+            self._create_times.append(build_metrics.create_time)
 
-                if build_metrics.start_time:
-                    self._start_times.append(build_metrics.start_time)
+        if build_metrics.start_time:
+            self._start_times.append(build_metrics.start_time)
 
-                if build_metrics.end_time:
-                    self._finish_times.append(build_metrics.end_time)
+        if build_metrics.end_time:
+            self._finish_times.append(build_metrics.end_time)
 
     def as_dict(self, include_children: bool = False) -> Dict:
         """
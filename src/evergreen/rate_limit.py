@@ -0,0 +1,342 @@
+# -*- encoding: utf-8 -*-
+"""Client side limits on the rate and concurrency of requests to the API."""
+from __future__ import absolute_import
+
+import math
+import threading
+import time
+from contextlib import contextmanager
+from datetime import datetime, timezone
+from email.utils import parsedate_to_datetime
+from typing import Callable, Dict, Iterator, List, NamedTuple, Optional
+
+THROTTLED_STATUS_CODES = frozenset({429, 503})
+DEFAULT_INITIAL_CONCURRENCY = 4
+DEFAULT_MIN_CONCURRENCY = 1
+DEFAULT_MAX_CONCURRENCY = 64
+DEFAULT_CONCURRENCY_DECREASE_FACTOR = 0.5
+MAX_RETRY_AFTER_SEC = 300.0
+
+
+def parse_retry_after(value: Optional[str]) -> Optional[float]:
+    """
+    Parse the value of a `Retry-After` header.
+
+    :param value: Header value, either a number of seconds or an HTTP date.
+    :return: Number of seconds to wait, None if the value cannot be parsed.
+    """
+    if not value:
+        return None
+
+    try:
+        return min(max(0.0, float(value)), MAX_RETRY_AFTER_SEC)
+    except ValueError:
+        pass
+
+    try:
+        when = parsedate_to_datetime(value)
+    except (TypeError, ValueError):
+        return None
+    if when.tzinfo is None:
+        when = when.replace(tzinfo=timezone.utc)
+    delay = (when - datetime.now(timezone.utc)).total_seconds()
+    return min(max(0.0, delay), MAX_RETRY_AFTER_SEC)
+
+
+class TokenBucket(object):
+    """Thread-safe token bucket limiting the average rate of requests."""
+
+    def __init__(
+        self,
+        rate: float,
+        burst: Optional[float] = None,
+        clock: Callable[[], float] = time.monotonic,
+    ) -> None:
+        """
+        Create a token bucket.
+
+        :param rate: Number of tokens added per second.
+        :param burst: Maximum number of tokens the bucket holds, defaults to one second of tokens.
+        :param clock: Function returning the current time in seconds.
+        """
+        self._rate = rate
+        self._burst = burst if burst is not None else max(1.0, rate)
+        self._clock = clock
+        self._tokens = self._burst
+        self._updated = clock()
+        self._lock = threading.Lock()
+
+    def reserve(self) -> float:
+        """
+        Take a token from the bucket.
+
+        Tokens can be taken ahead of time, the caller then waits for the token to be added.
+
+        :return: Number of seconds to wait before using the token.
+        """
+        with self._lock:
+            now = self._clock()
+            self._tokens = min(self._burst, self._tokens + (now - self._updated) * self._rate)
+            self._updated = now
+            self._tokens -= 1
+            return -self._tokens / self._rate if self._tokens < 0 else 0.0
+
+
+class AdaptiveConcurrencyLimit(object):
+    """
+    Limit on the number of concurrent requests, adjusted from their outcome.
+
+    The limit grows by about one for each limit's worth of successful requests and is cut by a
+    factor when a request is throttled (additive increase, multiplicative decrease). Requests that
+    were already in flight when the limit was cut do not cut it again.
+    """
+
+    def __init__(
+        self,
+        initial: int = DEFAULT_INITIAL_CONCURRENCY,
+        minimum: int = DEFAULT_MIN_CONCURRENCY,
+        maximum: int = DEFAULT_MAX_CONCURRENCY,
+        decrease_factor: float = DEFAULT_CONCURRENCY_DECREASE_FACTOR,
+        clock: Callable[[], float] = time.monotonic,
+    ) -> None:
+        """
+        Create a concurrency limit.
+
+        :param initial: Initial number of concurrent requests allowed.
+        :param minimum: Lowest the limit can be cut to.
+        :param maximum: Highest the limit can grow to.
+        :param decrease_factor: Factor the limit is multiplied by when a request is throttled.
+        :param clock: Function returning the current time in seconds.
+        """
+        self._limit = float(min(max(initial, minimum), maximum))
+        self._minimum = minimum
+        self._maximum = maximum
+        self._decrease_factor = decrease_factor
+        self._clock = clock
+        self._in_flight = 0
+        self._last_decrease = -math.inf
+        self._condition = threading.Condition()
+
+    @property
+    def limit(self) -> int:
+        """Get the current number of concurrent requests allowed."""
+        return int(self._limit)
+
+    @property
+    def in_flight(self) -> int:
+        """Get the number of requests in flight."""
+        return self._in_flight
+
+    def acquire(self, blocking: bool = True) -> float:
+        """
+        Wait until another request is allowed and count it as in flight.
+
+        :param blocking: Wait for the limit to allow the request, if False the request is counted
+            as in flight even if it goes over the limit.
+        :return: Time the request was allowed, to pass to `release`.
+        """
+        with self._condition:
+            while blocking and self._in_flight >= int(self._limit):
+                self._condition.wait()
+            self._in_flight += 1
+            return self._clock()
+
+    def release(self, started_at: float, throttled: Optional[bool]) -> None:
+        """
+        Count a request as completed and adjust the limit from its outcome.
+
+        :param started_at: Time the request was allowed, as returned by `acquire`.
+        :param throttled: True if the server throttled the request, False if it did not and None
+            if the request failed without a response, which leaves the limit unchanged.
+        """
+        with self._condition:
+            self._in_flight -= 1
+            if throttled:
+                if started_at >= self._last_decrease:
+                    self._limit = max(self._minimum, self._limit * self._decrease_factor)
+                    self._last_decrease = self._clock()
+            elif throttled is not None:
+                self._limit = min(self._maximum, self._limit + 1.0 / self._limit)
+            self._condition.notify_all()
+
+
+class RequestPermit(object):
+    """Permission to send a request, used to report how the server answered it."""
+
+    def __init__(self) -> None:
+        """Create a permit for a request without a response yet."""
+        self.throttled: Optional[bool] = None
+        self.retry_after: Optional[float] = None
+
+    def record(self, status_code: int, retry_after: Optional[str] = None) -> None:
+        """
+        Record the response to the request.
+
+        :param status_code: Status code of the response.
+        :param retry_after: Value of the `Retry-After` header of the response.
+        """
+        self.throttled = status_code in THROTTLED_STATUS_CODES
+        if self.throttled:
+            self.retry_after = parse_retry_after(retry_after)
+
+
+class RateLimiterStats(NamedTuple):
+    """Usage statistics of the limits on a single host."""
+
+    host: str
+    concurrency_limit: int
+    in_flight: int
+    requests: int
+    throttled: int
+
+
+class _HostLimits(object):
+    """Limits on the requests to a single host."""
+
+    def __init__(
+        self, bucket: Optional[TokenBucket], concurrency: AdaptiveConcurrencyLimit
+    ) -> None:
+        """
+        Create the limits of a host.
+
+        :param bucket: Token bucket limiting the rate of requests, None for no limit.
+        :param concurrency: Limit on concurrent requests.
+        """
+        self.bucket = bucket
+        self.concurrency = concurrency
+        self.paused_until = -math.inf
+        self.requests = 0
+        self.throttled = 0
+        # Number of permits held by each thread.
+        self.held: Dict[int, int] = {}
+
+
+class RateLimiter(object):
+    """
+    Per-host client side limits on the rate and concurrency of requests.
+
+    Requests to each host wait for a token of a token bucket and for the adaptive concurrency
+    limit of the host to allow them. A throttled response (429 or 503) cuts the concurrency limit
+    and, if it has a `Retry-After` header, holds back all requests to the host until then. A
+    limiter is thread-safe and can be shared between clients.
+
+    The API clients hold the permit of a streamed response until it is closed, so the transfer of
+    its body counts against the concurrency limit. A thread that already holds a permit of a host, such as while
+    it iterates over a streamed response, is not held back by the concurrency limit of the host so
+    it never waits for itself.
+    """
+
+    def __init__(
+        self,
+        rate: Optional[float] = None,
+        burst: Optional[float] = None,
+        initial_concurrency: int = DEFAULT_INITIAL_CONCURRENCY,
+        min_concurrency: int = DEFAULT_MIN_CONCURRENCY,
+        max_concurrency: int = DEFAULT_MAX_CONCURRENCY,
+        decrease_factor: float = DEFAULT_CONCURRENCY_DECREASE_FACTOR,
+        clock: Callable[[], float] = time.monotonic,
+        sleep: Callable[[float], None] = time.sleep,
+    ) -> None:
+        """
+        Create a rate limiter.
+
+        :param rate: Maximum average number of requests per second to each host, None for no
+            limit.
+        :param burst: Number of requests that can be sent at once before the rate applies,
+            defaults to one second of requests.
+        :param initial_concurrency: Initial number of concurrent requests to each host.
+        :param min_concurrency: Lowest the concurrency limit can be cut to.
+        :param max_concurrency: Highest the concurrency limit can grow to.
+        :param decrease_factor: Factor the concurrency limit is multiplied by when a request is
+            throttled.
+        :param clock: Function returning the current time in seconds.
+        :param sleep: Function used to wait.
+        """
+        self._rate = rate
+        self._burst = burst
+        self._initial_concurrency = initial_concurrency
+        self._min_concurrency = min_concurrency
+        self._max_concurrency = max_concurrency
+        self._decrease_factor = decrease_factor
+        self._clock = clock
+        self._sleep = sleep
+        self._hosts: Dict[str, _HostLimits] = {}
+        self._lock = threading.Lock()
+
+    def _host_limits(self, host: str) -> _HostLimits:
+        """Get the limits of a host, creating them on first use."""
+        with self._lock:
+            limits = self._hosts.get(host)
+            if limits is None:
+                bucket = None
+                if self._rate is not None:
+                    bucket = TokenBucket(self._rate, self._burst, self._clock)
+                concurrency = AdaptiveConcurrencyLimit(
+                    self._initial_concurrency,
+                    self._min_concurrency,
+                    self._max_concurrency,
+                    self._decrease_factor,
+                    self._clock,
+                )
+                limits = _HostLimits(bucket, concurrency)
+                self._hosts[host] = limits
+            return limits
+
+    @contextmanager
+    def limit(self, host: str) -> Iterator[RequestPermit]:
+        """
+        Wait until a request to the given host is allowed.
+
+        The response should be recorded on the permit, to adjust the limits of the host.
+
+        :param host: Host the request is sent to.
+        :return: Context manager yielding the permit of the request.
+        """
+        limits = self._host_limits(host)
+        wait = limits.bucket.reserve() if limits.bucket is not None else 0.0
+        with self._lock:
+            wait = max(wait, limits.paused_until - self._clock())
+        if wait > 0:
+            self._sleep(wait)
+
+        thread_id = threading.get_ident()
+        with self._lock:
+            nested = limits.held.get(thread_id, 0) > 0
+        started_at = limits.concurrency.acquire(blocking=not nested)
+        with self._lock:
+            limits.held[thread_id] = limits.held.get(thread_id, 0) + 1
+        permit = RequestPermit()
+        try:
+            yield permit
+        finally:
+            with self._lock:
+                if limits.held[thread_id] == 1:
+                    del limits.held[thread_id]
+                else:
+                    limits.held[thread_id] -= 1
+                limits.requests += 1
+                if permit.throttled:
+                    limits.throttled += 1
+                if permit.retry_after:
+                    limits.paused_until = max(
+                        limits.paused_until, self._clock() + permit.retry_after
+                    )
+            limits.concurrency.release(started_at, permit.throttled)
+
+    def stats(self) -> List[RateLimiterStats]:
+        """
+        Get usage statistics of the limits of each host.
+
+        :return: Statistics for each host requests were sent to.
+        """
+        with self._lock:
+            return [
+                RateLimiterStats(
+                    host=host,
+                    concurrency_limit=limits.concurrency.limit,
+                    in_flight=limits.concurrency.in_flight,
+                    requests=limits.requests,
+                    throttled=limits.throttled,
+                )
+                for host, limits in self._hosts.items()
+            ]
@@ -8,6 +8,9 @@ from typing import TYPE_CHECKING, Any, Callable, Dict, Iterable, List, Optional
 
 from evergreen.api_requests import IssueLinkRequest, MetadataLinkRequest
 from evergreen.base import _BaseEvergreenObject, evg_attrib, evg_datetime_attrib
+from evergreen.config import DEFAULT_MAX_WORKERS
+from evergreen.download import DEFAULT_DOWNLOAD_CHUNK_SIZE, DEFAULT_PARALLEL_RANGES, StreamTarget
+from evergreen.log_follow import DEFAULT_MAX_POLL_INTERVAL_SEC, DEFAULT_MIN_POLL_INTERVAL_SEC
 from evergreen.manifest import Manifest
 from evergreen.task_annotations import TaskAnnotation
 
@@ -44,20 +47,23 @@ class Artifact(_BaseEvergreenObject):
 
     def stream(
         self,
-        decode_unicode: bool = True,
-        chunk_size: Optional[int] = None,
+        decode_unicode: Optional[bool] = None,
+        chunk_size: Optional[int] = DEFAULT_DOWNLOAD_CHUNK_SIZE,
         is_binary: Optional[bool] = None,
     ) -> Iterable[str]:
         """
         Retrieve an iterator of the streamed contents of this artifact.
 
-        :param decode_unicode: determines if we decode as unicode
+        :param decode_unicode: determines if we decode as unicode, defaults to decoding only
+            artifacts that are not binary
         :param chunk_size: the size of the chunks to be read
         :param is_binary: explicit variable, overrides information from content type
         :return: Iterable to stream contents of artifact.
         """
         if is_binary is None:
             is_binary = self._is_binary()
+        if decode_unicode is None:
+            decode_unicode = not is_binary
 
         return self._api._stream_api(
             self.url,
@@ -66,6 +72,49 @@ class Artifact(_BaseEvergreenObject):
             is_binary=is_binary,
         )
 
+    def stream_into(
+        self,
+        target: StreamTarget,
+        chunk_size: int = DEFAULT_DOWNLOAD_CHUNK_SIZE,
+        encoding: Optional[str] = None,
+    ) -> int:
+        """
+        Read the contents of this artifact into a file object, a file descriptor or a buffer.
+
+        The contents are read straight into the target, or through a single buffer reused for
+        every chunk, without creating a bytes object per chunk. They are only decoded when
+        written to a text file.
+
+        :param target: Binary or text file object, file descriptor, or bytearray or memoryview to
+            fill, which must be large enough for the whole artifact.
+        :param chunk_size: Number of bytes to read at a time.
+        :param encoding: Encoding of the artifact when writing to a text file, defaults to the
+            encoding given by the server and then utf-8.
+        :return: Number of bytes read.
+        """
+        return self._api._stream_into(self.url, target, chunk_size=chunk_size, encoding=encoding)
+
+    def download(
+        self,
+        path: str,
+        parallel_ranges: int = DEFAULT_PARALLEL_RANGES,
+        chunk_size: int = DEFAULT_DOWNLOAD_CHUNK_SIZE,
+    ) -> int:
+        """
+        Download this artifact to a file.
+
+        Large artifacts are downloaded over several connections with HTTP Range requests. An
+        interrupted download is resumed by downloading the artifact to the same path again.
+
+        :param path: Path to download the artifact to.
+        :param parallel_ranges: Maximum number of ranges to download at once.
+        :param chunk_size: Number of bytes to read from a response at a time.
+        :return: Size of the artifact in bytes.
+        """
+        return self._api._download_file(
+            self.url, path, parallel_ranges=parallel_ranges, chunk_size=chunk_size
+        )
+
     def _is_binary(self) -> bool:
         """Determine if an artifact is binary based on content_type."""
         _type, subtype = self.content_type.split("/")
@@ -178,6 +227,8 @@ class Task(_BaseEvergreenObject):
     time_taken_ms = evg_attrib("time_taken_ms")
     version_id = evg_attrib("version_id")
 
+    _compact_slots = ("_logs_map",)
+
     def __init__(self, json: Dict[str, Any], api: "EvergreenApi") -> None:
         """Create an instance of an evergreen task."""
         super(Task, self).__init__(json, api)
@@ -223,14 +274,36 @@ class Task(_BaseEvergreenObject):
         """
         return self._api.retrieve_task_log(self.log_map[log_name], raw)
 
-    def stream_log(self, log_name: str) -> Iterable[str]:
+    def stream_log(
+        self,
+        log_name: str,
+        follow: bool = False,
+        min_poll_interval: float = DEFAULT_MIN_POLL_INTERVAL_SEC,
+        max_poll_interval: float = DEFAULT_MAX_POLL_INTERVAL_SEC,
+    ) -> Iterable[str]:
         """
         Retrieve an iterator of a streamed log contents for the given log.
 
         :param log_name: Log to stream.
+        :param follow: Keep streaming the lines added to the log until the task has completed.
+        :param min_poll_interval: Number of seconds between polls while the log is growing.
+        :param max_poll_interval: Longest number of seconds between polls.
         :return: Iterable log contents.
         """
-        return self._api.stream_log(self.log_map[log_name])
+        if not follow or self.is_completed():
+            return self._api.stream_log(self.log_map[log_name])
+        return self._api.stream_log(
+            self.log_map[log_name],
+            follow=True,
+            is_completed=self._poll_completed,
+            min_poll_interval=min_poll_interval,
+            max_poll_interval=max_poll_interval,
+        )
+
+    def _poll_completed(self) -> bool:
+        """Query whether this execution of the task has completed."""
+        task = self._api.task_by_id(self.task_id, execution=self.execution, fields=["status"])
+        return task.is_completed()
 
     @property
     def status_details(self) -> StatusDetails:
@@ -412,7 +485,9 @@ class Task(_BaseEvergreenObject):
         return self._api.num_of_tests_by_task(self.task_id)
 
     def get_execution_tasks(
-        self, filter_fn: Optional[Callable[["Task"], bool]] = None
+        self,
+        filter_fn: Optional[Callable[["Task"], bool]] = None,
+        max_workers: int = DEFAULT_MAX_WORKERS,
     ) -> Optional[List["Task"]]:
         """
         Get a list of execution tasks associated with this task.
@@ -421,13 +496,13 @@ class Task(_BaseEvergreenObject):
         If this is not a display task, returns None.
 
         :param filter_fn: Function to filter returned results.
+        :param max_workers: Maximum number of execution tasks to query for at once.
         :return: List of execution tasks.
         """
         if self.display_only:
-            execution_tasks = [
-                self._api.task_by_id(task_id, fetch_all_executions=True)
-                for task_id in self.execution_tasks
-            ]
+            execution_tasks = self._api.tasks_by_ids(
+                self.execution_tasks, fetch_all_executions=True, max_workers=max_workers
+            )
 
             execution_tasks = [
                 task.get_execution_or_self(self.execution) for task in execution_tasks
@@ -1,8 +1,11 @@
 """Useful utilities for interacting with Evergreen."""
 
+import queue
+import threading
 from datetime import date, datetime
-from typing import Any, Iterable, Optional
+from typing import Any, Callable, Dict, Hashable, Iterable, Iterator, Optional, Tuple, TypeVar
 
+from dateutil import tz
 from dateutil.parser import parse
 
 EVG_DATETIME_FORMAT = "%Y-%m-%dT%H:%M:%S.%fZ"
@@ -10,6 +13,11 @@ EVG_SHORT_DATETIME_FORMAT = "%Y-%m-%dT%H:%M:%SZ"
 EVG_DATE_FORMAT = "%Y-%m-%d"
 EVG_DATE_INPUT_FORMAT = '"%Y-%m-%dT%H:%M:%S.000Z"'
 
+_PREFETCH_POLL_INTERVAL_SEC = 0.1
+_PREFETCH_DONE = object()
+
+T = TypeVar("T")
+
 
 def parse_evergreen_datetime(evg_date: Optional[Any]) -> Optional[datetime]:
     """
@@ -24,9 +32,39 @@ def parse_evergreen_datetime(evg_date: Optional[Any]) -> Optional[datetime]:
     if type(evg_date) in [int, float]:
         return datetime.fromtimestamp(evg_date)
 
+    parsed = _parse_iso_datetime(evg_date)
+    if parsed is not None:
+        return parsed
+
     return parse(evg_date)
 
 
+def _parse_iso_datetime(evg_date: str) -> Optional[datetime]:
+    """
+    Convert an ISO-8601 datetime string, as returned by evergreen, into a datetime object.
+
+    This is a fast path for `parse_evergreen_datetime`, strings with an explicit utc offset or in
+    other formats are left to dateutil.
+
+    :param evg_date: String to convert to a datetime.
+    :return: datetime version of date or None if the string is not in the expected format.
+    """
+    if len(evg_date) < 19 or evg_date[10] != "T":
+        return None
+
+    is_utc = evg_date[-1] == "Z"
+    try:
+        parsed = datetime.fromisoformat(evg_date[:-1] if is_utc else evg_date)
+    except ValueError:
+        return None
+
+    if parsed.tzinfo is not None:
+        return None
+    if is_utc:
+        return parsed.replace(tzinfo=tz.UTC)
+    return parsed
+
+
 def parse_evergreen_short_datetime(evg_date: Optional[str]) -> Optional[datetime]:
     """
     Convert an evergreen datetime string into a datetime object.
@@ -112,3 +150,115 @@ def iterate_by_time_window(
             break
 
         yield item
+
+
+def prefetch(iterable: Iterable[T], depth: int) -> Iterator[T]:
+    """
+    Iterate over an iterable while reading items ahead on a background thread.
+
+    Up to `depth` items are read ahead of the consumer. Exceptions raised by the iterable are
+    re-raised to the consumer, and the background thread stops when the consumer stops iterating.
+
+    :param iterable: Iterable to read ahead on.
+    :param depth: Maximum number of items to read ahead.
+    :return: Iterator over the items of the iterable.
+    """
+    buffer: "queue.Queue[Tuple[Any, Optional[BaseException]]]" = queue.Queue()
+    # A slot is taken before each item is read and freed when the consumer takes the item, so the
+    # items in the buffer and the one being read are never more than `depth`.
+    slots = threading.Semaphore(depth)
+    stopped = threading.Event()
+
+    def take_slot() -> bool:
+        while not stopped.is_set():
+            if slots.acquire(timeout=_PREFETCH_POLL_INTERVAL_SEC):
+                return True
+        return False
+
+    def produce() -> None:
+        error: Optional[Exception] = None
+        try:
+            iterator = iter(iterable)
+            while take_slot():
+                try:
+                    item = next(iterator)
+                except StopIteration:
+                    break
+                buffer.put((item, None))
+        except Exception as err:
+            error = err
+        finally:
+            buffer.put((_PREFETCH_DONE, error))
+
+    thread = threading.Thread(target=produce, name="evergreen-prefetch", daemon=True)
+    thread.start()
+    try:
+        while True:
+            item, err = buffer.get()
+            if item is _PREFETCH_DONE:
+                if err is not None:
+                    raise err
+                return
+            slots.release()
+            yield item
+    finally:
+        stopped.set()
+
+
+class _InFlightCall(object):
+    """Call shared by the callers of a `SingleFlight`."""
+
+    def __init__(self) -> None:
+        """Create a call that has not completed yet."""
+        self.done = threading.Event()
+        self.result: Any = None
+        self.error: Optional[BaseException] = None
+        self.waiters = 0
+
+
+class SingleFlight(object):
+    """
+    Coalesce concurrent calls with the same key into a single call.
+
+    The first caller for a key runs the call, callers arriving while it is in flight wait for it
+    and receive the same result or exception. Results are not kept once the call completes.
+    """
+
+    def __init__(self) -> None:
+        """Create a group of calls."""
+        self._lock = threading.Lock()
+        self._calls: Dict[Hashable, _InFlightCall] = {}
+
+    def do(self, key: Hashable, fn: Callable[[], T]) -> Tuple[T, bool]:
+        """
+        Run a call, or wait for an identical call that is already in flight.
+
+        :param key: Key identifying identical calls.
+        :param fn: Function making the call.
+        :return: Tuple of the result of the call and whether it was shared with another caller.
+        """
+        with self._lock:
+            call = self._calls.get(key)
+            is_leader = call is None
+            if call is None:
+                call = _InFlightCall()
+                self._calls[key] = call
+            else:
+                call.waiters += 1
+
+        if not is_leader:
+            call.done.wait()
+            if call.error is not None:
+                raise call.error
+            return call.result, True
+
+        try:
+            call.result = fn()
+        except BaseException as err:
+            call.error = err
+            raise
+        finally:
+            with self._lock:
+                del self._calls[key]
+            call.done.set()
+        return call.result, call.waiters > 0
@@ -3,12 +3,14 @@
 from __future__ import absolute_import
 
 from enum import Enum
-from typing import TYPE_CHECKING, Any, Callable, Dict, List, Optional
+from typing import TYPE_CHECKING, Any, Callable, Dict, Iterable, List, Optional
 
 import structlog
 
 from evergreen.base import _BaseEvergreenObject, evg_attrib, evg_datetime_attrib
 from evergreen.build import Build
+from evergreen.config import DEFAULT_MAX_WORKERS
+from evergreen.download import ARTIFACT_TASK_FIELDS, ArtifactDownload, ArtifactDownloadSummary
 from evergreen.manifest import ManifestModule
 from evergreen.metrics.versionmetrics import VersionMetrics
 
@@ -177,6 +179,39 @@ class Version(_BaseEvergreenObject):
         """
         return self._api.builds_by_version(self.version_id)
 
+    def download_artifacts(
+        self,
+        directory: str,
+        patterns: Optional[Iterable[str]] = None,
+        max_workers: int = DEFAULT_MAX_WORKERS,
+        parallel_ranges: int = 1,
+        on_progress: Optional[Callable[[ArtifactDownload, int, int], None]] = None,
+    ) -> ArtifactDownloadSummary:
+        """
+        Download the artifacts of all tasks of this version concurrently.
+
+        :param directory: Directory to download the artifacts to.
+        :param patterns: Glob patterns selecting the artifacts to download, None for all.
+        :param max_workers: Maximum number of artifacts to download at once.
+        :param parallel_ranges: Maximum number of ranges of each artifact to download at once.
+        :param on_progress: Function called with the outcome of each download, the number of
+            downloads completed and the total number of downloads.
+        :return: Summary of the downloads.
+        """
+        tasks = (
+            task
+            for build in self.get_builds()
+            for task in build.get_tasks(fields=ARTIFACT_TASK_FIELDS)
+        )
+        return self._api.download_artifacts(
+            tasks,
+            directory,
+            patterns=patterns,
+            max_workers=max_workers,
+            parallel_ranges=parallel_ranges,
+            on_progress=on_progress,
+        )
+
     def is_patch(self) -> bool:
         """
         Determine if this version from a patch build.
@@ -205,7 +240,9 @@ class Version(_BaseEvergreenObject):
             return self._api.patch_by_id(self.version_id)
         return None
 
-    def get_metrics(self, task_filter_fn: Optional[Callable] = None) -> Optional[VersionMetrics]:
+    def get_metrics(
+        self, task_filter_fn: Optional[Callable] = None, max_workers: int = 1
+    ) -> Optional[VersionMetrics]:
         """
         Calculate the metrics for this version.
 
@@ -213,10 +250,11 @@ class Version(_BaseEvergreenObject):
 
         :param task_filter_fn: function to filter tasks included for metrics, should accept a task
                                argument.
+        :param max_workers: Number of builds to calculate metrics for concurrently.
         :return: Metrics for this version.
         """
         if self.status != EVG_VERSION_STATUS_CREATED:
-            return VersionMetrics(self).calculate(task_filter_fn)
+            return VersionMetrics(self).calculate(task_filter_fn, max_workers=max_workers)
         return None
 
     def __repr__(self) -> str:
@@ -3,10 +3,12 @@ import os
 from unittest.mock import MagicMock
 
 import pytest
+import requests
 import yaml
 
 from evergreen.api import CachedEvergreenApi, EvergreenApi, RetryingEvergreenApi
 from evergreen.config import EvgAuth
+from evergreen.task import Task
 from evergreen.version import Requester
 
 TESTS_DIRECTORY = os.path.dirname(os.path.abspath(__file__))
@@ -237,3 +239,31 @@ def requester_value(request):
 def commit_queue_patch():
     """Return sample commit queue patch json."""
     return get_sample_json("commit_queue_patch.json")
+
+
+@pytest.fixture()
+def create_task():
+    """Return a function creating a task from its id and other json fields."""
+
+    def _create_task(task_id, build_variant="linux", display_name=None, **fields):
+        task_json = {
+            "task_id": task_id,
+            "build_variant": build_variant,
+            "display_name": display_name or f"name_{task_id}",
+        }
+        task_json.update(fields)
+        return Task(task_json, None)
+
+    return _create_task
+
+
+@pytest.fixture()
+def open_stream():
+    """Return a function sending a streamed GET request, raising on error responses."""
+
+    def _open_stream(url, headers):
+        response = requests.get(url, headers=headers, stream=True)
+        response.raise_for_status()
+        return response
+
+    return _open_stream
@@ -4,6 +4,8 @@ import json
 from datetime import datetime
 
 from evergreen import Manifest, TaskStats, TestStats, Version
+from evergreen.download import ArtifactDownload, ArtifactDownloadSummary
+from evergreen.log_grep import LOG_GREP_TASK_FIELDS, LogMatch, TaskLogMatches
 from evergreen.resource_type_permissions import (
     PermissionableResourceType,
     RemovablePermission,
@@ -70,6 +72,46 @@ def test_list_patches(monkeypatch, sample_patch, output_fmt):
     if output_fmt == "--json":
         assert len(json.loads(result.output)) == 5
     assert sample_patch["patch_id"] in result.output
+    evg_api_mock.patches_by_project.assert_called_once_with("project", limit=5)
+
+
+@pytest.mark.parametrize("codec", ["json", "orjson"])
+def test_json_codec(monkeypatch, sample_patch, codec):
+    if codec == "orjson":
+        pytest.importorskip("orjson")
+    evg_api_mock = _create_api_mock(monkeypatch)
+    evg_api_mock.patches_by_project.return_value = [Patch(sample_patch, None) for _ in range(2)]
+
+    runner = CliRunner()
+    cmd_list = ["--json", "--json-codec", codec, "list-patches", "--project", "project"]
+    result = runner.invoke(under_test.cli, cmd_list)
+    assert result.exit_code == 0
+    assert json.loads(result.output) == [sample_patch, sample_patch]
+    api_kwargs = under_test.EvergreenApi.get_api.call_args.kwargs
+    assert api_kwargs["json_codec"].name == codec
+
+
+def test_http_cache(monkeypatch, sample_patch, tmp_path):
+    evg_api_mock = _create_api_mock(monkeypatch)
+    evg_api_mock.patches_by_project.return_value = [Patch(sample_patch, None)]
+    cache_path = tmp_path / "cache.sqlite"
+
+    runner = CliRunner()
+    cmd_list = ["--http-cache-path", str(cache_path), "list-patches", "--project", "project"]
+    result = runner.invoke(under_test.cli, cmd_list)
+    assert result.exit_code == 0
+    api_kwargs = under_test.EvergreenApi.get_api.call_args.kwargs
+    assert api_kwargs["http_cache"].path == str(cache_path)
+
+
+def test_http_cache_is_disabled_by_default(monkeypatch, sample_patch):
+    evg_api_mock = _create_api_mock(monkeypatch)
+    evg_api_mock.patches_by_project.return_value = [Patch(sample_patch, None)]
+
+    runner = CliRunner()
+    result = runner.invoke(under_test.cli, ["list-patches", "--project", "project"])
+    assert result.exit_code == 0
+    assert under_test.EvergreenApi.get_api.call_args.kwargs["http_cache"] is None
 
 
 def test_list_projects(monkeypatch, sample_project, output_fmt):
@@ -214,6 +256,18 @@ def test_version_stats(monkeypatch, output_fmt):
     assert "version_id" in mock_version_by_id.call_args[0]
 
 
+def test_version_stats_with_jobs(monkeypatch):
+    mock_version = MagicMock(version_id="version_id")
+    evg_api_mock = _create_api_mock(monkeypatch)
+    evg_api_mock.version_by_id.return_value = mock_version
+
+    runner = CliRunner()
+    result = runner.invoke(under_test.cli, ["version-stats", "-v", "version_id", "--jobs", "8"])
+
+    assert result.exit_code == 0
+    mock_version.get_metrics.assert_called_once_with(max_workers=8)
+
+
 def test_build_stats(monkeypatch, output_fmt):
     mock_build_metrics = MagicMock()
     mock_build_metrics.as_dict.return_value = "get_metrics_as_dict"
@@ -237,6 +291,124 @@ def test_build_stats(monkeypatch, output_fmt):
     assert "build_id" in mock_build_by_id.call_args[0]
 
 
+def _download_summary(*downloads):
+    def download_artifacts(directory, patterns, max_workers, parallel_ranges, on_progress):
+        for i, download in enumerate(downloads):
+            on_progress(download, i + 1, len(downloads))
+        return ArtifactDownloadSummary(list(downloads), skipped=1, seconds=2.0)
+
+    return download_artifacts
+
+
+def test_download_artifacts_of_build(monkeypatch, output_fmt):
+    evg_api_mock = _create_api_mock(monkeypatch)
+    mock_build = evg_api_mock.build_by_id.return_value
+    mock_build.download_artifacts.side_effect = _download_summary(
+        ArtifactDownload("t1", "binaries", "https://s3/bin.tgz", "out/bin.tgz", 2048, 1.0)
+    )
+    cmd_list = ["download-artifacts", "--build", "build_id", "-p", "*.tgz", "-d", "out", "-j", "2"]
+    if output_fmt:
+        cmd_list = [output_fmt] + cmd_list
+
+    result = CliRunner().invoke(under_test.cli, cmd_list)
+
+    assert result.exit_code == 0
+    evg_api_mock.build_by_id.assert_called_once_with("build_id")
+    kwargs = mock_build.download_artifacts.call_args[1]
+    assert kwargs["patterns"] == ("*.tgz",)
+    assert kwargs["max_workers"] == 2
+    assert "out/bin.tgz" in result.output
+    if not output_fmt:
+        assert "Downloaded 1 artifacts (2.0 KiB)" in result.output
+
+
+def test_download_artifacts_of_version_fails_if_a_download_fails(monkeypatch):
+    evg_api_mock = _create_api_mock(monkeypatch)
+    mock_version = evg_api_mock.version_by_id.return_value
+    mock_version.download_artifacts.side_effect = _download_summary(
+        ArtifactDownload("t1", "logs", "https://s3/logs", "logs", error="connection reset")
+    )
+
+    result = CliRunner().invoke(under_test.cli, ["download-artifacts", "--version", "version_id"])
+
+    assert result.exit_code == 1
+    assert "failed: connection reset" in result.output
+    mock_version.download_artifacts.assert_called_once()
+
+
+def test_download_artifacts_requires_a_build_or_version(monkeypatch):
+    _create_api_mock(monkeypatch)
+
+    result = CliRunner().invoke(under_test.cli, ["download-artifacts"])
+
+    assert result.exit_code != 0
+    assert "Exactly one of --build or --version" in result.output
+
+
+def _grep_results(*results):
+    def grep_logs(*args, on_result, **kwargs):
+        for result in results:
+            on_result(result)
+        return list(results)
+
+    return grep_logs
+
+
+def test_grep_logs_of_build(monkeypatch, output_fmt):
+    evg_api_mock = _create_api_mock(monkeypatch)
+    mock_build = evg_api_mock.build_by_id.return_value
+    match = LogMatch(12, 9, 27, "Segmentation fault", "[mongod] Segmentation fault")
+    mock_build.grep_logs.side_effect = _grep_results(
+        TaskLogMatches("t1", "linux", "jsCore", [match]),
+        TaskLogMatches("t2", "linux", "lint", []),
+    )
+    cmd_list = ["grep-logs", "--build", "build_id", "-e", "Segmentation fault", "-l", "-j", "4"]
+    if output_fmt:
+        cmd_list = [output_fmt] + cmd_list
+
+    result = CliRunner().invoke(under_test.cli, cmd_list)
+
+    assert result.exit_code == 0
+    args, kwargs = mock_build.grep_logs.call_args
+    assert args == (("Segmentation fault",),)
+    assert kwargs["first_match_only"]
+    assert kwargs["max_workers"] == 4
+    assert kwargs["log_name"] == "task_log"
+    if output_fmt:
+        assert "Segmentation fault" in result.output
+    else:
+        assert "linux/jsCore:12:[mongod] Segmentation fault" in result.output
+
+
+def test_grep_logs_of_tasks_without_matches(monkeypatch):
+    evg_api_mock = _create_api_mock(monkeypatch)
+    evg_api_mock.grep_task_logs.side_effect = _grep_results(
+        TaskLogMatches("t1", "linux", "lint", [])
+    )
+
+    result = CliRunner().invoke(
+        under_test.cli, ["grep-logs", "-t", "t1", "-t", "t2", "-e", "fault", "--log", "all_log"]
+    )
+
+    assert result.exit_code == 1
+    evg_api_mock.tasks_by_ids.assert_called_once_with(
+        ("t1", "t2"), max_workers=8, fields=LOG_GREP_TASK_FIELDS
+    )
+    assert evg_api_mock.grep_task_logs.call_args[1]["log_name"] == "all_log"
+
+
+def test_grep_logs_reports_errors(monkeypatch):
+    evg_api_mock = _create_api_mock(monkeypatch)
+    evg_api_mock.grep_task_logs.side_effect = _grep_results(
+        TaskLogMatches("t1", "linux", "lint", [], error="connection reset")
+    )
+
+    result = CliRunner().invoke(under_test.cli, ["grep-logs", "-t", "t1", "-e", "fault"])
+
+    assert result.exit_code == 2
+    assert "t1: connection reset" in result.output
+
+
 def test_manifest(monkeypatch, sample_manifest, output_fmt):
     evg_api_mock = _create_api_mock(monkeypatch)
     mock_manifest = MagicMock()
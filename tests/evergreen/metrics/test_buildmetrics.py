@@ -54,6 +54,27 @@ class TestBuildMetrics(object):
         assert len(build_metrics._start_times) == n_tasks
         assert len(build_metrics._finish_times) == n_tasks
 
+    def test_task_fields_are_enough_to_calculate_metrics(self, sample_task):
+        tasks = []
+        for status, generated_by in [("success", None), ("failed", "gen"), ("failed", None)]:
+            task = dict(sample_task, status=status)
+            if generated_by:
+                task["generated_by"] = generated_by
+            tasks.append(task)
+        projected = [
+            {field: task[field] for field in under_test.TASK_FIELDS if field in task}
+            for task in tasks
+        ]
+        mock_build = create_mock_build([Task(task, None) for task in projected])
+
+        metrics = under_test.BuildMetrics(mock_build).calculate(task_fields=under_test.TASK_FIELDS)
+        full_metrics = under_test.BuildMetrics(
+            create_mock_build([Task(task, None) for task in tasks])
+        ).calculate()
+
+        mock_build.get_tasks.assert_called_once_with(fields=under_test.TASK_FIELDS)
+        assert metrics.as_dict() == full_metrics.as_dict()
+
     def test_adding_successful_task(self, sample_task):
         sample_task["status"] = "success"
         task = Task(sample_task, None)
@@ -70,6 +70,40 @@ class TestVersionMetrics(object):
         assert version_metrics.pct_tasks_system_failure == 0
         assert version_metrics.pct_tasks_timeout == 0
 
+    def test_parallel_calculation_matches_serial(self):
+        now = datetime.now()
+        build_list = []
+        for i in range(8):
+            build_metrics = mock_build_metrics(success_count=i)
+            build_metrics.failure_count = i % 3
+            build_metrics.total_processing_time = i * 10
+            build_metrics.create_time = now + timedelta(minutes=i)
+            build_metrics.start_time = now + timedelta(minutes=2 * i)
+            build_metrics.end_time = now + timedelta(minutes=30 - i)
+            build_list.append(create_mock_build(build_metrics))
+        mock_version = create_mock_version(build_list)
+
+        serial = under_test.VersionMetrics(mock_version).calculate()
+        parallel = under_test.VersionMetrics(mock_version).calculate(max_workers=4)
+
+        assert parallel.as_dict() == serial.as_dict()
+        assert parallel.makespan == serial.makespan
+        assert parallel.wait_time == serial.wait_time
+        assert parallel.build_metrics == serial.build_metrics
+
+    def test_parallel_calculation_passes_filter(self):
+        build_list = create_mock_build_list(3, mock_build_metrics(1))
+        mock_version = create_mock_version(build_list)
+        filter_fn = MagicMock()
+
+        version_metrics = under_test.VersionMetrics(mock_version).calculate(
+            filter_fn, max_workers=3
+        )
+
+        assert version_metrics.task_success_count == 3
+        for build in build_list:
+            build.get_metrics.assert_called_once_with(filter_fn)
+
     def test_add_success_build(self):
         build_metrics = mock_build_metrics()
         build_metrics.success_count = 5
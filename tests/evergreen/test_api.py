@@ -1,22 +1,36 @@
+import asyncio
 import json
+import logging
 import os
 import re
 import sys
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
 from copy import deepcopy
 from datetime import datetime, timedelta
 from http import HTTPStatus
 from json.decoder import JSONDecodeError
-from unittest.mock import MagicMock, patch
+from unittest.mock import MagicMock, PropertyMock, patch
 
 import pytest
 import responses
 from requests.exceptions import HTTPError
+from structlog.testing import capture_logs
 
 import evergreen.api as under_test
 from evergreen.api_requests import IssueLinkRequest, MetadataLinkRequest, SlackAttachment
+from evergreen.base import compact_class
+from evergreen.cache import TtlCache
 from evergreen.config import DEFAULT_API_SERVER, DEFAULT_NETWORK_TIMEOUT_SEC
+from evergreen.json_codec import JsonCodec, get_json_codec
+from evergreen.rate_limit import RateLimiter
 from evergreen.resource_type_permissions import PermissionableResourceType, RemovablePermission
-from evergreen.util import EVG_DATETIME_FORMAT, parse_evergreen_datetime
+from evergreen.util import (
+    EVG_DATETIME_FORMAT,
+    format_evergreen_datetime,
+    parse_evergreen_datetime,
+)
 from evergreen.version import Requester
 
 
@@ -85,6 +99,145 @@ class TestRaiseForStatus(object):
         assert error_msg in str(excinfo.value)
         mocked_response.raise_for_status.assert_not_called()
 
+    def test_successful_responses_are_not_decoded(self, mocked_api, mocked_api_response):
+        mocked_api._raise_for_status(mocked_api_response)
+
+        mocked_api_response.json.assert_not_called()
+        mocked_api_response.raise_for_status.assert_called_once()
+
+
+class TestPagination(object):
+    def test_each_page_is_decoded_once(self, mocked_api):
+        first_page = MagicMock(status_code=200, links={"next": {"url": "http://url/2"}})
+        first_page.json.return_value = ["item 1", "item 2"]
+        second_page = MagicMock(status_code=200, links={})
+        second_page.json.return_value = ["item 3"]
+        mocked_api.session.request.side_effect = [first_page, second_page]
+
+        results = mocked_api._paginate("http://url")
+
+        assert results == ["item 1", "item 2", "item 3"]
+        first_page.json.assert_called_once()
+        second_page.json.assert_called_once()
+
+    def test_limit_sizes_last_page(self, mocked_api):
+        first_page = MagicMock(status_code=200, links={"next": {"url": "http://url/?limit=3&p=2"}})
+        first_page.json.return_value = ["item 1", "item 2"]
+        second_page = MagicMock(status_code=200, links={"next": {"url": "http://url/?p=3"}})
+        second_page.json.return_value = ["item 3", "item 4"]
+        mocked_api.session.request.side_effect = [first_page, second_page]
+
+        results = mocked_api._paginate("http://url", {"limit": 3})
+
+        assert results == ["item 1", "item 2", "item 3"]
+        assert mocked_api.session.request.call_args.kwargs["url"] == "http://url/?p=2&limit=1"
+        assert mocked_api.pagination_stats() == under_test.PaginationStats(pages=2, results=4)
+
+
+class TestRequestLogging(object):
+    @staticmethod
+    def _create_api(**kwargs):
+        api = under_test.EvergreenApi(**kwargs)
+        response = MagicMock(status_code=200, content=b"0123456789", encoding="utf-8")
+        response.request.url = "http://url/endpoint"
+        type(response).text = PropertyMock(side_effect=AssertionError("text was decoded"))
+        api._session = MagicMock()
+        api._session.request.return_value = response
+        return api
+
+    @pytest.mark.parametrize("debug_enabled", [True, False])
+    def test_response_text_is_not_decoded(self, debug_enabled):
+        api = self._create_api()
+
+        with patch(ns("_is_log_enabled"), return_value=debug_enabled), capture_logs() as logs:
+            api._call_api("http://url/endpoint")
+
+        received = [log for log in logs if log["event"] == "Response received"]
+        assert len(received) == (1 if debug_enabled else 0)
+        assert all("response_body" not in log for log in received)
+
+    def test_response_body_is_truncated(self):
+        api = self._create_api(log_response_body_size=4)
+
+        with patch(ns("_is_log_enabled"), return_value=True), capture_logs() as logs:
+            api._call_api("http://url/endpoint")
+
+        received = [log for log in logs if log["event"] == "Response received"]
+        assert received[0]["response_body"] == "0123... (6 more bytes)"
+
+    def test_request_timing_is_reported(self):
+        timings = []
+        api = self._create_api(on_request_timing=timings.append)
+
+        api._call_api("http://url/endpoint", method="POST")
+
+        assert len(timings) == 1
+        assert timings[0].method == "POST"
+        assert timings[0].url == "http://url/endpoint"
+        assert timings[0].status_code == 200
+        assert timings[0].response_size == 10
+        assert timings[0].duration_sec >= 0
+
+    @pytest.mark.parametrize("threshold, log_level", [(-1, "info"), (60, "debug")])
+    def test_slow_requests_are_logged_at_info(self, threshold, log_level):
+        api = self._create_api(slow_request_threshold_sec=threshold)
+
+        with patch(ns("_is_log_enabled"), return_value=True), capture_logs() as logs:
+            api._call_api("http://url/endpoint")
+
+        completed = [log for log in logs if log["event"] == "Request completed."]
+        assert completed[0]["log_level"] == log_level
+        assert completed[0]["url"] == "http://url/endpoint"
+
+    def test_debug_disabled_with_default_logging(self):
+        under_test.EvergreenApi()
+
+        assert not under_test._is_log_enabled(logging.DEBUG)
+
+
+class TestJsonCodec(object):
+    def test_stdlib_codec_is_used_by_default(self):
+        api = under_test.EvergreenApi()
+
+        assert isinstance(api.json_codec, JsonCodec)
+        assert api.json_codec.name == "json"
+
+    def test_responses_are_decoded_with_codec(self, mocked_api_response):
+        codec = MagicMock()
+        codec.decode_response.return_value = [{"test_file": "test"}]
+        api = under_test.EvergreenApi(json_codec=codec)
+        api._session = MagicMock()
+        api._session.request.return_value = mocked_api_response
+        mocked_api_response.links = {}
+
+        tests = api.tests_by_task("task_id")
+
+        assert tests[0].test_file == "test"
+        codec.decode_response.assert_called_once_with(mocked_api_response)
+        mocked_api_response.json.assert_not_called()
+
+    @responses.activate
+    def test_orjson_decodes_same_pages_as_stdlib(self):
+        pytest.importorskip("orjson")
+        responses.add(
+            responses.GET,
+            f"{DEFAULT_API_SERVER}/rest/v2/tasks/task_id/tests",
+            json=[{"test_file": "tést", "status": "pass"}],
+        )
+        results = {}
+        for name in ["json", "orjson"]:
+            api = under_test.EvergreenApi(json_codec=get_json_codec(name))
+            results[name] = [test.json for test in api.tests_by_task("task_id")]
+
+        assert results["json"] == results["orjson"]
+
+    def test_with_session_keeps_codec(self):
+        codec = JsonCodec()
+        api = under_test.EvergreenApi(json_codec=codec)
+
+        with api.with_session() as session_api:
+            assert session_api.json_codec is codec
+
 
 class TestLazyPagination(object):
     def test_with_no_next(self, mocked_api):
@@ -117,16 +270,136 @@ class TestLazyPagination(object):
         assert i > items_to_check
 
 
+class TestPrefetchingLazyPagination(object):
+    @staticmethod
+    def _paged_responses(pages):
+        responses = []
+        for i, page in enumerate(pages):
+            response = MagicMock(status_code=200)
+            response.json.return_value = page
+            response.links = {"next": {"url": f"http://url/{i + 1}"}} if i + 1 < len(pages) else {}
+            responses.append(response)
+        return responses
+
+    @pytest.mark.parametrize("prefetch_pages", [0, 1, 3])
+    def test_results_match_serial_pagination(self, mocked_api, prefetch_pages):
+        pages = [[f"item {i}.{j}" for j in range(3)] for i in range(5)]
+        mocked_api.session.request.side_effect = self._paged_responses(pages)
+
+        results = list(mocked_api._lazy_paginate("http://url", prefetch_pages=prefetch_pages))
+
+        assert results == [item for page in pages for item in page]
+        assert mocked_api.session.request.call_count == len(pages)
+
+    @pytest.mark.parametrize("prefetch_pages", [0, 2])
+    def test_max_results(self, mocked_api, prefetch_pages):
+        pages = [[f"item {i}.{j}" for j in range(3)] for i in range(5)]
+        mocked_api.session.request.side_effect = self._paged_responses(pages)
+
+        results = list(
+            mocked_api._lazy_paginate(
+                "http://url", {"limit": 3}, prefetch_pages=prefetch_pages, max_results=5
+            )
+        )
+
+        assert results == ["item 0.0", "item 0.1", "item 0.2", "item 1.0", "item 1.1"]
+        assert mocked_api.session.request.call_count == 2
+        last_call = mocked_api.session.request.call_args.kwargs
+        assert last_call["url"] == "http://url/1"
+        assert last_call["params"] == {"limit": 2}
+        assert mocked_api.pagination_stats().pages == 2
+
+    def test_client_default_is_used(self, mocked_api):
+        mocked_api._prefetch_pages = 2
+        pages = [["item 1"], ["item 2"]]
+        mocked_api.session.request.side_effect = self._paged_responses(pages)
+
+        with patch(ns("prefetch"), wraps=under_test.prefetch) as prefetch_mock:
+            results = list(mocked_api._lazy_paginate("http://url"))
+
+        assert results == ["item 1", "item 2"]
+        assert prefetch_mock.call_args[0][1] == 2
+
+    def test_errors_are_raised_to_consumer(self, mocked_api):
+        responses = self._paged_responses([["item 1"], ["item 2"]])
+        responses[1].raise_for_status.side_effect = HTTPError()
+        mocked_api.session.request.side_effect = responses
+
+        results = mocked_api._lazy_paginate("http://url", prefetch_pages=2)
+
+        assert next(results) == "item 1"
+        with pytest.raises(HTTPError):
+            next(results)
+
+
+class TestStreamedPagination(object):
+    @staticmethod
+    def _streamed_responses(pages, chunk_size=5):
+        responses = []
+        for i, page in enumerate(pages):
+            body = json.dumps(page).encode()
+            response = MagicMock(status_code=200, encoding=None)
+            response.iter_content.return_value = [
+                body[j : j + chunk_size] for j in range(0, len(body), chunk_size)
+            ]
+            response.links = {"next": {"url": f"http://url/{i + 1}"}} if i + 1 < len(pages) else {}
+            responses.append(response)
+        return responses
+
+    def test_results_match_pagination(self, mocked_api, sample_test):
+        mocked_api._stream_json_pages = True
+        pages = [[dict(sample_test, test_file=f"test {i}.{j}") for j in range(3)] for i in range(3)]
+        responses = self._streamed_responses(pages)
+        mocked_api.session.get.side_effect = responses
+
+        results = list(mocked_api._lazy_paginate("http://url"))
+
+        assert results == [item for page in pages for item in page]
+        mocked_api.session.request.assert_not_called()
+        assert mocked_api.session.get.call_args.kwargs["stream"] is True
+        assert all(response.close.called for response in responses)
+
+    def test_stops_at_empty_page(self, mocked_api):
+        mocked_api._stream_json_pages = True
+        responses = self._streamed_responses([["item"], [], ["unreachable"]])
+        mocked_api.session.get.side_effect = responses
+
+        assert list(mocked_api._lazy_paginate("http://url")) == ["item"]
+        assert mocked_api.session.get.call_count == 2
+
+    def test_max_results(self, mocked_api):
+        mocked_api._stream_json_pages = True
+        responses = self._streamed_responses([["a", "b"], ["c", "d"], ["unreachable"]])
+        mocked_api.session.get.side_effect = responses
+
+        results = list(mocked_api._lazy_paginate("http://url", {"limit": 2}, max_results=3))
+
+        assert results == ["a", "b", "c"]
+        assert mocked_api.session.get.call_count == 2
+        assert mocked_api.session.get.call_args.kwargs["params"] == {"limit": 1}
+        assert all(response.close.called for response in responses[:2])
+        assert mocked_api.pagination_stats() == under_test.PaginationStats(pages=2, results=3)
+
+    def test_errors_are_raised(self, mocked_api):
+        mocked_api._stream_json_pages = True
+        responses = self._streamed_responses([["item"]])
+        responses[0].raise_for_status.side_effect = HTTPError()
+        mocked_api.session.get.side_effect = responses
+
+        with pytest.raises(HTTPError):
+            list(mocked_api._lazy_paginate("http://url"))
+        responses[0].close.assert_called_once()
+
+
 class TestSessions(object):
-    def test_session_can_be_created(self):
+    def test_session_is_reused(self):
         evg_api = under_test.EvergreenApi()
 
         session_instance_one = evg_api.session
         session_instance_two = evg_api.session
 
         assert session_instance_one is not None
-        assert session_instance_two is not None
-        assert session_instance_one != session_instance_two
+        assert session_instance_one is session_instance_two
 
     def test_with_session_creates_a_new_session(self):
         original_evg_api = under_test.EvergreenApi()
@@ -138,6 +411,39 @@ class TestSessions(object):
             assert session_instance_one == session_instance_two
             assert original_evg_api.session != evg_api_with_session.session
 
+    def test_session_uses_configured_pool_size(self):
+        evg_api = under_test.EvergreenApi(pool_connections=3, pool_maxsize=25)
+
+        adapter = evg_api.session.get_adapter(evg_api._create_url("/tasks"))
+
+        assert adapter._pool_connections == 3
+        assert adapter._pool_maxsize == 25
+
+    def test_close_discards_session(self):
+        evg_api = under_test.EvergreenApi()
+        session = evg_api.session
+
+        evg_api.close()
+
+        assert evg_api.session is not session
+
+    def test_connection_pool_stats_without_session(self):
+        evg_api = under_test.EvergreenApi()
+
+        assert evg_api.connection_pool_stats() == []
+
+    def test_connection_pool_stats(self):
+        evg_api = under_test.EvergreenApi(pool_maxsize=4)
+        adapter = evg_api.session.get_adapter(evg_api._create_url("/tasks"))
+        adapter.poolmanager.connection_from_url(evg_api._create_url("/tasks"))
+
+        stats = evg_api.connection_pool_stats()
+
+        assert len(stats) == 1
+        assert stats[0].host == "evergreen.mongodb.com"
+        assert stats[0].maxsize == 4
+        assert stats[0].num_requests == 0
+
 
 class TestDistrosApi(object):
     def test_all_distros(self, mocked_api):
@@ -259,6 +565,37 @@ class TestProjectApi(object):
         assert len(windowed_list) == 1
         assert version_list[1]["version_id"] == windowed_list[0].version_id
 
+    def test_versions_by_project_time_window_skips_newer_versions(self, mocked_api, sample_version):
+        first_time = parse_evergreen_datetime(sample_version["create_time"])
+        versions = [
+            dict(
+                sample_version,
+                order=order,
+                version_id=f"version_{order}",
+                create_time=(first_time + timedelta(hours=order)).strftime(EVG_DATETIME_FORMAT),
+            )
+            for order in range(1000, 0, -1)
+        ]
+
+        def versions_endpoint(url, params, **kwargs):
+            response = MagicMock(status_code=200, links={})
+            start = params.get("start", 1001)
+            matching = [version for version in versions if version["order"] < start]
+            response.json.return_value = matching[: params.get("limit", 100)]
+            return response
+
+        mocked_api.session.request.side_effect = versions_endpoint
+        before = first_time + timedelta(hours=300, minutes=30)
+        after = first_time + timedelta(hours=250)
+
+        windowed = list(mocked_api.versions_by_project_time_window("project_id", before, after))
+
+        assert [version.order for version in windowed] == list(range(300, 249, -1))
+        # The binary search takes one request per step, instead of paging through the 700 newer
+        # versions.
+        assert mocked_api.session.request.call_count <= 12
+        assert mocked_api.session.request.call_args.kwargs["params"]["start"] == 301
+
     def test_patches_by_project(self, mocked_api):
         patches = mocked_api.patches_by_project("project_id")
         next(patches)
@@ -267,6 +604,42 @@ class TestProjectApi(object):
             url=expected_url, params={"limit": 100}, timeout=None, data=None, method="GET"
         )
 
+    def test_patches_by_project_with_limit(self, mocked_api, sample_patch):
+        mocked_api.session.request.return_value.json.return_value = [sample_patch] * 5
+
+        patches = list(mocked_api.patches_by_project("project_id", limit=5))
+
+        assert len(patches) == 5
+        expected_url = mocked_api._create_url("/projects/project_id/patches")
+        mocked_api.session.request.assert_called_once_with(
+            url=expected_url, params={"limit": 5}, timeout=None, data=None, method="GET"
+        )
+
+    def test_patches_by_project_stop_at_short_page_of_limit(self, mocked_api, sample_patch):
+        mocked_api.session.request.return_value.json.return_value = [sample_patch] * 3
+
+        patches = list(mocked_api.patches_by_project("project_id", params={"limit": 10}, limit=4))
+
+        assert len(patches) == 3
+        assert mocked_api.session.request.call_count == 1
+        assert mocked_api.pagination_stats() == under_test.PaginationStats(pages=1, results=3)
+
+    def test_patches_by_project_continue_past_pages_capped_by_server(
+        self, mocked_api, sample_patch
+    ):
+        pages = [[sample_patch] * 2, [sample_patch] * 2, [sample_patch], []]
+        page_responses = []
+        for page in pages:
+            response = MagicMock(status_code=200)
+            response.json.return_value = page
+            page_responses.append(response)
+        mocked_api.session.request.side_effect = page_responses
+
+        patches = list(mocked_api.patches_by_project("project_id", params={"limit": 10}))
+
+        assert len(patches) == 5
+        assert mocked_api.session.request.call_count == 4
+
     def test_patches_by_user(self, mocked_api):
         patches = mocked_api.patches_by_user("user_id")
         next(patches)
@@ -321,6 +694,8 @@ class TestProjectApi(object):
 
         assert len(windowed_list) == 1
         assert patch_list[1]["patch_id"] == windowed_list[0].patch_id
+        params = mocked_api.session.request.call_args.kwargs["params"]
+        assert params["start_at"] == format_evergreen_datetime(before_date)
 
     def test_commit_queue_for_project(self, mocked_api):
         mocked_api.commit_queue_for_project("project_id")
@@ -437,6 +812,20 @@ class TestProjectApi(object):
             url=expected_url, params={"status": ["status1"]}, timeout=None, data=None, method="GET"
         )
 
+    def test_iter_tasks_by_project(self, mocked_api, sample_task):
+        pages = [[sample_task], [sample_task]]
+        mocked_api.session.request.side_effect = TestPrefetchingLazyPagination._paged_responses(
+            pages
+        )
+
+        tasks = list(mocked_api.iter_tasks_by_project("project_id", statuses=["success"]))
+
+        assert tasks == [under_test.Task(sample_task, mocked_api)] * 2
+        expected_url = mocked_api._create_url("/projects/project_id/versions/tasks")
+        mocked_api.session.request.assert_any_call(
+            url=expected_url, params={"status": ["success"]}, timeout=None, data=None, method="GET"
+        )
+
     def test_tasks_by_project_and_name(self, mocked_api):
         mocked_api.tasks_by_project_and_name("project_id", "task_name")
         expected_url = mocked_api._create_url("/projects/project_id/tasks/task_name")
@@ -485,6 +874,31 @@ class TestTaskStatsByProject(object):
             url=expected_url, params=expected_params, timeout=None, data=None, method="GET"
         )
 
+    def test_iter_task_stats(self, mocked_api):
+        after_date = "2020-04-04"
+        before_date = "2020-05-04"
+        expected_url = mocked_api._create_url("/projects/project_id/task_stats")
+        mocked_api.session.request.return_value.json.return_value = [{"task_name": "task_0"}]
+        mocked_api.session.request.return_value.links = {}
+
+        stats = list(
+            mocked_api.iter_task_stats_by_project(
+                "project_id",
+                after_date=from_iso_format(after_date),
+                before_date=from_iso_format(before_date),
+                tasks=["task_0"],
+            )
+        )
+
+        assert [stat.task_name for stat in stats] == ["task_0"]
+        mocked_api.session.request.assert_called_with(
+            url=expected_url,
+            params={"after_date": after_date, "before_date": before_date, "tasks": ["task_0"]},
+            timeout=None,
+            data=None,
+            method="GET",
+        )
+
 
 class TestBuildApi(object):
     def test_build_by_id(self, mocked_api):
@@ -501,6 +915,75 @@ class TestBuildApi(object):
             url=expected_url, params={}, timeout=None, data=None, method="GET"
         )
 
+    @pytest.mark.parametrize("compact_models", [True, False])
+    def test_tasks_by_build_with_compact_models(
+        self, mocked_api_response, sample_task, compact_models
+    ):
+        mocked_api_response.json.return_value = [sample_task]
+        mocked_api_response.links = {}
+        api = under_test.EvergreenApi(compact_models=compact_models)
+        api._session = MagicMock()
+        api._session.request.return_value = mocked_api_response
+
+        tasks = api.tasks_by_build("build_id")
+
+        assert isinstance(tasks[0], under_test.Task)
+        assert (type(tasks[0]) is compact_class(under_test.Task)) == compact_models
+        assert tasks[0].task_id == sample_task["task_id"]
+
+    def test_tasks_by_build_with_fields(self, mocked_api, sample_task):
+        pages = [[sample_task], [sample_task]]
+        responses = TestPrefetchingLazyPagination._paged_responses(pages)
+        mocked_api.session.request.side_effect = responses
+
+        tasks = mocked_api.tasks_by_build("build_id", fields=["task_id", "status", "missing"])
+
+        assert len(tasks) == 2
+        for task in tasks:
+            assert task.json == {"task_id": sample_task["task_id"], "status": "success"}
+
+    def test_iter_tasks_by_build_stops_early(self, mocked_api, sample_task):
+        pages = [[sample_task, sample_task], [sample_task]]
+        mocked_api.session.request.side_effect = TestPrefetchingLazyPagination._paged_responses(
+            pages
+        )
+
+        tasks = mocked_api.iter_tasks_by_build("build_id", fields=["task_id"])
+        task = next(tasks)
+
+        assert task.json == {"task_id": sample_task["task_id"]}
+        assert mocked_api.session.request.call_count == 1
+
+    def test_iter_tasks_by_build_streamed(self, mocked_api, sample_task):
+        mocked_api._stream_json_pages = True
+        pages = [[sample_task], [sample_task]]
+        mocked_api.session.get.side_effect = TestStreamedPagination._streamed_responses(pages)
+
+        tasks = list(mocked_api.iter_tasks_by_build("build_id", fetch_all_executions=True))
+
+        assert tasks == [under_test.Task(sample_task, mocked_api)] * 2
+        assert mocked_api.session.get.call_args_list[0].kwargs["params"] == {
+            "fetch_all_executions": 1
+        }
+
+    def test_task_by_id_with_fields(self, mocked_api, sample_task):
+        mocked_api.session.request.return_value.json.return_value = sample_task
+
+        task = mocked_api.task_by_id("task_id", fields=["status", "start_time"])
+
+        assert task.json == {"status": "success", "start_time": sample_task["start_time"]}
+        assert task.start_time is not None
+
+    def test_projected_tasks_are_cached_complete(self, mocked_api, sample_task):
+        mocked_api._object_cache = TtlCache()
+        mocked_api.session.request.return_value.json.return_value = sample_task
+
+        mocked_api.task_by_id("task_id", execution=1, fields=["status"])
+        task = mocked_api.task_by_id("task_id", execution=1)
+
+        assert task.json == sample_task
+        assert mocked_api.session.request.call_count == 1
+
 
 class TestVersionApi(object):
     def test_version_by_id(self, mocked_api):
@@ -517,6 +1000,17 @@ class TestVersionApi(object):
             url=expected_url, params=None, timeout=None, data=None, method="GET"
         )
 
+    def test_iter_builds_by_version(self, mocked_api, sample_build):
+        pages = [[sample_build], [sample_build]]
+        mocked_api.session.request.side_effect = TestPrefetchingLazyPagination._paged_responses(
+            pages
+        )
+
+        builds = list(mocked_api.iter_builds_by_version("version_id", fields=["_id"]))
+
+        assert [build.json for build in builds] == [{"_id": sample_build["_id"]}] * 2
+        assert mocked_api.session.request.call_count == 2
+
 
 class TestPatchApi(object):
     def test_patch_by_id(self, mocked_api):
@@ -753,6 +1247,26 @@ class TestTaskApi(object):
             url=expected_url, params=expected_params, timeout=None, data=None, method="GET"
         )
 
+    @pytest.mark.parametrize("max_workers", [1, 4])
+    def test_tasks_by_ids_keeps_order(self, mocked_api, sample_task, max_workers):
+        task_ids = [f"task_{i}" for i in range(10)]
+
+        def request(url, **kwargs):
+            response = MagicMock(status_code=200)
+            response.json.return_value = dict(sample_task, task_id=url.rsplit("/", 1)[-1])
+            return response
+
+        mocked_api.session.request.side_effect = request
+
+        tasks = mocked_api.tasks_by_ids(
+            task_ids, fetch_all_executions=True, max_workers=max_workers
+        )
+
+        assert [task.task_id for task in tasks] == task_ids
+        assert mocked_api.session.request.call_count == len(task_ids)
+        for call in mocked_api.session.request.call_args_list:
+            assert call.kwargs["params"] == {"fetch_all_executions": True}
+
     def test_manifest_for_task(self, mocked_api):
         mocked_api.manifest_for_task("task_id")
         expected_url = mocked_api._create_url("/tasks/task_id/manifest")
@@ -815,6 +1329,19 @@ class TestTaskApi(object):
             url=expected_url, params=expected_params, timeout=None, data=None, method="GET"
         )
 
+    def test_iter_tests_by_task(self, mocked_api, sample_test):
+        mocked_api.session.request.return_value.json.return_value = [sample_test]
+        mocked_api.session.request.return_value.links = {}
+
+        tests = list(mocked_api.iter_tests_by_task("task_id", status="fail", execution=5))
+
+        assert tests == [under_test.Tst(sample_test, mocked_api)]
+        expected_url = mocked_api._create_url("/tasks/task_id/tests")
+        expected_params = {"status": "fail", "execution": 5}
+        mocked_api.session.request.assert_called_with(
+            url=expected_url, params=expected_params, timeout=None, data=None, method="GET"
+        )
+
     def test_num_of_tests_by_task(self, mocked_api):
         mocked_api.num_of_tests_by_task("task_id")
         expected_url = mocked_api._create_url("/tasks/task_id/tests/count")
@@ -830,6 +1357,11 @@ class TestTaskApi(object):
             url=expected_url, params=expected_params, timeout=None, data=None, method="GET"
         )
 
+    def test_get_task_annotation_with_no_annotations(self, mocked_api, mocked_api_response):
+        mocked_api_response.json.return_value = None
+
+        assert mocked_api.get_task_annotation("task_id") == []
+
     def test_get_task_annotation_with_invalid_parameters(self, mocked_api):
         with pytest.raises(ValueError):
             mocked_api.get_task_annotation("task_id", execution=5, fetch_all_executions=True)
@@ -1140,6 +1672,13 @@ class TestCachedEvergreenApi(object):
         assert mocked_cached_api.version_by_id(another_version_id)
         assert mocked_cached_api.session.request.call_count == 2
 
+    def test_tasks_by_build_is_cached_by_fields(self, mocked_cached_api):
+        mocked_cached_api.tasks_by_build("build id")
+        mocked_cached_api.tasks_by_build("build id", fields=["status"])
+        mocked_cached_api.tasks_by_build("build id", fields=["status"])
+
+        assert mocked_cached_api.session.request.call_count == 2
+
     def test_clear_caches(self, mocked_cached_api):
         build_id = "some build id"
         version_id = "some version id"
@@ -1150,6 +1689,353 @@ class TestCachedEvergreenApi(object):
         assert mocked_cached_api.version_by_id(version_id)
         assert mocked_cached_api.session.request.call_count == 4
 
+    def test_completed_builds_are_cached_without_expiry(self, mocked_cached_api):
+        mocked_cached_api.session.request.return_value.json.return_value = {
+            "_id": "build id",
+            "status": "success",
+        }
+        clock = MagicMock(return_value=0.0)
+        mocked_cached_api._cache._clock = clock
+
+        mocked_cached_api.build_by_id("build id")
+        clock.return_value = 10**6
+        mocked_cached_api.build_by_id("build id")
+
+        assert mocked_cached_api.session.request.call_count == 1
+
+    def test_active_builds_expire(self, mocked_cached_api):
+        mocked_cached_api.session.request.return_value.json.return_value = {
+            "_id": "build id",
+            "status": "started",
+        }
+        clock = MagicMock(return_value=0.0)
+        mocked_cached_api._cache._clock = clock
+
+        mocked_cached_api.build_by_id("build id")
+        clock.return_value = under_test.DEFAULT_CACHE_TTL.active + 1
+        mocked_cached_api.build_by_id("build id")
+
+        assert mocked_cached_api.session.request.call_count == 2
+        assert mocked_cached_api.cache_stats().expirations == 1
+
+    def test_empty_task_lists_expire(self, mocked_cached_api):
+        mocked_cached_api.session.request.return_value.json.return_value = []
+        clock = MagicMock(return_value=0.0)
+        mocked_cached_api._cache._clock = clock
+
+        assert mocked_cached_api.tasks_by_build("build id") == []
+        clock.return_value = under_test.DEFAULT_CACHE_TTL.active + 1
+        mocked_cached_api.tasks_by_build("build id")
+
+        assert mocked_cached_api.session.request.call_count == 2
+
+    def test_cache_ttls_can_be_configured_per_endpoint(self, mocked_cached_api):
+        mocked_cached_api._cache_ttls = {"version_by_id": under_test.CacheTtl(0, 0)}
+
+        mocked_cached_api.version_by_id("version id")
+        mocked_cached_api.version_by_id("version id")
+        mocked_cached_api.build_by_id("build id")
+        mocked_cached_api.build_by_id("build id")
+
+        assert mocked_cached_api.session.request.call_count == 3
+
+    def test_cache_stats(self, mocked_cached_api):
+        mocked_cached_api.build_by_id("build id")
+        mocked_cached_api.build_by_id("build id")
+        mocked_cached_api.version_by_id("version id")
+
+        stats = mocked_cached_api.cache_stats()
+        assert stats.hits == 1
+        assert stats.misses == 2
+        assert stats.entries == 2
+        assert stats.max_entries == under_test.CACHE_SIZE
+
+    def test_caches_are_per_instance(self, mocked_cached_api):
+        another_api = under_test.CachedEvergreenApi(cache_size=1)
+
+        mocked_cached_api.build_by_id("build id")
+
+        assert another_api.cache_stats().entries == 0
+        assert another_api.cache_stats().max_entries == 1
+
+
+class TestRateLimiting(object):
+    def test_throttled_responses_back_off(self, mocked_api):
+        sleeps = []
+        limiter = RateLimiter(initial_concurrency=4, sleep=sleeps.append)
+        mocked_api._rate_limiter = limiter
+        throttled = MagicMock(status_code=429, headers={"Retry-After": "1"})
+        throttled.raise_for_status.side_effect = HTTPError()
+        mocked_api.session.request.return_value = throttled
+
+        with pytest.raises(HTTPError):
+            mocked_api.version_by_id("version_id")
+        mocked_api.session.request.return_value = MagicMock(status_code=200, headers={})
+        mocked_api.version_by_id("version_id")
+
+        assert len(sleeps) == 1 and 0 < sleeps[0] <= 1
+        (stats,) = limiter.stats()
+        assert stats.host == "evergreen.mongodb.com"
+        assert stats.requests == 2
+        assert stats.throttled == 1
+        assert stats.concurrency_limit == 2
+
+    def test_streamed_requests_are_limited(self, mocked_api):
+        limiter = RateLimiter()
+        mocked_api._rate_limiter = limiter
+        response = mocked_api.session.get.return_value
+        response.status_code = 200
+        response.headers = {}
+        response.__enter__.return_value = response
+        response.iter_lines.return_value = ["line"]
+
+        assert list(mocked_api.stream_log("https://logs.example.com/log")) == ["line"]
+
+        (stats,) = limiter.stats()
+        assert stats.host == "logs.example.com"
+        assert stats.requests == 1
+
+    def test_streamed_body_holds_permit_until_closed(self, mocked_api):
+        limiter = RateLimiter()
+        mocked_api._rate_limiter = limiter
+        response = mocked_api.session.get.return_value
+        response.status_code = 200
+        response.headers = {}
+        close = response.close
+
+        streamed = mocked_api._open_stream("https://artifacts.example.com/file")
+
+        assert limiter.stats()[0].in_flight == 1
+        streamed.close()
+        close.assert_called_once()
+        assert limiter.stats()[0].in_flight == 0
+
+    def test_streamed_lines_hold_permit_until_read(self, mocked_api):
+        limiter = RateLimiter()
+        mocked_api._rate_limiter = limiter
+        response = mocked_api.session.get.return_value
+        response.status_code = 200
+        response.headers = {}
+        response.__enter__.return_value = response
+        response.iter_lines.return_value = ["line 1", "line 2"]
+
+        lines = iter(mocked_api.stream_log("https://logs.example.com/log"))
+
+        assert next(lines) == "line 1"
+        assert limiter.stats()[0].in_flight == 1
+        assert list(lines) == ["line 2"]
+        assert limiter.stats()[0].in_flight == 0
+
+    def test_limiter_is_shared_with_sessions(self, mocked_api):
+        mocked_api._rate_limiter = RateLimiter()
+
+        with mocked_api.with_session() as session_api:
+            assert session_api._rate_limiter is mocked_api._rate_limiter
+
+
+class TestRequestCoalescing(object):
+    def _blocking_session(self, api, release):
+        response = api.session.request.return_value
+
+        def request(**kwargs):
+            release.wait()
+            return response
+
+        api.session.request.side_effect = request
+
+    def test_concurrent_identical_gets_are_coalesced(self, mocked_api):
+        release = threading.Event()
+        self._blocking_session(mocked_api, release)
+
+        with ThreadPoolExecutor(max_workers=3) as executor:
+            futures = [executor.submit(mocked_api.build_by_id, "build id") for _ in range(3)]
+            deadline = time.time() + 5
+            while time.time() < deadline:
+                calls = list(mocked_api._single_flight._calls.values())
+                if calls and calls[0].waiters == 2:
+                    break
+                time.sleep(0.01)
+            release.set()
+            builds = [future.result() for future in futures]
+
+        assert mocked_api.session.request.call_count == 1
+        assert len(builds) == 3
+
+    def test_coalescing_can_be_disabled(self, mocked_api_response):
+        api = under_test.EvergreenApi(coalesce_requests=False)
+        api._session = MagicMock()
+        api._session.request.return_value = mocked_api_response
+
+        with ThreadPoolExecutor(max_workers=2) as executor:
+            list(executor.map(api.build_by_id, ["build id"] * 2))
+
+        assert api._single_flight is None
+        assert api.session.request.call_count == 2
+
+    def test_writes_are_not_coalesced(self, mocked_api):
+        with patch.object(mocked_api._single_flight, "do") as do_mock:
+            mocked_api._call_api("url", method="POST", data="{}")
+
+        do_mock.assert_not_called()
+        assert mocked_api.session.request.call_count == 1
+
+    def test_sessions_share_in_flight_requests(self, mocked_api):
+        with mocked_api.with_session() as session_api:
+            assert session_api._single_flight is mocked_api._single_flight
+
+
+class TestObjectCache(object):
+    @pytest.fixture()
+    def object_cache_api(self, mocked_api):
+        mocked_api._object_cache = TtlCache()
+        return mocked_api
+
+    def test_completed_task_executions_are_cached(self, object_cache_api, sample_task):
+        object_cache_api.session.request.return_value.json.return_value = sample_task
+
+        object_cache_api.task_by_id(sample_task["task_id"], execution=1)
+        task = object_cache_api.task_by_id(sample_task["task_id"], execution=1)
+
+        assert task.task_id == sample_task["task_id"]
+        assert object_cache_api.session.request.call_count == 1
+
+    def test_latest_task_execution_is_always_queried(self, object_cache_api, sample_task):
+        object_cache_api.session.request.return_value.json.return_value = sample_task
+
+        object_cache_api.task_by_id(sample_task["task_id"])
+        object_cache_api.task_by_id(sample_task["task_id"])
+        object_cache_api.task_by_id(sample_task["task_id"], execution=1)
+
+        assert object_cache_api.session.request.call_count == 2
+
+    def test_active_tasks_are_not_cached(self, object_cache_api, sample_task):
+        sample_task["status"] = "started"
+        object_cache_api.session.request.return_value.json.return_value = sample_task
+
+        object_cache_api.task_by_id(sample_task["task_id"], execution=1)
+        object_cache_api.task_by_id(sample_task["task_id"], execution=1)
+
+        assert object_cache_api.session.request.call_count == 2
+
+    def test_tests_of_completed_tasks_are_cached(self, object_cache_api, sample_task, sample_test):
+        response = object_cache_api.session.request.return_value
+        response.json.return_value = sample_task
+        task = object_cache_api.task_by_id(sample_task["task_id"])
+        response.json.return_value = [sample_test]
+
+        task.get_tests()
+        tests = task.get_tests()
+
+        assert tests[0].test_file == sample_test["test_file"]
+        assert object_cache_api.session.request.call_count == 2
+
+    def test_tests_of_unknown_tasks_are_not_cached(self, object_cache_api, sample_test):
+        object_cache_api.session.request.return_value.json.return_value = [sample_test]
+
+        object_cache_api.tests_by_task("task_id", execution=0)
+        object_cache_api.tests_by_task("task_id", execution=0)
+
+        assert object_cache_api.session.request.call_count == 2
+
+    def test_performance_results_of_restarted_tasks_are_not_cached(
+        self, object_cache_api, sample_task, sample_performance_results
+    ):
+        response = object_cache_api.session.request.return_value
+        response.json.return_value = sample_task
+        object_cache_api.task_by_id(sample_task["task_id"])
+        response.json.return_value = sample_performance_results
+        object_cache_api.performance_results_by_task(sample_task["task_id"])
+        object_cache_api.performance_results_by_task(sample_task["task_id"])
+        assert object_cache_api.session.request.call_count == 2
+
+        response.json.return_value = dict(sample_task, status="started", execution=2)
+        object_cache_api.task_by_id(sample_task["task_id"])
+        response.json.return_value = sample_performance_results
+        object_cache_api.performance_results_by_task(sample_task["task_id"])
+        assert object_cache_api.session.request.call_count == 4
+
+    def test_old_completed_execution_does_not_mark_running_task_completed(
+        self, object_cache_api, sample_task, sample_test, sample_performance_results
+    ):
+        task_id = sample_task["task_id"]
+        response = object_cache_api.session.request.return_value
+        response.json.return_value = dict(sample_task, status="started", execution=1)
+        object_cache_api.task_by_id(task_id)
+        response.json.return_value = dict(sample_task, execution=0)
+        object_cache_api.task_by_id(task_id, execution=0)
+        assert object_cache_api._latest_completed_execution(task_id) is None
+
+        response.json.return_value = sample_performance_results
+        object_cache_api.performance_results_by_task(task_id)
+        object_cache_api.performance_results_by_task(task_id)
+        response.json.return_value = [sample_test]
+        object_cache_api.tests_by_task(task_id)
+        object_cache_api.tests_by_task(task_id)
+        object_cache_api.tests_by_task(task_id, execution=0)
+        object_cache_api.tests_by_task(task_id, execution=0)
+
+        assert object_cache_api.session.request.call_count == 7
+
+    def test_performance_results_of_task_restarted_between_polls_are_queried(
+        self, object_cache_api, sample_task, sample_performance_results
+    ):
+        task_id = sample_task["task_id"]
+        response = object_cache_api.session.request.return_value
+        response.json.return_value = dict(sample_task, execution=0)
+        object_cache_api.task_by_id(task_id)
+        response.json.return_value = sample_performance_results
+        object_cache_api.performance_results_by_task(task_id)
+
+        # The restarted execution completed before the task was queried again.
+        response.json.return_value = dict(sample_task, execution=1)
+        object_cache_api.task_by_id(task_id)
+        response.json.return_value = sample_performance_results
+        object_cache_api.performance_results_by_task(task_id)
+        object_cache_api.performance_results_by_task(task_id)
+
+        assert object_cache_api.session.request.call_count == 4
+
+    def test_builds_restarted_after_completing_are_queried(self, object_cache_api, sample_build):
+        completed_build = dict(sample_build, status="success")
+        restarted_build = dict(sample_build, status="started")
+        object_cache_api.session.request.return_value.json.side_effect = [
+            completed_build,
+            restarted_build,
+        ]
+
+        assert object_cache_api.build_by_id(sample_build["_id"]).is_completed()
+        build = object_cache_api.build_by_id(sample_build["_id"])
+
+        assert build.status == "started"
+        assert not build.is_completed()
+        assert object_cache_api.session.request.call_count == 2
+
+    def test_active_versions_are_not_cached(self, object_cache_api, sample_version):
+        object_cache_api.session.request.return_value.json.return_value = sample_version
+
+        object_cache_api.version_by_id(sample_version["version_id"])
+        object_cache_api.version_by_id(sample_version["version_id"])
+
+        assert object_cache_api.session.request.call_count == 2
+
+    def test_manifests_are_cached(self, object_cache_api, sample_manifest):
+        object_cache_api.session.request.return_value.json.return_value = sample_manifest
+
+        object_cache_api.manifest_for_task("task_id")
+        manifest = object_cache_api.manifest_for_task("task_id")
+
+        assert manifest.id == sample_manifest["id"]
+        assert object_cache_api.session.request.call_count == 1
+
+    def test_object_cache_is_shared(self, object_cache_api, sample_manifest):
+        object_cache_api.session.request.return_value.json.return_value = sample_manifest
+        object_cache_api.manifest_for_task("task_id")
+
+        with object_cache_api.with_session() as other_api:
+            other_api._session = MagicMock()
+            other_api.manifest_for_task("task_id")
+            other_api._session.request.assert_not_called()
+
 
 class TestRetryingEvergreenApi(object):
     MATCH_ALL_URL = re.compile(r"^%s.*" % (DEFAULT_API_SERVER))
@@ -1211,3 +2097,75 @@ class TestRetryingEvergreenApi(object):
             mocked_retrying_api.version_by_id(self.VRSID)
 
         assert len(responses.calls) == 1
+
+
+class TestAsyncEvergreenApi(object):
+    @pytest.fixture()
+    def httpx(self):
+        return pytest.importorskip("httpx")
+
+    @staticmethod
+    def _create_api(httpx, handler):
+        client = httpx.AsyncClient(transport=httpx.MockTransport(handler))
+        return under_test.AsyncEvergreenApi(client=client)
+
+    def test_task_by_id(self, httpx, sample_task):
+        requests_seen = []
+
+        def handler(request):
+            requests_seen.append(request)
+            return httpx.Response(200, json=sample_task)
+
+        async def run():
+            async with self._create_api(httpx, handler) as evg_api:
+                return await evg_api.task_by_id("task_id", execution=1)
+
+        task = asyncio.run(run())
+
+        assert task.task_id == sample_task["task_id"]
+        assert isinstance(task._api, under_test.EvergreenApi)
+        assert requests_seen[0].url.path == "/rest/v2/tasks/task_id"
+        assert requests_seen[0].url.params["execution"] == "1"
+
+    def test_tasks_by_build_follows_pagination(self, httpx, sample_task):
+        next_url = "https://evergreen.mongodb.com/rest/v2/builds/build_id/tasks?start_at=2"
+
+        def handler(request):
+            if "start_at" in request.url.params:
+                return httpx.Response(200, json=[sample_task])
+            return httpx.Response(
+                200, json=[sample_task, sample_task], headers={"Link": f'<{next_url}>; rel="next"'}
+            )
+
+        async def run():
+            async with self._create_api(httpx, handler) as evg_api:
+                return await evg_api.tasks_by_build("build_id")
+
+        assert len(asyncio.run(run())) == 3
+
+    def test_versions_by_project_is_an_async_iterator(self, httpx, sample_version):
+        def handler(request):
+            assert request.url.params["requester"] == "gitter_request"
+            return httpx.Response(200, json=[sample_version, sample_version])
+
+        async def run():
+            async with self._create_api(httpx, handler) as evg_api:
+                return [version async for version in evg_api.versions_by_project("project")]
+
+        versions = asyncio.run(run())
+
+        assert len(versions) == 2
+        assert versions[0].version_id == sample_version["version_id"]
+
+    def test_evergreen_errors_are_passed_through(self, httpx):
+        def handler(request):
+            return httpx.Response(404, json={"error": "the error"})
+
+        async def run():
+            async with self._create_api(httpx, handler) as evg_api:
+                await evg_api.build_by_id("build_id")
+
+        with pytest.raises(httpx.HTTPStatusError) as excinfo:
+            asyncio.run(run())
+
+        assert "the error" in str(excinfo.value)
@@ -1,13 +1,21 @@
 """Unit tests for Artifact class streams in src/evergreen/task.py"""
 
+import gzip
+import io
+import os
 from unittest.mock import MagicMock
 
 import pytest
+import responses
 from requests.models import Response
 
+from evergreen.api import EvergreenApi
+from evergreen.errors.exceptions import DownloadException
 from evergreen.task import Artifact
 
 RESPONSE_DATA = [b"data\nwith\nnew\nlines", b"second\nchunck\nof\ndata"]
+ARTIFACT_URL = "https://s3.example.com/artifacts/data.bin"
+ARTIFACT_DATA = bytes(range(256)) * 20
 
 
 @pytest.fixture
@@ -16,6 +24,7 @@ def mocked_res():
     mock_res.request = MagicMock()
     mock_res.__enter__.return_value = mock_res
     mock_res.request.url = "url"
+    mock_res.status_code = 200
     mock_res.iter_content.return_value = iter(RESPONSE_DATA)
     mock_res.iter_lines.return_value = iter(RESPONSE_DATA)
     return mock_res
@@ -27,7 +36,7 @@ class TestArtifactStream(object):
         artifact = Artifact(sample_binary_artifact, mocked_api)
 
         stream_output = list(artifact.stream())
-        mocked_res.iter_content.assert_called_once()
+        mocked_res.iter_content.assert_called_once_with(decode_unicode=False, chunk_size=2**20)
         mocked_res.iter_lines.assert_not_called()
         assert stream_output == RESPONSE_DATA
 
@@ -49,7 +58,7 @@ class TestArtifactStream(object):
         artifact = Artifact(sample_nonbinary_artifact, mocked_api)
 
         stream_output = list(artifact.stream())
-        mocked_res.iter_lines.assert_called_once()
+        mocked_res.iter_lines.assert_called_once_with(decode_unicode=True)
         mocked_res.iter_content.assert_not_called()
         assert stream_output == RESPONSE_DATA
 
@@ -63,3 +72,82 @@ class TestArtifactStream(object):
         mocked_res.iter_lines.assert_called_once()
         mocked_res.iter_content.assert_not_called()
         assert stream_output == RESPONSE_DATA
+
+
+def _artifact():
+    return Artifact(
+        {"name": "data", "url": ARTIFACT_URL}, EvergreenApi(use_default_logger_factory=False)
+    )
+
+
+class TestArtifactStreamInto(object):
+    @responses.activate
+    def test_stream_into_binary_file(self):
+        responses.add(responses.GET, ARTIFACT_URL, body=ARTIFACT_DATA)
+        output = io.BytesIO()
+
+        assert _artifact().stream_into(output, chunk_size=100) == len(ARTIFACT_DATA)
+
+        assert output.getvalue() == ARTIFACT_DATA
+
+    @responses.activate
+    def test_stream_into_file_descriptor(self, tmp_path):
+        responses.add(responses.GET, ARTIFACT_URL, body=ARTIFACT_DATA)
+        path = tmp_path / "data.bin"
+        fd = os.open(path, os.O_WRONLY | os.O_CREAT)
+        try:
+            assert _artifact().stream_into(fd, chunk_size=1000) == len(ARTIFACT_DATA)
+        finally:
+            os.close(fd)
+
+        assert path.read_bytes() == ARTIFACT_DATA
+
+    @responses.activate
+    def test_stream_into_buffer(self):
+        responses.add(responses.GET, ARTIFACT_URL, body=ARTIFACT_DATA)
+        buffer = bytearray(len(ARTIFACT_DATA) + 10)
+
+        size = _artifact().stream_into(memoryview(buffer)[5:])
+
+        assert size == len(ARTIFACT_DATA)
+        assert buffer[5 : 5 + size] == ARTIFACT_DATA
+
+    @responses.activate
+    def test_stream_into_too_small_buffer(self):
+        responses.add(responses.GET, ARTIFACT_URL, body=ARTIFACT_DATA)
+
+        with pytest.raises(DownloadException, match="larger than the buffer"):
+            _artifact().stream_into(bytearray(100))
+
+    @responses.activate
+    def test_stream_into_read_only_buffer(self):
+        responses.add(responses.GET, ARTIFACT_URL, body=ARTIFACT_DATA)
+
+        with pytest.raises(TypeError):
+            _artifact().stream_into(memoryview(bytes(len(ARTIFACT_DATA))))
+
+    @responses.activate
+    def test_stream_into_text_file_decodes(self):
+        text = "caf\u00e9 \u2603\n" * 100
+        responses.add(responses.GET, ARTIFACT_URL, body=text.encode("utf-8"))
+        output = io.StringIO()
+
+        # Small chunks split the multi-byte characters between reads.
+        size = _artifact().stream_into(output, chunk_size=7, encoding="utf-8")
+
+        assert size == len(text.encode("utf-8"))
+        assert output.getvalue() == text
+
+    @responses.activate
+    def test_stream_into_undoes_content_encoding(self):
+        responses.add(
+            responses.GET,
+            ARTIFACT_URL,
+            body=gzip.compress(ARTIFACT_DATA),
+            headers={"Content-Encoding": "gzip"},
+        )
+        output = io.BytesIO()
+
+        assert _artifact().stream_into(output) == len(ARTIFACT_DATA)
+
+        assert output.getvalue() == ARTIFACT_DATA
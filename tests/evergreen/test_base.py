@@ -1,7 +1,17 @@
 import pickle
-from copy import copy
+from copy import copy, deepcopy
+from datetime import datetime
+from unittest.mock import MagicMock
 
-from evergreen.base import _BaseEvergreenObject
+import pytest
+from dateutil import tz
+
+from evergreen import stats
+from evergreen.base import _BaseEvergreenObject, compact_class
+from evergreen.build import Build
+from evergreen.task import Task
+from evergreen.tst import Tst
+from evergreen.util import parse_evergreen_datetime
 
 
 class TestPickleSupport(object):
@@ -12,3 +22,105 @@ class TestPickleSupport(object):
         dump = pickle.dumps(task)
         unpickled = pickle.loads(dump)
         assert unpickled == original
+
+
+class TestParsedFields(object):
+    def test_fields_are_parsed_once(self, sample_task):
+        parse_fn = MagicMock(return_value=datetime(2020, 1, 1))
+        evg_object = _BaseEvergreenObject(sample_task, None)
+
+        first = evg_object._parse_field("start_time", parse_fn)
+        second = evg_object._parse_field("start_time", parse_fn)
+
+        assert first is second
+        parse_fn.assert_called_once_with(sample_task["start_time"])
+
+    def test_date_attributes_are_cached(self, sample_task):
+        task = Task(sample_task, None)
+
+        assert task.start_time is task.start_time
+        assert task.start_time == parse_evergreen_datetime(sample_task["start_time"])
+
+    def test_changed_dates_are_parsed_again(self, sample_task):
+        task = Task(deepcopy(sample_task), None)
+        start_time = task.start_time
+
+        task.json["start_time"] = "2020-01-01T00:00:00.000Z"
+
+        assert task.start_time != start_time
+        assert task.start_time == datetime(2020, 1, 1, tzinfo=tz.UTC)
+
+    def test_date_fields_are_cached(self, sample_task):
+        evg_object = _BaseEvergreenObject(sample_task, None)
+        evg_object._date_fields = {"start_time"}
+
+        assert evg_object.start_time is evg_object.start_time
+        assert isinstance(evg_object.start_time, datetime)
+
+    def test_missing_dates_are_none(self, sample_task):
+        task_json = deepcopy(sample_task)
+        del task_json["start_time"]
+
+        assert Task(task_json, None).start_time is None
+
+
+COMPACT_MODELS = [
+    (Task, "sample_task"),
+    (Build, "sample_build"),
+    (Tst, "sample_test"),
+    (stats.TestStats, "sample_test_stats"),
+    (stats.TaskStats, "sample_task_stats"),
+]
+
+
+class TestCompactClass(object):
+    @pytest.mark.parametrize("model_cls, sample", COMPACT_MODELS)
+    def test_attributes_match_full_object(self, request, model_cls, sample):
+        sample_json = request.getfixturevalue(sample)
+        full = model_cls(deepcopy(sample_json), None)
+        compact = compact_class(model_cls)(deepcopy(sample_json), None)
+
+        assert isinstance(compact, model_cls)
+        assert compact.json == sample_json
+        assert compact == full
+        for name in dir(model_cls):
+            if isinstance(getattr(model_cls, name), property) and not name.startswith("_"):
+                try:
+                    expected = getattr(full, name)
+                except Exception as err:
+                    with pytest.raises(type(err)):
+                        getattr(compact, name)
+                    continue
+                assert getattr(compact, name) == expected, name
+
+    @pytest.mark.parametrize("model_cls, sample", COMPACT_MODELS)
+    def test_json_is_not_kept(self, request, model_cls, sample):
+        compact = compact_class(model_cls)(request.getfixturevalue(sample), None)
+
+        assert not getattr(compact, "__dict__", None)
+
+    def test_compact_class_is_reused(self):
+        assert compact_class(Task) is compact_class(Task)
+
+    def test_undeclared_fields_are_available(self, sample_task):
+        compact = compact_class(Task)(sample_task, None)
+
+        assert compact.logs == sample_task["logs"]
+        with pytest.raises(AttributeError):
+            compact.not_a_field
+
+    def test_missing_fields_are_none(self, sample_task):
+        task_json = deepcopy(sample_task)
+        del task_json["status"]
+        compact = compact_class(Task)(task_json, None)
+
+        assert compact.status is None
+        assert "status" not in compact.json
+
+    def test_can_pickle(self, sample_task):
+        compact = compact_class(Task)(sample_task, None)
+
+        unpickled = pickle.loads(pickle.dumps(copy(compact)))
+
+        assert unpickled == compact
+        assert type(unpickled) is compact_class(Task)
@@ -5,6 +5,8 @@ from __future__ import absolute_import
 from unittest.mock import MagicMock
 
 from evergreen.build import Build
+from evergreen.download import ARTIFACT_TASK_FIELDS
+from evergreen.log_grep import LOG_GREP_TASK_FIELDS
 from evergreen.metrics.buildmetrics import BuildMetrics
 
 
@@ -24,6 +26,35 @@ class TestBuild(object):
         build = Build(sample_build, mock_api)
         assert mock_api.tasks_by_build.return_value == build.get_tasks()
 
+    def test_download_artifacts(self, sample_build):
+        mock_api = MagicMock()
+        build = Build(sample_build, mock_api)
+
+        summary = build.download_artifacts("out", patterns=["*.tgz"])
+
+        assert summary == mock_api.download_artifacts.return_value
+        mock_api.tasks_by_build.assert_called_once_with(
+            sample_build["_id"], False, fields=ARTIFACT_TASK_FIELDS
+        )
+        tasks, directory = mock_api.download_artifacts.call_args[0]
+        assert tasks == mock_api.tasks_by_build.return_value
+        assert directory == "out"
+        assert mock_api.download_artifacts.call_args[1]["patterns"] == ["*.tgz"]
+
+    def test_grep_logs(self, sample_build):
+        mock_api = MagicMock()
+        build = Build(sample_build, mock_api)
+
+        results = build.grep_logs(["Segmentation fault"], first_match_only=True)
+
+        assert results == mock_api.grep_task_logs.return_value
+        mock_api.tasks_by_build.assert_called_once_with(
+            sample_build["_id"], False, fields=LOG_GREP_TASK_FIELDS
+        )
+        args, kwargs = mock_api.grep_task_logs.call_args
+        assert args == (mock_api.tasks_by_build.return_value, ["Segmentation fault"])
+        assert kwargs["first_match_only"]
+
     def test_status_counts(self, sample_build):
         build = Build(sample_build, None)
         assert sample_build["status_counts"]["succeeded"] == build.status_counts.succeeded
@@ -0,0 +1,92 @@
+# -*- encoding: utf-8 -*-
+from __future__ import absolute_import
+
+import evergreen.cache as under_test
+
+
+class FakeClock(object):
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self):
+        return self.now
+
+
+class TestTtlCache(object):
+    def test_missing_entries_are_misses(self):
+        cache = under_test.TtlCache()
+
+        assert cache.get("key") == (False, None)
+        assert cache.stats().misses == 1
+
+    def test_entries_without_ttl_do_not_expire(self):
+        clock = FakeClock()
+        cache = under_test.TtlCache(clock=clock)
+        cache.put("key", "value")
+        clock.now = 10**9
+
+        assert cache.get("key") == (True, "value")
+        assert cache.stats().hits == 1
+
+    def test_entries_expire_after_ttl(self):
+        clock = FakeClock()
+        cache = under_test.TtlCache(clock=clock)
+        cache.put("key", "value", ttl=30)
+
+        clock.now = 29
+        assert cache.get("key") == (True, "value")
+        clock.now = 30
+        assert cache.get("key") == (False, None)
+
+        stats = cache.stats()
+        assert stats.hits == 1
+        assert stats.misses == 1
+        assert stats.expirations == 1
+        assert stats.entries == 0
+
+    def test_entries_with_non_positive_ttl_are_not_cached(self):
+        cache = under_test.TtlCache()
+        cache.put("key", "value", ttl=0)
+
+        assert len(cache) == 0
+
+    def test_least_recently_used_entries_are_evicted(self):
+        cache = under_test.TtlCache(max_entries=2)
+        cache.put("a", 1)
+        cache.put("b", 2)
+        cache.get("a")
+        cache.put("c", 3)
+
+        assert cache.get("b") == (False, None)
+        assert cache.get("a") == (True, 1)
+        assert cache.get("c") == (True, 3)
+        assert cache.stats().evictions == 1
+        assert cache.stats().entries == 2
+
+    def test_clear_removes_entries(self):
+        cache = under_test.TtlCache()
+        cache.put("key", "value")
+        cache.clear()
+
+        assert cache.get("key") == (False, None)
+        assert len(cache) == 0
+
+    def test_contains_does_not_count_uses(self):
+        clock = FakeClock()
+        cache = under_test.TtlCache(clock=clock)
+        cache.put("key", "value", ttl=10)
+
+        assert "key" in cache
+        assert "other key" not in cache
+        clock.now = 10
+        assert "key" not in cache
+        assert cache.stats().hits == 0
+        assert cache.stats().misses == 0
+
+    def test_discard(self):
+        cache = under_test.TtlCache()
+        cache.put("key", "value")
+        cache.discard("key")
+        cache.discard("other key")
+
+        assert "key" not in cache
@@ -0,0 +1,317 @@
+# -*- encoding: utf-8 -*-
+from __future__ import absolute_import
+
+import json
+import os
+import re
+
+import pytest
+import responses
+
+import evergreen.download as under_test
+from evergreen.api import EvergreenApi
+from evergreen.errors.exceptions import DownloadException
+from evergreen.task import Artifact
+
+URL = "https://s3.example.com/artifacts/core.dump"
+CONTENT = bytes(range(256)) * 40
+
+
+class RangeServer(object):
+    """Fake file server answering Range requests."""
+
+    def __init__(self, content=CONTENT, etag='"v1"', ranges=True, truncate_at=None):
+        self.content = content
+        self.etag = etag
+        self.ranges = ranges
+        self.truncate_at = truncate_at
+        self.requested = []
+
+    def __call__(self, request):
+        range_header = request.headers.get("Range")
+        self.requested.append(range_header)
+        headers = {"ETag": self.etag}
+        if_range = request.headers.get("If-Range")
+        if not self.ranges or range_header is None or (if_range and if_range != self.etag):
+            return 200, headers, self.content
+
+        first, last = (
+            int(value) for value in re.match(r"bytes=(\d+)-(\d+)", range_header).groups()
+        )
+        body = self.content[first : last + 1]
+        if self.truncate_at is not None and first < self.truncate_at <= last:
+            body = self.content[first : self.truncate_at]
+        headers["Content-Range"] = f"bytes {first}-{last}/{len(self.content)}"
+        return 206, headers, body
+
+
+def _download(open_stream, path, parallel_ranges=4, **kwargs):
+    download = under_test.RangedDownload(
+        open_stream,
+        URL,
+        str(path),
+        parallel_ranges=parallel_ranges,
+        chunk_size=100,
+        min_range_size=1000,
+        **kwargs,
+    )
+    return download.run()
+
+
+class TestSplitRanges(object):
+    @pytest.mark.parametrize(
+        "size,parallel_ranges,expected",
+        [
+            (0, 4, [[0, 0]]),
+            (10, 4, [[0, 10]]),
+            (4000, 4, [[0, 1000], [1000, 2000], [2000, 3000], [3000, 4000]]),
+            (2500, 4, [[0, 1250], [1250, 2500]]),
+        ],
+    )
+    def test_ranges_are_not_smaller_than_minimum(self, size, parallel_ranges, expected):
+        assert under_test._split_ranges(size, parallel_ranges, 1000) == expected
+
+
+class TestRangedDownload(object):
+    @responses.activate
+    def test_file_is_downloaded_in_ranges(self, tmp_path, open_stream):
+        server = RangeServer()
+        responses.add_callback(responses.GET, URL, callback=server)
+        path = tmp_path / "core.dump"
+
+        assert _download(open_stream, path) == len(CONTENT)
+
+        assert path.read_bytes() == CONTENT
+        assert sorted(server.requested[1:]) == [
+            "bytes=0-2559",
+            "bytes=2560-5119",
+            "bytes=5120-7679",
+            "bytes=7680-10239",
+        ]
+        assert os.listdir(tmp_path) == ["core.dump"]
+
+    @responses.activate
+    def test_whole_file_is_written_without_range_support(self, tmp_path, open_stream):
+        server = RangeServer(ranges=False)
+        responses.add_callback(responses.GET, URL, callback=server)
+        path = tmp_path / "core.dump"
+
+        assert _download(open_stream, path) == len(CONTENT)
+
+        assert path.read_bytes() == CONTENT
+        assert len(server.requested) == 1
+
+    @responses.activate
+    def test_interrupted_download_is_resumed(self, tmp_path, open_stream):
+        server = RangeServer(truncate_at=6000)
+        responses.add_callback(responses.GET, URL, callback=server)
+        path = tmp_path / "core.dump"
+
+        with pytest.raises(DownloadException):
+            _download(open_stream, path)
+        progress = json.loads((tmp_path / "core.dump.part.json").read_text())
+        assert progress["ranges"][2] == [6000, 7680]
+        assert not path.exists()
+
+        server.truncate_at = None
+        server.requested = []
+        assert _download(open_stream, path) == len(CONTENT)
+
+        assert path.read_bytes() == CONTENT
+        assert server.requested[1:] == ["bytes=6000-7679"]
+
+    @responses.activate
+    def test_changed_file_is_not_resumed(self, tmp_path, open_stream):
+        server = RangeServer(truncate_at=6000)
+        responses.add_callback(responses.GET, URL, callback=server)
+        path = tmp_path / "core.dump"
+        with pytest.raises(DownloadException):
+            _download(open_stream, path)
+
+        server.content = CONTENT[::-1]
+        server.etag = '"v2"'
+        server.truncate_at = None
+        server.requested = []
+        assert _download(open_stream, path) == len(CONTENT)
+
+        assert path.read_bytes() == CONTENT[::-1]
+        assert len(server.requested) == 5
+
+    @responses.activate
+    def test_file_changed_during_download(self, tmp_path, monkeypatch, open_stream):
+        server = RangeServer()
+        responses.add_callback(responses.GET, URL, callback=server)
+        split_ranges = under_test._split_ranges
+
+        def change_file(*args):
+            server.etag = '"v2"'
+            return split_ranges(*args)
+
+        monkeypatch.setattr(under_test, "_split_ranges", change_file)
+
+        with pytest.raises(DownloadException, match="may have changed"):
+            _download(open_stream, tmp_path / "core.dump", parallel_ranges=1)
+
+    @responses.activate
+    def test_sequential_download(self, tmp_path, open_stream):
+        server = RangeServer()
+        responses.add_callback(responses.GET, URL, callback=server)
+        path = tmp_path / "core.dump"
+
+        assert _download(open_stream, path, parallel_ranges=1) == len(CONTENT)
+
+        assert path.read_bytes() == CONTENT
+        assert server.requested[1:] == ["bytes=0-10239"]
+
+    @responses.activate
+    def test_empty_file(self, tmp_path, open_stream):
+        responses.add(responses.GET, URL, status=416)
+        responses.add(responses.GET, URL, status=200, body=b"")
+        path = tmp_path / "empty"
+
+        assert _download(open_stream, path) == 0
+
+        assert path.read_bytes() == b""
+
+
+class TestDownloadWithApi(object):
+    @responses.activate
+    def test_artifact_download(self, tmp_path):
+        server = RangeServer()
+        responses.add_callback(responses.GET, URL, callback=server)
+        api = EvergreenApi(use_default_logger_factory=False)
+        artifact = Artifact({"name": "core", "url": URL}, api)
+        path = tmp_path / "core.dump"
+
+        assert artifact.download(str(path), parallel_ranges=2) == len(CONTENT)
+
+        assert path.read_bytes() == CONTENT
+        assert all(
+            call.request.headers["Accept-Encoding"] == "identity" for call in responses.calls
+        )
+
+
+class FakeDownloader(object):
+    def __init__(self, fail_urls=()):
+        self.fail_urls = fail_urls
+        self.downloaded = []
+
+    def __call__(self, url, path):
+        if url in self.fail_urls:
+            raise DownloadException(f"{url} is broken")
+        self.downloaded.append((url, path))
+        with open(path, "wb") as output:
+            output.write(url.encode())
+        return len(url)
+
+
+class TestDownloadTaskArtifacts(object):
+    def test_artifacts_are_downloaded_by_task(self, tmp_path, create_task):
+        tasks = [
+            create_task(
+                "t1",
+                "linux",
+                "compile",
+                artifacts=[{"name": "binaries", "url": "https://s3/a/bin.tgz"}],
+            ),
+            create_task(
+                "t2",
+                "linux",
+                "lint",
+                artifacts=[{"name": "report", "url": "https://s3/b/lint%20out.txt"}],
+            ),
+        ]
+        downloader = FakeDownloader()
+
+        summary = under_test.download_task_artifacts(downloader, tasks, str(tmp_path))
+
+        assert sorted(path for _, path in downloader.downloaded) == [
+            str(tmp_path / "linux" / "compile" / "bin.tgz"),
+            str(tmp_path / "linux" / "lint" / "lint_out.txt"),
+        ]
+        assert summary.size == len("https://s3/a/bin.tgz") + len("https://s3/b/lint%20out.txt")
+        assert summary.failed == []
+        assert summary.skipped == 0
+
+    def test_ignored_and_unmatched_artifacts_are_skipped(self, tmp_path, create_task):
+        artifacts = [
+            {"name": "binaries", "url": "https://s3/bin.tgz"},
+            {"name": "logs", "url": "https://s3/logs.tgz", "ignore_for_fetch": True},
+            {"name": "core dump", "url": "https://s3/core.1234"},
+        ]
+        tasks = [create_task("t1", "linux", "compile", artifacts=artifacts)]
+        downloader = FakeDownloader()
+
+        summary = under_test.download_task_artifacts(
+            downloader, tasks, str(tmp_path), patterns=["*.tgz", "core*"]
+        )
+
+        assert sorted(url for url, _ in downloader.downloaded) == [
+            "https://s3/bin.tgz",
+            "https://s3/core.1234",
+        ]
+        assert summary.skipped == 1
+
+    def test_identical_urls_are_downloaded_once(self, tmp_path, create_task):
+        artifact = {"name": "binaries", "url": "https://s3/bin.tgz"}
+        tasks = [
+            create_task("t1", "linux", "compile", artifacts=[artifact]),
+            create_task("t2", "linux", "compile_again", artifacts=[artifact]),
+        ]
+        downloader = FakeDownloader()
+
+        summary = under_test.download_task_artifacts(downloader, tasks, str(tmp_path))
+
+        assert len(downloader.downloaded) == 1
+        duplicate = next(download for download in summary.downloads if download.duplicate)
+        assert duplicate.task_id == "t2"
+        assert duplicate.path == str(tmp_path / "linux" / "compile" / "bin.tgz")
+
+    def test_files_with_the_same_name_do_not_overwrite_each_other(self, tmp_path, create_task):
+        artifacts = [
+            {"name": "first", "url": "https://s3/a/out.log"},
+            {"name": "second", "url": "https://s3/b/out.log"},
+        ]
+        downloader = FakeDownloader()
+
+        under_test.download_task_artifacts(
+            downloader, [create_task("t1", "linux", "compile", artifacts=artifacts)], str(tmp_path)
+        )
+
+        assert sorted(os.listdir(tmp_path / "linux" / "compile")) == ["out-1.log", "out.log"]
+
+    def test_failures_are_reported_without_stopping_other_downloads(self, tmp_path, create_task):
+        artifacts = [
+            {"name": "first", "url": "https://s3/first"},
+            {"name": "second", "url": "https://s3/second"},
+        ]
+        downloader = FakeDownloader(fail_urls={"https://s3/first"})
+        progress = []
+
+        summary = under_test.download_task_artifacts(
+            downloader,
+            [create_task("t1", "linux", "compile", artifacts=artifacts)],
+            str(tmp_path),
+            max_workers=2,
+            on_progress=lambda download, completed, total: progress.append((completed, total)),
+        )
+
+        assert [download.name for download in summary.failed] == ["first"]
+        assert "is broken" in summary.failed[0].error
+        assert downloader.downloaded == [
+            ("https://s3/second", str(tmp_path / "linux" / "compile" / "second"))
+        ]
+        assert sorted(progress) == [(1, 2), (2, 2)]
+
+
+class TestDownloadArtifactsWithApi(object):
+    @responses.activate
+    def test_artifacts_of_tasks_are_downloaded(self, tmp_path, create_task):
+        responses.add_callback(responses.GET, URL, callback=RangeServer())
+        api = EvergreenApi(use_default_logger_factory=False)
+        task = create_task("t1", "linux", "compile", artifacts=[{"name": "core", "url": URL}])
+
+        summary = api.download_artifacts([task], str(tmp_path))
+
+        assert (tmp_path / "linux" / "compile" / "core.dump").read_bytes() == CONTENT
+        assert summary.size == len(CONTENT)
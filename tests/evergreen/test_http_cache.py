@@ -0,0 +1,154 @@
+# -*- encoding: utf-8 -*-
+from __future__ import absolute_import
+
+import multiprocessing
+
+import pytest
+import responses
+from responses import matchers
+
+import evergreen.http_cache as under_test
+from evergreen.api import EvergreenApi
+
+URL = "https://evergreen.example.com/rest/v2/builds/build_id"
+
+
+@pytest.fixture()
+def http_cache(tmp_path):
+    cache = under_test.HttpCache(str(tmp_path / "cache.sqlite"))
+    yield cache
+    cache.close()
+
+
+def _fill_cache(path, worker):
+    cache = under_test.HttpCache(path)
+    for i in range(20):
+        cache.put(f"{worker}-{i}", None, "date", {}, b"x" * 10)
+    cache.close()
+
+
+class TestHttpCache(object):
+    def test_missing_responses(self, http_cache):
+        assert http_cache.get("key") is None
+
+    def test_stored_responses_are_returned(self, http_cache):
+        http_cache.put("key", '"etag"', "date", {"Content-Type": "application/json"}, b"body")
+
+        cached = http_cache.get("key")
+        assert cached.etag == '"etag"'
+        assert cached.last_modified == "date"
+        assert cached.headers == {"Content-Type": "application/json"}
+        assert cached.body == b"body"
+
+    def test_cache_is_shared_between_instances(self, http_cache):
+        http_cache.put("key", '"etag"', None, {}, b"body")
+
+        other_cache = under_test.HttpCache(http_cache.path)
+        assert other_cache.get("key").body == b"body"
+        other_cache.close()
+
+    def test_least_recently_used_responses_are_evicted(self, tmp_path):
+        cache = under_test.HttpCache(str(tmp_path / "cache.sqlite"), max_size_bytes=10)
+        cache.put("a", '"a"', None, {}, b"aaaa")
+        cache.put("b", '"b"', None, {}, b"bbbb")
+        cache._connection().execute("UPDATE responses SET accessed = 0 WHERE key = 'b'")
+        cache.put("c", '"c"', None, {}, b"cccc")
+
+        assert cache.get("a") is not None
+        assert cache.get("b") is None
+        assert cache.get("c") is not None
+        stats = cache.stats()
+        assert stats.evictions == 1
+        assert stats.entries == 2
+        assert stats.size_bytes == 8
+        cache.close()
+
+    def test_responses_larger_than_cache_are_not_stored(self, tmp_path):
+        cache = under_test.HttpCache(str(tmp_path / "cache.sqlite"), max_size_bytes=2)
+        cache.put("key", '"etag"', None, {}, b"body")
+
+        assert cache.get("key") is None
+        cache.close()
+
+    def test_clear(self, http_cache):
+        http_cache.put("key", '"etag"', None, {}, b"body")
+        http_cache.clear()
+
+        assert http_cache.get("key") is None
+
+    def test_concurrent_processes(self, http_cache):
+        context = multiprocessing.get_context("spawn")
+        processes = [
+            context.Process(target=_fill_cache, args=(http_cache.path, worker))
+            for worker in range(3)
+        ]
+        for process in processes:
+            process.start()
+        for process in processes:
+            process.join()
+
+        assert all(process.exitcode == 0 for process in processes)
+        assert http_cache.stats().entries == 60
+
+
+class TestCachingHTTPAdapter(object):
+    @responses.activate
+    def test_responses_are_revalidated(self, http_cache):
+        responses.get(URL, json={"_id": "build_id"}, headers={"ETag": '"v1"'})
+        responses.get(
+            URL,
+            status=304,
+            headers={"ETag": '"v1"'},
+            match=[matchers.header_matcher({"If-None-Match": '"v1"'})],
+        )
+        api = EvergreenApi("https://evergreen.example.com", http_cache=http_cache)
+
+        assert api.build_by_id("build_id").id == "build_id"
+        assert api.build_by_id("build_id").id == "build_id"
+
+        assert len(responses.calls) == 2
+        assert http_cache.stats().revalidated == 1
+
+    @responses.activate
+    def test_last_modified_is_used_for_revalidation(self, http_cache):
+        last_modified = "Wed, 21 Oct 2015 07:28:00 GMT"
+        responses.get(URL, json={"_id": "build_id"}, headers={"Last-Modified": last_modified})
+        responses.get(
+            URL,
+            status=304,
+            match=[matchers.header_matcher({"If-Modified-Since": last_modified})],
+        )
+        api = EvergreenApi("https://evergreen.example.com", http_cache=http_cache)
+
+        api.build_by_id("build_id")
+        assert api.build_by_id("build_id").id == "build_id"
+
+    @responses.activate
+    def test_changed_responses_replace_cached_ones(self, http_cache):
+        responses.get(URL, json={"_id": "build_id", "status": "started"}, headers={"ETag": '"1"'})
+        responses.get(URL, json={"_id": "build_id", "status": "success"}, headers={"ETag": '"2"'})
+        api = EvergreenApi("https://evergreen.example.com", http_cache=http_cache)
+
+        api.build_by_id("build_id")
+        assert api.build_by_id("build_id").status == "success"
+        assert http_cache.get(URL).etag == '"2"'
+
+    @responses.activate
+    def test_responses_without_validators_are_not_stored(self, http_cache):
+        responses.get(URL, json={"_id": "build_id"})
+        api = EvergreenApi("https://evergreen.example.com", http_cache=http_cache)
+
+        api.build_by_id("build_id")
+
+        assert http_cache.get(URL) is None
+
+    @responses.activate
+    def test_no_store_responses_are_not_stored(self, http_cache):
+        responses.get(
+            URL, json={"_id": "build_id"}, headers={"ETag": '"1"', "Cache-Control": "no-store"}
+        )
+        api = EvergreenApi("https://evergreen.example.com", http_cache=http_cache)
+
+        api.build_by_id("build_id")
+
+        assert http_cache.get(URL) is None
@@ -0,0 +1,109 @@
+import json
+
+import pytest
+import requests
+
+import evergreen.json_codec as under_test
+
+SAMPLE = {"task_id": "tést", "execution": 1, "tests": [{"status": "pass"}], "time": None}
+
+
+def _response(body):
+    response = requests.Response()
+    response.status_code = 200
+    response._content = body
+    return response
+
+
+class TestGetJsonCodec(object):
+    def test_default_is_stdlib(self):
+        assert under_test.get_json_codec().name == "json"
+
+    def test_auto_prefers_orjson(self, monkeypatch):
+        monkeypatch.setattr(under_test, "orjson", object())
+
+        assert isinstance(under_test.get_json_codec("auto"), under_test.OrjsonCodec)
+
+    def test_auto_falls_back_to_stdlib(self, monkeypatch):
+        monkeypatch.setattr(under_test, "orjson", None)
+
+        assert under_test.get_json_codec("auto").name == "json"
+
+    def test_orjson_not_installed(self, monkeypatch):
+        monkeypatch.setattr(under_test, "orjson", None)
+
+        with pytest.raises(ImportError):
+            under_test.get_json_codec("orjson")
+
+    def test_unknown_codec(self):
+        with pytest.raises(ValueError):
+            under_test.get_json_codec("yaml")
+
+
+class TestJsonCodec(object):
+    def test_round_trip(self):
+        codec = under_test.JsonCodec()
+
+        assert codec.loads(codec.dumps(SAMPLE)) == SAMPLE
+        assert codec.loads(codec.dumps(SAMPLE).encode("utf-8")) == SAMPLE
+
+    def test_indent(self):
+        assert under_test.JsonCodec().dumps(SAMPLE, indent=4) == json.dumps(SAMPLE, indent=4)
+
+    def test_decode_response(self):
+        response = _response(json.dumps(SAMPLE).encode("utf-8"))
+
+        assert under_test.JsonCodec().decode_response(response) == SAMPLE
+
+
+class TestOrjsonCodec(object):
+    @pytest.fixture(autouse=True)
+    def require_orjson(self):
+        pytest.importorskip("orjson")
+
+    def test_round_trip(self):
+        codec = under_test.OrjsonCodec()
+
+        assert codec.loads(codec.dumps(SAMPLE)) == SAMPLE
+        assert codec.loads(codec.dumps(SAMPLE, indent=4)) == SAMPLE
+
+    def test_decode_response(self):
+        response = _response(json.dumps(SAMPLE).encode("utf-8"))
+
+        assert under_test.OrjsonCodec().decode_response(response) == SAMPLE
+
+    def test_invalid_json_raises_json_decode_error(self):
+        with pytest.raises(json.JSONDecodeError):
+            under_test.OrjsonCodec().loads(b"<html></html>")
+
+
+def _chunked(body, size):
+    return [body[i : i + size] for i in range(0, len(body), size)]
+
+
+class TestIterJsonArray(object):
+    DOCUMENT = [SAMPLE, 1, -2.5e-7, 12345678901234, "é", True, None, [], {}]
+
+    @pytest.mark.parametrize("chunk_size", [1, 2, 3, 7, 64, 4096])
+    def test_elements_are_decoded_from_any_chunks(self, chunk_size):
+        body = json.dumps(self.DOCUMENT, ensure_ascii=False, indent=2).encode()
+
+        elements = list(under_test.iter_json_array(_chunked(body, chunk_size)))
+
+        assert elements == self.DOCUMENT
+
+    @pytest.mark.parametrize("body", [b"[]", b" [ ] ", b"[\n]"])
+    def test_empty_arrays(self, body):
+        assert list(under_test.iter_json_array([body])) == []
+
+    def test_elements_are_generated_before_the_end(self):
+        def chunks():
+            yield b'[{"a": 1}, '
+            raise AssertionError("read too far")
+
+        assert next(under_test.iter_json_array(chunks())) == {"a": 1}
+
+    @pytest.mark.parametrize("body", [b"", b"{}", b"[1, 2", b"[1 2]", b"[2.]", b"[1,]"])
+    def test_invalid_documents(self, body):
+        with pytest.raises(json.JSONDecodeError):
+            list(under_test.iter_json_array(_chunked(body, 2)))
@@ -0,0 +1,140 @@
+# -*- encoding: utf-8 -*-
+from __future__ import absolute_import
+
+import re
+
+import pytest
+import requests
+import responses
+
+import evergreen.log_follow as under_test
+from evergreen.api import EvergreenApi
+
+LOG_URL = "https://evergreen.example.com/task_log_raw/task_id/0"
+
+
+class GrowingLog(object):
+    """Fake log server, the log grows by one part on each request."""
+
+    def __init__(self, parts, ranges=True):
+        self.parts = list(parts)
+        self.content = b""
+        self.ranges = ranges
+        self.requested = []
+
+    def __call__(self, request):
+        if self.parts:
+            self.content += self.parts.pop(0)
+        range_header = request.headers.get("Range")
+        self.requested.append(range_header)
+        if not self.ranges or range_header is None:
+            return 200, {}, self.content
+
+        first = int(re.match(r"bytes=(\d+)-", range_header).group(1))
+        if first >= len(self.content):
+            return 416, {}, b""
+        headers = {"Content-Range": f"bytes {first}-{len(self.content) - 1}/{len(self.content)}"}
+        return 206, headers, self.content[first:]
+
+
+class CompletedAfter(object):
+    def __init__(self, checks):
+        self.checks = checks
+
+    def __call__(self):
+        self.checks -= 1
+        return self.checks < 0
+
+
+def _follow(open_stream, is_completed, sleeps=None):
+    follower = under_test.LogFollower(
+        open_stream,
+        LOG_URL,
+        is_completed,
+        min_poll_interval=1,
+        max_poll_interval=4,
+        sleep=sleeps.append if sleeps is not None else lambda _: None,
+    )
+    return list(follower)
+
+
+class TestAdaptivePollInterval(object):
+    def test_interval_grows_until_something_changes(self):
+        interval = under_test.AdaptivePollInterval(minimum=1, maximum=3, factor=2)
+
+        assert [interval.next(False) for _ in range(4)] == [1, 2, 3, 3]
+        assert interval.next(True) == 1
+        assert interval.next(False) == 1
+
+
+class TestLogFollower(object):
+    @responses.activate
+    def test_only_new_lines_are_fetched(self, open_stream):
+        log = GrowingLog([b"one\ntw", b"o\nthree\n", b"", b"four"])
+        responses.add_callback(responses.GET, LOG_URL, callback=log)
+
+        lines = _follow(open_stream, CompletedAfter(1))
+
+        assert lines == ["one", "two", "three", "four"]
+        assert log.requested == [
+            None,
+            "bytes=6-",
+            "bytes=14-",
+            "bytes=14-",
+            "bytes=18-",
+            "bytes=18-",
+        ]
+
+    @responses.activate
+    def test_seen_part_of_log_is_skipped_without_range_support(self, open_stream):
+        log = GrowingLog([b"one\n", b"two\r\n", b"three\n"], ranges=False)
+        responses.add_callback(responses.GET, LOG_URL, callback=log)
+
+        assert _follow(open_stream, CompletedAfter(0)) == ["one", "two", "three"]
+
+    @responses.activate
+    def test_polls_back_off_while_log_does_not_grow(self, open_stream):
+        log = GrowingLog([b"one\n", b"", b"", b"", b"two\n", b""])
+        responses.add_callback(responses.GET, LOG_URL, callback=log)
+        sleeps = []
+
+        assert _follow(open_stream, CompletedAfter(3), sleeps) == ["one", "two"]
+
+        assert sleeps == [1, 1, 1.5, 2.25, 1]
+
+    @responses.activate
+    def test_completion_is_not_checked_while_log_grows(self, open_stream):
+        log = GrowingLog([b"a\n", b"b\n", b"c\n"])
+        responses.add_callback(responses.GET, LOG_URL, callback=log)
+        checks = []
+
+        def is_completed():
+            checks.append(len(log.content))
+            return True
+
+        assert _follow(open_stream, is_completed) == ["a", "b", "c"]
+        assert checks == [6]
+
+    @responses.activate
+    def test_errors_are_raised(self, open_stream):
+        responses.add(responses.GET, LOG_URL, status=500)
+
+        with pytest.raises(requests.HTTPError):
+            _follow(open_stream, CompletedAfter(0))
+
+
+class TestFollowLogWithApi(object):
+    @responses.activate
+    def test_stream_log_follow(self):
+        log = GrowingLog([b"one\n", b"two\n"])
+        responses.add_callback(responses.GET, LOG_URL, callback=log)
+        api = EvergreenApi(use_default_logger_factory=False)
+
+        lines = list(
+            api.stream_log(
+                LOG_URL, follow=True, is_completed=CompletedAfter(0), min_poll_interval=0
+            )
+        )
+
+        assert lines == ["one", "two"]
+        assert all(call.request.url == LOG_URL + "?text=true" for call in responses.calls)
@@ -0,0 +1,195 @@
+# -*- encoding: utf-8 -*-
+from __future__ import absolute_import
+
+import pytest
+import requests
+import responses
+from click.testing import CliRunner
+
+import evergreen.cli.main as cli_main
+import evergreen.log_grep as under_test
+from evergreen.api import EvergreenApi
+
+LOG = (
+    "[js_test:jstests] starting\n"
+    "[mongod] Segmentation fault\r\n"
+    "[mongod] all good\n"
+    "[mongod] segmentation FAULT again\n"
+    "invariant failure"
+)
+LOG_URL = "https://evergreen.example.com/task_log_raw/t1/0?type=T"
+
+
+def _chunks(text, size):
+    data = text.encode("utf-8")
+    return [data[i : i + size] for i in range(0, len(data), size)]
+
+
+class TestSearchLog(object):
+    def test_matches_are_located(self):
+        patterns = under_test.compile_patterns(["Segmentation fault", "^invariant"])
+
+        matches = under_test.search_log(_chunks(LOG, 7), patterns)
+
+        assert matches == [
+            under_test.LogMatch(2, 9, 27, "Segmentation fault", "[mongod] Segmentation fault"),
+            under_test.LogMatch(5, 0, 9, "^invariant", "invariant failure"),
+        ]
+
+    def test_ignore_case(self):
+        patterns = under_test.compile_patterns(["segmentation fault"], ignore_case=True)
+
+        matches = under_test.search_log(_chunks(LOG, 1000), patterns)
+
+        assert [match.line_number for match in matches] == [2, 4]
+
+    def test_first_match_only_stops_reading(self):
+        patterns = under_test.compile_patterns(["mongod", "starting"])
+        chunks = iter(_chunks(LOG, 30))
+
+        matches = under_test.search_log(chunks, patterns, first_match_only=True)
+
+        assert matches == [
+            under_test.LogMatch(1, 18, 26, "starting", "[js_test:jstests] starting"),
+        ]
+        assert len(list(chunks)) > 0
+
+    def test_multi_byte_characters_split_between_chunks(self):
+        patterns = under_test.compile_patterns(["café"])
+
+        matches = under_test.search_log(_chunks("line\ncafé ☃\n", 1), patterns)
+
+        assert matches == [under_test.LogMatch(2, 0, 4, "café", "café ☃")]
+
+
+class TestSearchTaskLogs(object):
+    def test_logs_are_searched_concurrently(self, create_task):
+        logs = {"url_1": LOG, "url_2": "nothing here\n", "url_3": "Segmentation fault\n"}
+        tasks = [create_task(f"t{i}", logs={"task_log": f"url_{i}"}) for i in range(1, 4)]
+        completed = []
+
+        results = under_test.search_task_logs(
+            lambda url: _chunks(logs[url], 16),
+            tasks,
+            under_test.compile_patterns(["Segmentation fault"]),
+            max_workers=2,
+            on_result=completed.append,
+        )
+
+        assert [result.task_id for result in results] == ["t1", "t2", "t3"]
+        assert [len(result.matches) for result in results] == [1, 0, 1]
+        assert sorted(result.task_id for result in completed) == ["t1", "t2", "t3"]
+
+    def test_errors_are_reported_per_task(self, create_task):
+        def stream_log(url):
+            if url == "broken":
+                raise requests.ConnectionError("connection reset")
+            yield b"Segmentation fault\n"
+
+        tasks = [
+            create_task("t1", logs={"task_log": "broken"}),
+            create_task("t2", logs={"task_log": "fine"}),
+            create_task("t3", logs={"task_log": None}),
+        ]
+
+        results = under_test.search_task_logs(
+            stream_log, tasks, under_test.compile_patterns(["fault"])
+        )
+
+        assert results[0].error == "connection reset"
+        assert len(results[1].matches) == 1
+        assert results[2].error == "Task has no task_log"
+
+    def test_log_is_closed_after_first_match(self, create_task):
+        closed = []
+
+        def stream_log(url):
+            try:
+                while True:
+                    yield b"Segmentation fault\n"
+            finally:
+                closed.append(url)
+
+        results = under_test.search_task_logs(
+            stream_log,
+            [create_task("t1", logs={"task_log": LOG_URL})],
+            under_test.compile_patterns(["fault"]),
+            first_match_only=True,
+        )
+
+        assert len(results[0].matches) == 1
+        assert closed == [LOG_URL]
+
+
+class TestGrepTaskLogsWithApi(object):
+    @responses.activate
+    def test_grep_task_logs(self, create_task):
+        responses.add(responses.GET, LOG_URL + "&text=true", body=LOG.encode("utf-8"))
+        api = EvergreenApi(use_default_logger_factory=False)
+
+        results = api.grep_task_logs(
+            [create_task("t1", logs={"task_log": LOG_URL})],
+            ["segmentation fault"],
+            ignore_case=True,
+        )
+
+        assert [match.line_number for match in results[0].matches] == [2, 4]
+
+    @pytest.mark.parametrize("status", [404, 500])
+    @responses.activate
+    def test_error_responses_are_reported(self, status, create_task):
+        responses.add(
+            responses.GET,
+            LOG_URL + "&text=true",
+            status=status,
+            json={"error": "Segmentation fault"},
+        )
+        api = EvergreenApi(use_default_logger_factory=False)
+
+        (result,) = api.grep_task_logs(
+            [create_task("t1", logs={"task_log": LOG_URL})], ["Segmentation fault"]
+        )
+
+        assert result.matches == []
+        assert result.error is not None
+
+    @responses.activate
+    def test_log_response_is_closed_after_first_match(self, create_task):
+        responses.add(responses.GET, LOG_URL + "&text=true", body=LOG.encode("utf-8"))
+        api = EvergreenApi(use_default_logger_factory=False)
+        closed = []
+        open_stream = api._open_stream
+
+        def _open_stream(*args, **kwargs):
+            response = open_stream(*args, **kwargs)
+            close = response.close
+            response.close = lambda: closed.append(True) or close()
+            return response
+
+        api._open_stream = _open_stream
+
+        (result,) = api.grep_task_logs(
+            [create_task("t1", logs={"task_log": LOG_URL})], ["mongod"], first_match_only=True
+        )
+
+        assert len(result.matches) == 1
+        assert closed
+
+
+class TestGrepLogsCommand(object):
+    @pytest.mark.parametrize("status", [404, 500])
+    @responses.activate
+    def test_unreadable_log_exits_with_error(self, monkeypatch, status):
+        api = EvergreenApi(use_default_logger_factory=False)
+        monkeypatch.setattr(cli_main.EvergreenApi, "get_api", lambda **kwargs: api)
+        responses.add(
+            responses.GET,
+            api._create_url("/tasks/t1"),
+            json={"task_id": "t1", "logs": {"task_log": LOG_URL}},
+        )
+        responses.add(responses.GET, LOG_URL + "&text=true", status=status)
+
+        result = CliRunner().invoke(cli_main.cli, ["grep-logs", "-t", "t1", "-e", "fault"])
+
+        assert result.exit_code == 2
+        assert "t1: " in result.output
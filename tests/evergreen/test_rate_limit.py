@@ -0,0 +1,199 @@
+# -*- encoding: utf-8 -*-
+from __future__ import absolute_import
+
+import threading
+from datetime import datetime, timedelta, timezone
+from email.utils import format_datetime
+
+import pytest
+
+import evergreen.rate_limit as under_test
+
+
+class FakeClock(object):
+    def __init__(self):
+        self.now = 0.0
+        self.sleeps = []
+
+    def __call__(self):
+        return self.now
+
+    def sleep(self, seconds):
+        self.sleeps.append(seconds)
+        self.now += seconds
+
+
+class TestParseRetryAfter(object):
+    @pytest.mark.parametrize(
+        "value,expected", [(None, None), ("", None), ("3", 3.0), ("-1", 0.0), ("bad", None)]
+    )
+    def test_seconds(self, value, expected):
+        assert under_test.parse_retry_after(value) == expected
+
+    def test_http_date(self):
+        when = datetime.now(timezone.utc) + timedelta(seconds=30)
+
+        delay = under_test.parse_retry_after(format_datetime(when, usegmt=True))
+
+        assert 25 < delay <= 30
+
+    def test_long_delays_are_capped(self):
+        assert under_test.parse_retry_after("86400") == under_test.MAX_RETRY_AFTER_SEC
+
+
+class TestTokenBucket(object):
+    def test_burst_is_allowed_then_rate_applies(self):
+        clock = FakeClock()
+        bucket = under_test.TokenBucket(rate=2, burst=2, clock=clock)
+
+        assert [bucket.reserve() for _ in range(4)] == [0.0, 0.0, 0.5, 1.0]
+
+    def test_tokens_refill_over_time(self):
+        clock = FakeClock()
+        bucket = under_test.TokenBucket(rate=2, burst=2, clock=clock)
+        bucket.reserve()
+        bucket.reserve()
+
+        clock.now = 10
+
+        assert bucket.reserve() == 0.0
+        assert bucket.reserve() == 0.0
+        assert bucket.reserve() == 0.5
+
+
+class TestAdaptiveConcurrencyLimit(object):
+    def test_limit_grows_after_a_window_of_successes(self):
+        limit = under_test.AdaptiveConcurrencyLimit(initial=4)
+
+        for _ in range(4):
+            limit.release(limit.acquire(), throttled=False)
+        assert limit.limit == 4
+        limit.release(limit.acquire(), throttled=False)
+
+        assert limit.limit == 5
+
+    def test_limit_is_cut_once_per_throttled_window(self):
+        clock = FakeClock()
+        limit = under_test.AdaptiveConcurrencyLimit(initial=8, clock=clock)
+        started = [limit.acquire() for _ in range(3)]
+        clock.now = 1
+
+        for started_at in started:
+            limit.release(started_at, throttled=True)
+
+        assert limit.limit == 4
+        assert limit.in_flight == 0
+
+    def test_limit_stays_in_bounds(self):
+        limit = under_test.AdaptiveConcurrencyLimit(initial=2, minimum=1, maximum=2)
+
+        limit.release(limit.acquire(), throttled=True)
+        limit.release(limit.acquire(), throttled=True)
+        assert limit.limit == 1
+        for _ in range(10):
+            limit.release(limit.acquire(), throttled=False)
+        assert limit.limit == 2
+
+    def test_failures_leave_limit_unchanged(self):
+        limit = under_test.AdaptiveConcurrencyLimit(initial=3)
+
+        limit.release(limit.acquire(), throttled=None)
+
+        assert limit.limit == 3
+
+    def test_acquire_without_blocking_goes_over_limit(self):
+        limit = under_test.AdaptiveConcurrencyLimit(initial=1)
+
+        limit.acquire()
+        limit.acquire(blocking=False)
+
+        assert limit.in_flight == 2
+
+    def test_acquire_waits_for_release(self):
+        limit = under_test.AdaptiveConcurrencyLimit(initial=1)
+        started_at = limit.acquire()
+        acquired = threading.Event()
+
+        def acquire():
+            limit.acquire()
+            acquired.set()
+
+        thread = threading.Thread(target=acquire)
+        thread.start()
+        assert not acquired.wait(0.05)
+        limit.release(started_at, throttled=False)
+        assert acquired.wait(5)
+        thread.join()
+
+
+class TestRateLimiter(object):
+    def test_requests_are_spaced_by_rate(self):
+        clock = FakeClock()
+        limiter = under_test.RateLimiter(rate=10, burst=1, clock=clock, sleep=clock.sleep)
+
+        for _ in range(3):
+            with limiter.limit("host") as permit:
+                permit.record(200)
+
+        assert clock.sleeps == pytest.approx([0.1, 0.1])
+
+    def test_retry_after_holds_back_requests_to_host(self):
+        clock = FakeClock()
+        limiter = under_test.RateLimiter(clock=clock, sleep=clock.sleep)
+
+        with limiter.limit("host") as permit:
+            permit.record(429, "2")
+        with limiter.limit("other_host") as permit:
+            permit.record(200)
+        with limiter.limit("host") as permit:
+            permit.record(200)
+
+        assert clock.sleeps == [2.0]
+
+    def test_stats(self):
+        limiter = under_test.RateLimiter(initial_concurrency=4)
+
+        with limiter.limit("host") as permit:
+            permit.record(503)
+        with limiter.limit("host"):
+            pass
+
+        assert limiter.stats() == [
+            under_test.RateLimiterStats(
+                host="host", concurrency_limit=2, in_flight=0, requests=2, throttled=1
+            )
+        ]
+
+    def test_nested_requests_of_a_thread_do_not_wait_for_it(self):
+        limiter = under_test.RateLimiter(initial_concurrency=1, max_concurrency=1)
+
+        with limiter.limit("host"):
+            with limiter.limit("host"):
+                assert limiter.stats()[0].in_flight == 2
+
+        assert limiter.stats()[0].in_flight == 0
+
+    def test_concurrency_is_shared_between_threads(self):
+        limiter = under_test.RateLimiter(initial_concurrency=2, max_concurrency=2)
+        lock = threading.Lock()
+        in_flight = [0]
+        peak = [0]
+
+        def request():
+            with limiter.limit("host") as permit:
+                with lock:
+                    in_flight[0] += 1
+                    peak[0] = max(peak[0], in_flight[0])
+                threading.Event().wait(0.01)
+                with lock:
+                    in_flight[0] -= 1
+                permit.record(200)
+
+        threads = [threading.Thread(target=request) for _ in range(8)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        assert peak[0] <= 2
+        assert limiter.stats()[0].requests == 8
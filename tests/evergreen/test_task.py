@@ -4,6 +4,7 @@ from unittest.mock import MagicMock
 
 import pytest
 
+from evergreen.config import DEFAULT_MAX_WORKERS
 from evergreen.task import (
     _EVG_DATE_FIELDS_IN_TASK,
     EVG_FAILED_STATUS,
@@ -183,6 +184,32 @@ class TestTask(object):
         log = task.stream_log("task_log")
         assert log == mock_api.stream_log.return_value
 
+    def test_stream_log_follow_running_task(self, sample_task):
+        sample_task["status"] = "started"
+        mock_api = MagicMock()
+        mock_api.task_by_id.return_value.is_completed.return_value = True
+        task = Task(sample_task, mock_api)
+
+        log = task.stream_log("task_log", follow=True, min_poll_interval=5)
+
+        assert log == mock_api.stream_log.return_value
+        args, kwargs = mock_api.stream_log.call_args
+        assert args == (task.log_map["task_log"],)
+        assert kwargs["follow"]
+        assert kwargs["min_poll_interval"] == 5
+        assert kwargs["is_completed"]()
+        mock_api.task_by_id.assert_called_once_with(
+            task.task_id, execution=task.execution, fields=["status"]
+        )
+
+    def test_stream_log_follow_completed_task(self, sample_task):
+        mock_api = MagicMock()
+        task = Task(sample_task, mock_api)
+
+        task.stream_log("task_log", follow=True)
+
+        mock_api.stream_log.assert_called_once_with(task.log_map["task_log"])
+
     def test_successful_task_is_not_undispatched(self, sample_task):
         sample_task["status"] = "success"
         task = Task(sample_task, None)
@@ -271,16 +298,36 @@ class TestTask(object):
 
     def test_get_execution_tasks(self, sample_task, sample_display_task):
         mock_api = MagicMock()
-        mock_api.task_by_id.return_value = Task(sample_task, mock_api)
+        mock_api.tasks_by_ids.return_value = [
+            Task(sample_task, mock_api) for _ in sample_display_task["execution_tasks"]
+        ]
 
         display_task = Task(sample_display_task, mock_api)
         execution_tasks = display_task.get_execution_tasks()
 
         assert len(execution_tasks) == len(sample_display_task["execution_tasks"])
+        mock_api.tasks_by_ids.assert_called_once_with(
+            sample_display_task["execution_tasks"],
+            fetch_all_executions=True,
+            max_workers=DEFAULT_MAX_WORKERS,
+        )
+
+    def test_get_execution_tasks_with_max_workers(self, sample_task, sample_display_task):
+        mock_api = MagicMock()
+        mock_api.tasks_by_ids.return_value = [Task(sample_task, mock_api)]
+
+        display_task = Task(sample_display_task, mock_api)
+        display_task.get_execution_tasks(max_workers=3)
+
+        mock_api.tasks_by_ids.assert_called_once_with(
+            sample_display_task["execution_tasks"], fetch_all_executions=True, max_workers=3
+        )
 
     def test_get_execution_tasks_with_filters(self, sample_task, sample_display_task):
         mock_api = MagicMock()
-        mock_api.task_by_id.return_value = Task(sample_task, mock_api)
+        mock_api.tasks_by_ids.return_value = [
+            Task(sample_task, mock_api) for _ in sample_display_task["execution_tasks"]
+        ]
         max_return = 2
         seen = 0
 
@@ -1,7 +1,12 @@
+import threading
 import time
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime, timedelta
 from unittest.mock import MagicMock
 
+import pytest
+from dateutil.parser import parse
+
 import evergreen.util as under_test
 
 
@@ -32,6 +37,37 @@ class TestParseEvergreenDateTime(object):
         assert isinstance(under_test.parse_evergreen_datetime("2019-02-13T14:55:37Z"), datetime)
 
 
+class TestParseIsoDatetime(object):
+    @pytest.mark.parametrize(
+        "evg_date",
+        [
+            "2019-02-13T14:55:37.000Z",
+            "2019-02-13T14:55:37.123456Z",
+            "2019-02-13T14:55:37Z",
+            "2019-03-10T02:43:49.330",
+            "2019-03-10T02:43:49",
+        ],
+    )
+    def test_matches_dateutil(self, evg_date):
+        parsed = under_test._parse_iso_datetime(evg_date)
+
+        assert parsed is not None
+        assert parsed == parse(evg_date)
+        assert parsed.utcoffset() == parse(evg_date).utcoffset()
+
+    @pytest.mark.parametrize(
+        "evg_date",
+        [
+            "2019-02-13T14:55:37.000+05:00",
+            "2019-02-13",
+            "Wed, 13 Feb 2019 14:55:37 GMT",
+        ],
+    )
+    def test_other_formats_are_left_to_dateutil(self, evg_date):
+        assert under_test._parse_iso_datetime(evg_date) is None
+        assert under_test.parse_evergreen_datetime(evg_date) == parse(evg_date)
+
+
 class TestFormatEvergreenDatetime(object):
     def test_date_is_formatted(self):
         now = datetime.now()
@@ -98,3 +134,103 @@ class TestIteratorByTimeWindow(object):
             under_test.iterate_by_time_window(iterator, before_time, after_time, "the_time")
         )
         assert (60 // 7) + 1 == len(items)
+
+
+class TestPrefetch(object):
+    def test_items_are_returned_in_order(self):
+        assert list(under_test.prefetch(iter(range(20)), 3)) == list(range(20))
+
+    def test_items_are_read_ahead(self):
+        read = []
+
+        def items():
+            for i in range(5):
+                read.append(i)
+                yield i
+
+        prefetched = under_test.prefetch(items(), 2)
+        assert next(prefetched) == 0
+
+        deadline = time.time() + 5
+        while len(read) < 3 and time.time() < deadline:
+            time.sleep(0.01)
+        # No more than `depth` items are read ahead of the consumer.
+        time.sleep(0.05)
+        assert read == [0, 1, 2]
+        assert list(prefetched) == [1, 2, 3, 4]
+
+    def test_exceptions_are_passed_to_consumer(self):
+        def items():
+            yield 1
+            raise ValueError("failed")
+
+        prefetched = under_test.prefetch(items(), 2)
+
+        assert next(prefetched) == 1
+        with pytest.raises(ValueError):
+            next(prefetched)
+
+    def test_producer_stops_when_consumer_stops(self):
+        def items():
+            i = 0
+            while True:
+                yield i
+                i += 1
+
+        prefetched = under_test.prefetch(items(), 2)
+        assert next(prefetched) == 0
+        prefetched.close()
+
+
+def _wait_for_waiters(single_flight, key, waiters):
+    deadline = time.time() + 5
+    while time.time() < deadline:
+        with single_flight._lock:
+            call = single_flight._calls.get(key)
+            if call is not None and call.waiters >= waiters:
+                return
+        time.sleep(0.01)
+    raise AssertionError("callers did not join the call in flight")
+
+
+class TestSingleFlight(object):
+    def test_concurrent_calls_are_shared(self):
+        single_flight = under_test.SingleFlight()
+        release = threading.Event()
+        fn = MagicMock(side_effect=lambda: release.wait() and "result")
+
+        with ThreadPoolExecutor(max_workers=3) as executor:
+            futures = [executor.submit(single_flight.do, "key", fn) for _ in range(3)]
+            _wait_for_waiters(single_flight, "key", 2)
+            release.set()
+            results = [future.result() for future in futures]
+
+        assert fn.call_count == 1
+        assert [result for result, _ in results] == ["result"] * 3
+        assert all(shared for _, shared in results)
+
+    def test_sequential_calls_are_not_shared(self):
+        single_flight = under_test.SingleFlight()
+        fn = MagicMock(return_value="result")
+
+        assert single_flight.do("key", fn) == ("result", False)
+        assert single_flight.do("key", fn) == ("result", False)
+        assert fn.call_count == 2
+
+    def test_exceptions_are_raised_to_all_callers(self):
+        single_flight = under_test.SingleFlight()
+        release = threading.Event()
+
+        def fn():
+            release.wait()
+            raise ValueError("failed")
+
+        with ThreadPoolExecutor(max_workers=2) as executor:
+            futures = [executor.submit(single_flight.do, "key", fn) for _ in range(2)]
+            _wait_for_waiters(single_flight, "key", 1)
+            release.set()
+            for future in futures:
+                with pytest.raises(ValueError):
+                    future.result()
+
+        assert single_flight._calls == {}
@@ -6,6 +6,7 @@ from unittest.mock import MagicMock
 
 import pytest
 
+from evergreen.download import ARTIFACT_TASK_FIELDS
 from evergreen.manifest import Manifest
 from evergreen.metrics.versionmetrics import VersionMetrics
 from evergreen.version import RecentVersions, Requester, Version
@@ -95,6 +96,21 @@ class TestVersion(object):
         version = Version(sample_version, mock_api)
         assert version.get_builds() == mock_api.builds_by_version.return_value
 
+    def test_download_artifacts(self, sample_version):
+        mock_api = MagicMock()
+        mock_build = MagicMock()
+        mock_build.get_tasks.return_value = ["task_1", "task_2"]
+        mock_api.builds_by_version.return_value = [mock_build, mock_build]
+        version = Version(sample_version, mock_api)
+
+        summary = version.download_artifacts("out", max_workers=3)
+
+        assert summary == mock_api.download_artifacts.return_value
+        tasks, directory = mock_api.download_artifacts.call_args[0]
+        assert list(tasks) == ["task_1", "task_2", "task_1", "task_2"]
+        mock_build.get_tasks.assert_called_with(fields=ARTIFACT_TASK_FIELDS)
+        assert mock_api.download_artifacts.call_args[1]["max_workers"] == 3
+
     def test_build_by_variant(self, sample_version):
         mock_api = MagicMock()
         version = Version(sample_version, mock_api)